@@ -0,0 +1,58 @@
+# core/archive.py
+"""
+Moving finished tasks out of the hot table (``archive_tasks``).
+
+A task is archivable once it was deleted, or completed, and has not
+changed for a while. Each chunk is one transaction: copy the rows into
+TaskArchive, then delete them from core_task. For completed (still live)
+tasks that is a write their users can see, so it goes through the same
+bookkeeping as a delete: a "deleted" change log entry and the counters.
+"""
+from django.db import transaction
+from django.db.models import Q
+
+from core.changes import record_task_changes
+from core.models import Task, TaskArchive
+from core.summary import record_task_counts, task_state
+
+
+def archivable_tasks(cutoff, completed=True):
+    """
+    Tasks deleted (and, with ``completed``, completed) and last updated
+    before ``cutoff``, deleted ones included.
+    """
+    finished = Q(is_deleted=True)
+    if completed:
+        finished |= Q(status="COMPLETED")
+
+    return Task.all_objects.filter(finished, updated_at__lt=cutoff)
+
+
+def archive_tasks(qs):
+    """
+    Move the tasks of ``qs`` into TaskArchive in one transaction. Returns
+    (deleted, completed): how many of each kind were moved.
+    """
+    with transaction.atomic():
+        # read inside the transaction: a task written since it was picked
+        # out may no longer qualify
+        tasks = list(qs.select_for_update().order_by("id"))
+        if not tasks:
+            return 0, 0
+
+        TaskArchive.objects.bulk_create([
+            TaskArchive(**{field: getattr(task, field) for field in TaskArchive.TASK_FIELDS})
+            for task in tasks
+        ])
+
+        live = [task for task in tasks if not task.is_deleted]
+        if live:
+            record_task_changes(
+                {task.id: (task.created_by_id, task.assigned_to_id) for task in live},
+                kind="deleted"
+            )
+            record_task_counts(before=[task_state(task) for task in live])
+
+        Task.all_objects.filter(id__in=[task.id for task in tasks]).delete()
+
+    return len(tasks) - len(live), len(live)
@@ -1,6 +1,353 @@
 # core/authentication.py
-from rest_framework.authentication import SessionAuthentication
+import time
+import uuid
 
-class CsrfExemptSessionAuthentication(SessionAuthentication):
+from django.contrib.auth import SESSION_KEY
+from django.core import signing
+from django.core.cache import caches
+from rest_framework.authentication import (
+    BaseAuthentication,
+    SessionAuthentication,
+    get_authorization_header,
+)
+from rest_framework.exceptions import AuthenticationFailed
+
+from core.config import (
+    AUTH_TOKEN_CACHE_ALIAS,
+    AUTH_TOKEN_MAX_AGE,
+    PRINCIPAL_CACHE_ALIAS,
+    PRINCIPAL_MAX_AGE,
+)
+
+PRINCIPAL_SESSION_KEY = "_core_principal"
+AUTH_TOKEN_SALT = "core.authentication.token"
+
+
+class Principal:
+    """
+    Lightweight stand-in for an authenticated ``User``.
+
+    Carries only what authorization and tenant scoping need, so it can be
+    rebuilt from the session on every request without touching the users
+    table. Code that needs the full row must load it explicitly.
+
+    Only active users get one, and a session's snapshot is trusted for at
+    most PRINCIPAL_MAX_AGE before the row is checked again.
+    """
+
+    is_authenticated = True
+    is_anonymous = False
+    is_active = True
+
+    def __init__(self, id, username, role, company_id, manager_id, is_staff=False):
+        self.id = id
+        self.username = username
+        self.role = role
+        self.company_id = company_id
+        self.manager_id = manager_id
+        self.is_staff = is_staff
+
+    @property
+    def pk(self):
+        return self.id
+
+    @classmethod
+    def from_user(cls, user):
+        return cls(
+            id=user.id,
+            username=user.username,
+            role=user.role,
+            company_id=user.company_id,
+            manager_id=user.manager_id,
+            is_staff=user.is_staff
+        )
+
+    @classmethod
+    def from_session(cls, data):
+        return cls(**{
+            key: value
+            for key, value in data.items()
+            if key not in ("version", "checked_at")
+        })
+
+    def as_dict(self):
+        return {
+            "id": self.id,
+            "username": self.username,
+            "role": self.role,
+            "company_id": self.company_id,
+            "manager_id": self.manager_id,
+            "is_staff": self.is_staff,
+        }
+
+    def __str__(self):
+        return self.username
+
+
+def _principal_version_key(user_id):
+    return f"core:principal:version:{user_id}"
+
+
+def get_principal_version(user_id):
+    cache = caches[PRINCIPAL_CACHE_ALIAS]
+    key = _principal_version_key(user_id)
+
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, None)
+        version = cache.get(key)
+
+    return version
+
+
+async def aget_principal_version(user_id):
+    cache = caches[PRINCIPAL_CACHE_ALIAS]
+    key = _principal_version_key(user_id)
+
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, uuid.uuid4().hex, None)
+        version = await cache.aget(key)
+
+    return version
+
+
+def invalidate_principal(user_id):
+    """
+    Make every session re-read this user from the database once.
+    """
+    caches[PRINCIPAL_CACHE_ALIAS].set(
+        _principal_version_key(user_id),
+        uuid.uuid4().hex,
+        None
+    )
+
+
+def remember_principal(request, user):
+    """
+    Store the identity of a freshly loaded ``user`` in the session.
+    """
+    request.session[PRINCIPAL_SESSION_KEY] = {
+        **Principal.from_user(user).as_dict(),
+        "version": get_principal_version(user.id),
+        "checked_at": time.time(),
+    }
+
+
+async def aremember_principal(request, user):
+    await request.session.aset(PRINCIPAL_SESSION_KEY, {
+        **Principal.from_user(user).as_dict(),
+        "version": await aget_principal_version(user.id),
+        "checked_at": time.time(),
+    })
+
+
+def is_principal_current(data, session_user_id, version):
+    """
+    Whether a session's principal snapshot may stand in for its user: it
+    belongs to the session's user, no save of the user bumped the version
+    since, and it is younger than PRINCIPAL_MAX_AGE. The age limit bounds
+    how long a change the version missed (an UPDATE bypassing the
+    signals, a lost cache entry) can go unnoticed.
+    """
+    return (
+        str(data["id"]) == str(session_user_id)
+        and data["version"] == version
+        and time.time() - data.get("checked_at", 0) < PRINCIPAL_MAX_AGE
+    )
+
+
+class CachedSessionAuthentication(SessionAuthentication):
+    """
+    Session authentication that reads the user's identity from the session.
+
+    The first request of a session loads the ``User`` as usual (including
+    Django's session hash and ``is_active`` checks) and stores a
+    ``Principal`` snapshot in the session. Later requests are served from
+    that snapshot until the user row changes, which bumps its version in
+    the shared PRINCIPAL_CACHE_ALIAS (see core.signals), or until the
+    snapshot is PRINCIPAL_MAX_AGE old; then the row is loaded again.
+    """
+
+    def authenticate(self, request):
+        session = request._request.session
+        data = session.get(PRINCIPAL_SESSION_KEY)
+
+        if data is not None and is_principal_current(
+            data,
+            session.get(SESSION_KEY),
+            get_principal_version(data["id"])
+        ):
+            self.enforce_csrf(request)
+            return (Principal.from_session(data), None)
+
+        result = super().authenticate(request)
+        if result is None:
+            return None
+
+        user = result[0]
+        remember_principal(request._request, user)
+        return (Principal.from_user(user), None)
+
+    async def aauthenticate(self, request):
+        """
+        Same as ``authenticate`` for async views, which get the plain
+        HttpRequest. Uses Django's async session and ``auser()`` APIs.
+        """
+        session = request.session
+        data = await session.aget(PRINCIPAL_SESSION_KEY)
+
+        if data is not None and is_principal_current(
+            data,
+            await session.aget(SESSION_KEY),
+            await aget_principal_version(data["id"])
+        ):
+            self.enforce_csrf(request)
+            return (Principal.from_session(data), None)
+
+        user = await request.auser()
+        if not user or not user.is_active:
+            return None
+
+        self.enforce_csrf(request)
+        await aremember_principal(request, user)
+        return (Principal.from_user(user), None)
+
+
+class CsrfExemptSessionAuthentication(CachedSessionAuthentication):
     def enforce_csrf(self, request):
         return  # completely disable CSRF check
+
+
+def issue_token(user):
+    """
+    Short-lived bearer token carrying the principal, signed with SECRET_KEY.
+    """
+    payload = {
+        **Principal.from_user(user).as_dict(),
+        "jti": uuid.uuid4().hex,
+        "iat": time.time(),
+    }
+    return signing.dumps(payload, salt=AUTH_TOKEN_SALT)
+
+
+def _revoked_token_key(jti):
+    return f"core:token:revoked:{jti}"
+
+
+def _revoked_user_key(user_id):
+    return f"core:token:revoked_before:{user_id}"
+
+
+def revoke_token(payload):
+    """
+    Revoke one token until it would have expired anyway.
+    """
+    caches[AUTH_TOKEN_CACHE_ALIAS].set(
+        _revoked_token_key(payload["jti"]),
+        True,
+        AUTH_TOKEN_MAX_AGE
+    )
+
+
+def revoke_user_tokens(user_id):
+    """
+    Revoke every token issued to ``user_id`` up to now.
+    """
+    caches[AUTH_TOKEN_CACHE_ALIAS].set(
+        _revoked_user_key(user_id),
+        time.time(),
+        AUTH_TOKEN_MAX_AGE
+    )
+
+
+def _revocation_keys(payload):
+    return [_revoked_token_key(payload["jti"]), _revoked_user_key(payload["id"])]
+
+
+def is_token_revoked(payload):
+    revoked = caches[AUTH_TOKEN_CACHE_ALIAS].get_many(_revocation_keys(payload))
+    return _is_revoked(payload, revoked)
+
+
+async def ais_token_revoked(payload):
+    revoked = await caches[AUTH_TOKEN_CACHE_ALIAS].aget_many(_revocation_keys(payload))
+    return _is_revoked(payload, revoked)
+
+
+def _is_revoked(payload, revoked):
+    if revoked.get(_revoked_token_key(payload["jti"])):
+        return True
+
+    revoked_before = revoked.get(_revoked_user_key(payload["id"]))
+    return revoked_before is not None and payload["iat"] <= revoked_before
+
+
+class SignedTokenAuthentication(BaseAuthentication):
+    """
+    Stateless ``Authorization: Bearer <token>`` authentication.
+
+    Tokens are verified with SECRET_KEY alone; the only other lookup is
+    the revocation list in the cache, so no database or session I/O
+    happens on the request path.
+    """
+
+    keyword = "Bearer"
+
+    def authenticate(self, request):
+        payload = self.decode(request)
+        if payload is None:
+            return None
+
+        if is_token_revoked(payload):
+            raise AuthenticationFailed("Token revoked")
+
+        return (self.principal(payload), payload)
+
+    async def aauthenticate(self, request):
+        payload = self.decode(request)
+        if payload is None:
+            return None
+
+        if await ais_token_revoked(payload):
+            raise AuthenticationFailed("Token revoked")
+
+        return (self.principal(payload), payload)
+
+    def decode(self, request):
+        """
+        Verified payload of the request's bearer token, or None when the
+        request carries no bearer token at all.
+        """
+        auth = get_authorization_header(request).split()
+
+        if not auth or auth[0].lower() != self.keyword.lower().encode():
+            return None
+
+        if len(auth) != 2:
+            raise AuthenticationFailed("Invalid token header")
+
+        try:
+            return signing.loads(
+                auth[1].decode(),
+                salt=AUTH_TOKEN_SALT,
+                max_age=AUTH_TOKEN_MAX_AGE
+            )
+        except signing.SignatureExpired:
+            raise AuthenticationFailed("Token expired")
+        except (signing.BadSignature, UnicodeDecodeError):
+            raise AuthenticationFailed("Invalid token")
+
+    @staticmethod
+    def principal(payload):
+        return Principal(
+            id=payload["id"],
+            username=payload["username"],
+            role=payload["role"],
+            company_id=payload["company_id"],
+            manager_id=payload["manager_id"],
+            is_staff=payload.get("is_staff", False)
+        )
+
+    def authenticate_header(self, request):
+        return self.keyword
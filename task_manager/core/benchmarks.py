@@ -0,0 +1,847 @@
+# core/benchmarks.py
+"""
+Latency benchmark harness for the core API.
+
+Seeds a synthetic tenant population, drives every route in core/urls.py
+through the Django test client and reports latency percentiles, queries
+per request and throughput as a JSON-serializable dict. Used by the
+``benchmark_api`` management command and by the test suite.
+
+``run_concurrency_benchmark`` drives the routes that have an async
+variant (core/views/task_async.py) through the ASGI request handler,
+many requests in flight at once, once per variant.
+
+``run_serialization_benchmark`` times one list page, fetch plus JSON
+encoding, through the model-instance/JSONRenderer path and through the
+values_list()/core.rendering path, at several page sizes.
+
+``run_write_stress`` hammers a file-backed SQLite database from many
+threads with write transactions, once with the bare connection settings
+and once with the tuned profile from settings.DATABASES, and reports
+committed writes per second and "database is locked" failures.
+
+``run_search_benchmark`` times search result pages through the FTS5
+index and through the icontains fallback for common, rare, prefix and
+multi-word queries.
+"""
+import asyncio
+import os
+import platform
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from itertools import accumulate, count
+
+import django
+from asgiref.sync import async_to_sync
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+from django.db import OperationalError, connection, connections, transaction
+from django.test import AsyncClient, Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+
+from core.config import TASK_SEARCH_PAGE_SIZE
+from core.jobs import enqueue
+from core.models import Company, Task, TaskChange, User
+from core.rendering import TASK_PAGE_ENCODER, TASK_ROW_COLUMNS, encode_task_page
+from core.search import ContainsSearchBackend, SQLiteFTSSearchBackend, search_terms
+from core.summary import record_task_counts, task_state
+from core.views.task import TaskListAPIView
+
+BENCHMARK_PASSWORD = "benchmark-password"
+
+# routes served by both a sync view and an async one under /async
+ASYNC_ROUTES = [
+    "tasks_list_manager",
+    "tasks_list_reportee",
+    "tasks_create",
+    "tasks_assign",
+    "tasks_status",
+    "tasks_self_status",
+]
+
+
+# words seeded task text is made of, most frequent first (Zipf-like),
+# plus a long tail of reference codes that each occur in a few tasks
+SEARCH_VOCABULARY = (
+    "login", "report", "invoice", "deploy", "database", "cache", "email",
+    "payment", "export", "dashboard", "billing", "upload", "profile",
+    "session", "timeout", "migration", "backup", "webhook", "permission",
+    "onboarding", "pipeline", "latency", "checkout", "refund", "analytics",
+    "calendar", "firmware", "localization", "sandbox", "telemetry",
+    "throttle", "keyboard", "quarantine", "zeppelin",
+)
+SEARCH_REFERENCE_CODES = 100_000
+_VOCABULARY_WEIGHTS = list(accumulate(1 / rank for rank in range(1, len(SEARCH_VOCABULARY) + 1)))
+
+
+def task_text(rng, number):
+    """
+    (title, description) of a seeded task: two vocabulary words in the
+    title, two more and four reference codes in the description.
+    """
+    words = rng.choices(SEARCH_VOCABULARY, cum_weights=_VOCABULARY_WEIGHTS, k=4)
+    codes = [f"ref{rng.randrange(SEARCH_REFERENCE_CODES)}" for _ in range(4)]
+    return f"Task {number} {words[0]} {words[1]}", " ".join(words[2:] + codes)
+
+
+@dataclass
+class Scale:
+    companies: int = 2
+    managers: int = 2      # per company
+    reportees: int = 5     # per manager
+    tasks: int = 100       # per manager
+
+
+@dataclass
+class Population:
+    managers: list = field(default_factory=list)
+    reportees: dict = field(default_factory=dict)   # manager id -> [User]
+    task_ids: dict = field(default_factory=dict)    # manager id -> [task id]
+
+
+def seed(scale, batch_size=1000):
+    """
+    Insert companies, managers, reportees and tasks with bulk_create.
+
+    Every user shares one password hash, so seeding does not pay the
+    hasher once per user while login still verifies a real hash.
+    """
+    password = make_password(BENCHMARK_PASSWORD)
+    run_id = f"{time.time_ns():x}"
+    rng = random.Random(0)
+    population = Population()
+
+    companies = Company.objects.bulk_create([
+        Company(name=f"bench-{run_id}-{c}") for c in range(scale.companies)
+    ])
+
+    managers = User.objects.bulk_create([
+        User(
+            username=f"bench-{run_id}-m{c}-{m}",
+            password=password,
+            role="MANAGER",
+            company=company
+        )
+        for c, company in enumerate(companies)
+        for m in range(scale.managers)
+    ], batch_size=batch_size)
+
+    reportees = User.objects.bulk_create([
+        User(
+            username=f"bench-{run_id}-r{manager.id}-{r}",
+            password=password,
+            role="REPORTEE",
+            company_id=manager.company_id,
+            manager=manager
+        )
+        for manager in managers
+        for r in range(scale.reportees)
+    ], batch_size=batch_size)
+
+    population.managers = managers
+    for reportee in reportees:
+        population.reportees.setdefault(reportee.manager_id, []).append(reportee)
+
+    for manager in managers:
+        team = population.reportees.get(manager.id, [None])
+        tasks = Task.objects.bulk_create([
+            Task(
+                title=title,
+                description=description,
+                assigned_to=team[t % len(team)],
+                created_by=manager,
+                company_id=manager.company_id
+            )
+            for t, (title, description) in (
+                (t, task_text(rng, t)) for t in range(scale.tasks)
+            )
+        ], batch_size=batch_size)
+        record_task_counts(after=[task_state(task) for task in tasks])
+        population.task_ids[manager.id] = [task.id for task in tasks]
+
+    return population
+
+
+def percentile(samples, pct):
+    """
+    Linear-interpolated percentile of an already sorted list.
+    """
+    if not samples:
+        return None
+
+    rank = (len(samples) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(samples) - 1)
+    return samples[low] + (samples[high] - samples[low]) * (rank - low)
+
+
+def summarize(method, latencies, queries, errors, elapsed):
+    """
+    Report row for one route; ``elapsed`` is the wall time of the run.
+    """
+    latencies = sorted(latencies)
+    requests = len(latencies)
+
+    return {
+        "method": method.upper(),
+        "requests": requests,
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "mean_ms": round(sum(latencies) / requests * 1000, 3),
+        "queries_per_request": round(queries / requests, 2),
+        "throughput_rps": round(requests / elapsed, 1) if elapsed else None,
+    }
+
+
+class ApiBenchmark:
+    """
+    One ``route_*`` method per route. Each does its untimed setup and
+    returns (client, method, path, payload, expected_status); only the
+    request itself is timed.
+    """
+
+    def __init__(self, population, seed=0):
+        self.population = population
+        self.random = random.Random(seed)
+        self.sequence = count()
+        self.clients = {}
+
+    def client_for(self, user):
+        if user.id not in self.clients:
+            client = Client()
+            client.force_login(user)
+            self.clients[user.id] = client
+        return self.clients[user.id]
+
+    def pick_manager(self):
+        return self.random.choice(self.population.managers)
+
+    def pick_reportee(self, manager):
+        return self.random.choice(self.population.reportees[manager.id])
+
+    def pick_task_ids(self, manager, k=1):
+        return self.random.sample(self.population.task_ids[manager.id], k)
+
+    def fresh_task(self, manager, assigned_to=None):
+        return Task.objects.create(
+            title="Benchmark task",
+            assigned_to=assigned_to,
+            created_by=manager,
+            company_id=manager.company_id
+        )
+
+    def route_auth_signup(self):
+        return (
+            Client(), "post", "/auth/signup",
+            {
+                "username": f"bench-signup-{time.time_ns():x}-{next(self.sequence)}",
+                "password": BENCHMARK_PASSWORD,
+                "company_name": f"bench-signup-co-{self.random.randrange(4)}",
+            },
+            201,
+        )
+
+    def route_auth_login(self):
+        manager = self.pick_manager()
+        return (
+            Client(), "post", "/auth/login",
+            {"username": manager.username, "password": BENCHMARK_PASSWORD},
+            200,
+        )
+
+    def route_auth_logout(self):
+        client = Client()
+        client.force_login(self.pick_manager())
+        return client, "post", "/auth/logout", None, 200
+
+    def route_auth_me(self):
+        return self.client_for(self.pick_manager()), "get", "/auth/me", None, 200
+
+    def route_users_reportees(self):
+        return (
+            self.client_for(self.pick_manager()), "post", "/users/reportees",
+            {
+                "username": f"bench-reportee-{time.time_ns():x}-{next(self.sequence)}",
+                "password": BENCHMARK_PASSWORD,
+            },
+            201,
+        )
+
+    def route_users_reportees_bulk(self):
+        batch = f"bench-reportees-{time.time_ns():x}-{next(self.sequence)}"
+        return (
+            self.client_for(self.pick_manager()), "post", "/users/reportees/bulk",
+            [{"username": f"{batch}-{i}", "password": BENCHMARK_PASSWORD} for i in range(10)],
+            201,
+        )
+
+    def route_tasks_list_manager(self):
+        return self.client_for(self.pick_manager()), "get", "/tasks", None, 200
+
+    def route_tasks_list_reportee(self):
+        reportee = self.pick_reportee(self.pick_manager())
+        return self.client_for(reportee), "get", "/tasks", None, 200
+
+    def route_tasks_list_deep_page(self):
+        manager = self.pick_manager()
+        pages = max(1, len(self.population.task_ids[manager.id]) // 10)
+        return (
+            self.client_for(manager), "get", f"/tasks?page={pages}", None, 200,
+        )
+
+    def route_tasks_changes(self):
+        manager = self.pick_manager()
+        return self.client_for(manager), "get", "/tasks/changes?since=0", None, 200
+
+    def route_tasks_summary(self):
+        return self.client_for(self.pick_manager()), "get", "/tasks/summary", None, 200
+
+    def route_tasks_search(self):
+        manager = self.pick_manager()
+        query = self.random.choice(SEARCH_VOCABULARY[:10])
+        return self.client_for(manager), "get", f"/tasks/search?q={query}", None, 200
+
+    def route_tasks_export(self):
+        return self.client_for(self.pick_manager()), "get", "/tasks/export", None, 200
+
+    def route_tasks_archive(self):
+        return self.client_for(self.pick_manager()), "get", "/tasks/archive", None, 200
+
+    def route_tasks_create(self):
+        manager = self.pick_manager()
+        return (
+            self.client_for(manager), "post", "/tasks/create",
+            {
+                "title": "Benchmark task",
+                "assigned_to_id": self.pick_reportee(manager).id,
+            },
+            201,
+        )
+
+    def route_tasks_bulk_create(self):
+        manager = self.pick_manager()
+        return (
+            self.client_for(manager), "post", "/tasks/bulk",
+            [
+                {
+                    "title": f"Benchmark task {i}",
+                    "assigned_to_id": self.pick_reportee(manager).id,
+                }
+                for i in range(10)
+            ],
+            201,
+        )
+
+    def route_tasks_assign(self):
+        manager = self.pick_manager()
+        (task_id,) = self.pick_task_ids(manager)
+        return (
+            self.client_for(manager), "patch", f"/tasks/{task_id}/assign",
+            {"assigned_to_id": self.pick_reportee(manager).id},
+            200,
+        )
+
+    def route_tasks_bulk_assign(self):
+        manager = self.pick_manager()
+        return (
+            self.client_for(manager), "patch", "/tasks/bulk/assign",
+            {
+                "task_ids": self.pick_task_ids(manager, k=10),
+                "assigned_to_id": self.pick_reportee(manager).id,
+            },
+            200,
+        )
+
+    def route_tasks_status(self):
+        manager = self.pick_manager()
+        (task_id,) = self.pick_task_ids(manager)
+        return (
+            self.client_for(manager), "patch", f"/tasks/{task_id}/status",
+            {"status": self.random.choice(["DEV", "TEST", "STUCK"])},
+            200,
+        )
+
+    def route_tasks_bulk_status(self):
+        manager = self.pick_manager()
+        return (
+            self.client_for(manager), "patch", "/tasks/bulk/status",
+            {
+                "task_ids": self.pick_task_ids(manager, k=10),
+                "status": self.random.choice(["DEV", "TEST", "STUCK"]),
+            },
+            200,
+        )
+
+    def route_tasks_self_status(self):
+        manager = self.pick_manager()
+        reportee = self.pick_reportee(manager)
+        task = self.fresh_task(manager, assigned_to=reportee)
+        return (
+            self.client_for(reportee), "patch", f"/tasks/{task.id}/self",
+            {"status": "COMPLETED"},
+            200,
+        )
+
+    def route_tasks_delete(self):
+        manager = self.pick_manager()
+        task = self.fresh_task(manager)
+        return (
+            self.client_for(manager), "delete", f"/tasks/{task.id}", None, 200,
+        )
+
+    def route_jobs_tasks_assign(self):
+        manager = self.pick_manager()
+        return (
+            self.client_for(manager), "post", "/jobs/tasks/assign",
+            {
+                "task_ids": self.pick_task_ids(manager, k=10),
+                "assigned_to_id": self.pick_reportee(manager).id,
+            },
+            202,
+        )
+
+    def route_jobs_reportees_offboard(self):
+        # only queued: the population's reportees stay active
+        manager = self.pick_manager()
+        return (
+            self.client_for(manager), "post",
+            f"/jobs/reportees/{self.pick_reportee(manager).id}/offboard", None, 202,
+        )
+
+    def route_jobs_status(self):
+        manager = self.pick_manager()
+        job, _ = enqueue("tasks.bulk_assign", {"task_ids": [], "assigned_to_id": None}, manager)
+        return self.client_for(manager), "get", f"/jobs/{job.id}", None, 200
+
+    def route_metrics_routes(self):
+        if not hasattr(self, "staff"):
+            self.staff = User.objects.create_user(
+                username=f"bench-staff-{time.time_ns():x}",
+                password=BENCHMARK_PASSWORD,
+                role="MANAGER",
+                company=self.population.managers[0].company,
+                is_staff=True
+            )
+        return self.client_for(self.staff), "get", "/metrics/routes", None, 200
+
+    def route_free_resource(self):
+        return Client(), "get", "/free-resource", None, 200
+
+    @classmethod
+    def available_routes(cls):
+        return [
+            name[len("route_"):]
+            for name in vars(cls)
+            if name.startswith("route_")
+        ]
+
+    def measure(self, route, requests):
+        prepare = getattr(self, f"route_{route}")
+        latencies = []
+        queries = 0
+        errors = 0
+
+        for _ in range(requests):
+            client, method, path, payload, expected_status = prepare()
+
+            with CaptureQueriesContext(connection) as captured:
+                start = time.perf_counter()
+                response = getattr(client, method)(
+                    path,
+                    {} if payload is None else payload,
+                    content_type="application/json"
+                )
+                if response.streaming:
+                    b"".join(response.streaming_content)
+                latencies.append(time.perf_counter() - start)
+
+            queries += len(captured.captured_queries)
+            if response.status_code != expected_status:
+                errors += 1
+
+        return summarize(method, latencies, queries, errors, sum(latencies))
+
+    def measure_concurrent(self, route, requests, concurrency, prefix=""):
+        """
+        Time ``requests`` calls with up to ``concurrency`` in flight,
+        through Django's async request handler. ``prefix="/async"`` targets
+        the async variant of the route.
+        """
+        prepared = [getattr(self, f"route_{route}")() for _ in range(requests)]
+
+        # The test client runs every in-flight request's ORM calls on this
+        # thread's connection, so per-request counts from the
+        # instrumentation middleware would overlap. Count the whole run.
+        middleware = [
+            name for name in settings.MIDDLEWARE
+            if name != "core.middleware.QueryInstrumentationMiddleware"
+        ]
+        with override_settings(MIDDLEWARE=middleware), \
+                CaptureQueriesContext(connection) as captured:
+            elapsed, results = async_to_sync(self.drive)(prepared, concurrency, prefix)
+
+        latencies = [latency for latency, _ in results]
+        errors = sum(
+            response.status_code != expected_status
+            for (*_, expected_status), (_, response) in zip(prepared, results)
+        )
+
+        return {
+            **summarize(
+                prepared[0][1],
+                latencies,
+                len(captured.captured_queries),
+                errors,
+                elapsed
+            ),
+            "concurrency": concurrency,
+        }
+
+    async def drive(self, prepared, concurrency, prefix):
+        slots = asyncio.Semaphore(concurrency)
+
+        async def send(client, method, path, payload, expected_status):
+            async_client = AsyncClient()
+            async_client.cookies = client.cookies
+
+            async with slots:
+                start = time.perf_counter()
+                response = await getattr(async_client, method)(
+                    prefix + path,
+                    {} if payload is None else payload,
+                    content_type="application/json"
+                )
+                return time.perf_counter() - start, response
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(send(*request) for request in prepared))
+        return time.perf_counter() - started, results
+
+
+def unthrottled_rates():
+    """
+    Every configured throttle scope with an effectively unlimited rate.
+    """
+    return {scope: "1000000/s" for scope in api_settings.DEFAULT_THROTTLE_RATES}
+
+
+def run_benchmark(scale=None, requests=50, routes=None, seed_value=0):
+    """
+    Seed ``scale`` and time ``requests`` calls to every route.
+
+    Expects to run against a throwaway database; throttling is lifted for
+    the duration of the run.
+    """
+    scale = scale or Scale()
+    routes = routes or ApiBenchmark.available_routes()
+
+    started = time.perf_counter()
+    population = seed(scale)
+    seed_seconds = time.perf_counter() - started
+
+    rest_framework = {
+        **settings.REST_FRAMEWORK,
+        "DEFAULT_THROTTLE_RATES": unthrottled_rates(),
+    }
+
+    with override_settings(REST_FRAMEWORK=rest_framework):
+        bench = ApiBenchmark(population, seed=seed_value)
+        results = {route: bench.measure(route, requests) for route in routes}
+
+    return {
+        "meta": run_metadata(scale, requests, seed_seconds),
+        "routes": results,
+    }
+
+
+def run_concurrency_benchmark(scale=None, requests=50, concurrency=10,
+                              routes=None, seed_value=0):
+    """
+    Compare the sync and async variant of every route in ASYNC_ROUTES
+    under ``concurrency`` simultaneous requests.
+    """
+    scale = scale or Scale()
+    routes = routes or ASYNC_ROUTES
+
+    started = time.perf_counter()
+    population = seed(scale)
+    seed_seconds = time.perf_counter() - started
+
+    rest_framework = {
+        **settings.REST_FRAMEWORK,
+        "DEFAULT_THROTTLE_RATES": unthrottled_rates(),
+    }
+
+    with override_settings(REST_FRAMEWORK=rest_framework):
+        bench = ApiBenchmark(population, seed=seed_value)
+        results = {
+            route: {
+                "sync": bench.measure_concurrent(route, requests, concurrency),
+                "async": bench.measure_concurrent(
+                    route, requests, concurrency, prefix="/async"
+                ),
+            }
+            for route in routes
+        }
+
+    return {
+        "meta": {
+            **run_metadata(scale, requests, seed_seconds),
+            "concurrency": concurrency,
+        },
+        "routes": results,
+    }
+
+
+def time_page(build, repeat):
+    """
+    Median seconds of ``build()`` over ``repeat`` runs.
+    """
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        build()
+        samples.append(time.perf_counter() - started)
+
+    return percentile(sorted(samples), 50)
+
+
+def run_serialization_benchmark(page_sizes=(10, 100, 1000), repeat=50):
+    """
+    Per-row cost of building a list page the old way (Task instances,
+    serialize_task() dicts, JSONRenderer) against the fast path
+    (values_list() tuples, encode_task_page()).
+    """
+    scale = Scale(companies=1, managers=1, reportees=3, tasks=max(page_sizes))
+
+    started = time.perf_counter()
+    population = seed(scale)
+    seed_seconds = time.perf_counter() - started
+
+    qs = Task.objects.for_user(population.managers[0]).order_by("-created_at", "-id")
+    renderer = JSONRenderer()
+
+    def model_page(size):
+        tasks = list(qs[:size])
+        return renderer.render({
+            "page_size": size,
+            "next_cursor": None,
+            "tasks": [TaskListAPIView.serialize_task(task) for task in tasks],
+        })
+
+    def row_page(size):
+        rows = list(qs.values_list(*TASK_ROW_COLUMNS)[:size])
+        return encode_task_page({"page_size": size, "next_cursor": None}, rows)
+
+    results = {}
+    for size in page_sizes:
+        if model_page(size) != row_page(size):
+            raise AssertionError(f"fast path output differs at {size} rows")
+
+        model_seconds = time_page(lambda: model_page(size), repeat)
+        row_seconds = time_page(lambda: row_page(size), repeat)
+        results[size] = {
+            "model_us_per_row": round(model_seconds / size * 1e6, 3),
+            "values_us_per_row": round(row_seconds / size * 1e6, 3),
+            "speedup": round(model_seconds / row_seconds, 2),
+        }
+
+    return {
+        "meta": {
+            **run_metadata(scale, repeat, seed_seconds),
+            "encoder": TASK_PAGE_ENCODER,
+        },
+        "page_sizes": results,
+    }
+
+
+def search_queries():
+    """
+    Query shapes the search benchmark times, by name.
+    """
+    return {
+        "common": SEARCH_VOCABULARY[0],
+        "uncommon": SEARCH_VOCABULARY[-1],
+        "rare": f"ref{SEARCH_REFERENCE_CODES // 2}",
+        "prefix": SEARCH_VOCABULARY[1][:3],
+        "two_words": f"{SEARCH_VOCABULARY[2]} {SEARCH_VOCABULARY[7]}",
+    }
+
+
+def run_search_benchmark(scale=None, repeat=50):
+    """
+    Median time to the first result page of each search_queries() shape,
+    for the first seeded manager, through the FTS5 index and through the
+    icontains scan. Seeding time includes the index triggers.
+    """
+    scale = scale or Scale()
+
+    started = time.perf_counter()
+    population = seed(scale)
+    seed_seconds = time.perf_counter() - started
+
+    manager = population.managers[0]
+    qs = Task.objects.for_user(manager)
+    backends = {"fts": SQLiteFTSSearchBackend(), "contains": ContainsSearchBackend()}
+
+    def first_page(backend, terms):
+        results = backend.search(qs, terms, manager.company_id)
+        return list(results.values_list(*TASK_ROW_COLUMNS, "search_rank")[:TASK_SEARCH_PAGE_SIZE + 1])
+
+    results = {}
+    for name, query in search_queries().items():
+        terms = search_terms(query)
+        timings = {
+            f"{label}_ms": round(time_page(lambda: first_page(backend, terms), repeat) * 1000, 3)
+            for label, backend in backends.items()
+        }
+        results[name] = {
+            "query": query,
+            "matches": backends["fts"].search(qs, terms, manager.company_id).count(),
+            **timings,
+            "speedup": round(timings["contains_ms"] / timings["fts_ms"], 2),
+        }
+
+    return {
+        "meta": {
+            **run_metadata(scale, repeat, seed_seconds),
+            "manager_tasks": qs.count(),
+            "page_size": TASK_SEARCH_PAGE_SIZE,
+        },
+        "queries": results,
+    }
+
+
+# connection settings the stress test compares; "tuned" is whatever
+# settings.DATABASES["default"] configures
+STRESS_PROFILES = {
+    "bare": {"PRAGMAS": {}, "CONN_MAX_AGE": 0, "CONN_HEALTH_CHECKS": False, "OPTIONS": {}},
+    "tuned": {},
+}
+
+
+def stress_profile(profile, threads, writes):
+    """
+    ``threads`` workers each commit ``writes`` transactions against a fresh
+    database, alternating a task insert (with its change log row) and a
+    read-then-update of a task, the shapes of the create and status views.
+    """
+    alias = f"stress_{profile}"
+
+    with tempfile.TemporaryDirectory() as directory:
+        connections.settings[alias] = {
+            **connections.settings["default"],
+            "NAME": os.path.join(directory, "stress.sqlite3"),
+            **STRESS_PROFILES[profile],
+        }
+
+        try:
+            call_command("migrate", database=alias, verbosity=0, interactive=False)
+            company = Company.objects.using(alias).create(name="stress")
+            manager = User.objects.using(alias).create(
+                username="stress-manager",
+                role="MANAGER",
+                company=company
+            )
+            first_task = Task.objects.using(alias).create(
+                title="Stress task",
+                created_by=manager,
+                company=company
+            )
+            connections[alias].close()
+
+            latencies = []
+            errors = []
+            start = threading.Barrier(threads)
+
+            def work(worker):
+                try:
+                    start.wait()
+                    for i in range(writes):
+                        started = time.perf_counter()
+                        try:
+                            with transaction.atomic(using=alias):
+                                if i % 2:
+                                    task = Task.objects.using(alias).get(id=first_task.id)
+                                    task.status = ("DEV", "TEST")[i // 2 % 2]
+                                    task.save(update_fields=["status", "updated_at"])
+                                else:
+                                    task = Task.objects.using(alias).create(
+                                        title=f"Stress {worker}-{i}",
+                                        created_by_id=manager.id,
+                                        company_id=company.id
+                                    )
+                                    TaskChange.objects.using(alias).create(
+                                        task=task,
+                                        user_id=manager.id,
+                                        kind="created"
+                                    )
+                        except OperationalError:
+                            errors.append(worker)
+                        else:
+                            latencies.append(time.perf_counter() - started)
+                finally:
+                    connections[alias].close()
+
+            workers = [threading.Thread(target=work, args=(n,)) for n in range(threads)]
+            started = time.perf_counter()
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            elapsed = time.perf_counter() - started
+        finally:
+            connections[alias].close()
+            del connections.settings[alias]
+
+    latencies.sort()
+    return {
+        "writes": len(latencies),
+        "errors": len(errors),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3) if latencies else None,
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3) if latencies else None,
+        "writes_per_second": round(len(latencies) / elapsed, 1),
+    }
+
+
+def run_write_stress(threads=8, writes=50, profiles=("bare", "tuned")):
+    """
+    Before/after comparison of the SQLite connection profile under
+    concurrent writes.
+    """
+    return {
+        "meta": {
+            "generated_at": timezone.now().isoformat(),
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "threads": threads,
+            "writes_per_thread": writes,
+        },
+        "profiles": {
+            profile: stress_profile(profile, threads, writes)
+            for profile in profiles
+        },
+    }
+
+
+def run_metadata(scale, requests, seed_seconds):
+    return {
+        "generated_at": timezone.now().isoformat(),
+        "python": platform.python_version(),
+        "django": django.get_version(),
+        "database": connection.vendor,
+        "scale": vars(scale),
+        "requests_per_route": requests,
+        "seed_seconds": round(seed_seconds, 3),
+    }
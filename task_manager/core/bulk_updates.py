@@ -0,0 +1,65 @@
+# core/bulk_updates.py
+"""
+Updating many of a manager's tasks at once, for tasks/bulk/assign,
+tasks/bulk/status and the background jobs in core/jobs.py.
+"""
+from django.db import transaction
+from django.utils import timezone
+
+from core.changes import record_task_changes
+from core.models import Task
+from core.summary import record_task_counts
+
+
+def bulk_update_owned_tasks(manager, task_ids, **changes):
+    """
+    Apply ``changes`` to every live task in ``task_ids`` created by
+    ``manager`` in their company, with a single UPDATE.
+
+    Returns (updated_ids, skipped_ids); ids that do not exist or belong to
+    someone else are skipped.
+    """
+    task_ids = list(dict.fromkeys(task_ids))
+
+    owned = Task.objects.filter(
+        id__in=task_ids,
+        created_by_id=manager.id,
+        company_id=manager.company_id
+    )
+
+    with transaction.atomic():
+        found = {
+            task_id: (assigned_to_id, task_status)
+            for task_id, assigned_to_id, task_status in
+            owned.select_for_update().values_list("id", "assigned_to_id", "status")
+        }
+        owned.update(updated_at=timezone.now(), **changes)
+
+        record_task_changes(
+            {
+                task_id: (manager.id, changes.get("assigned_to_id"), previous_assignee_id)
+                for task_id, (previous_assignee_id, _) in found.items()
+            },
+            kind="assigned" if "assigned_to_id" in changes else "status"
+        )
+        record_task_counts(
+            before=[
+                (manager.company_id, manager.id, assigned_to_id, task_status, False)
+                for assigned_to_id, task_status in found.values()
+            ],
+            after=[
+                (
+                    manager.company_id,
+                    manager.id,
+                    changes.get("assigned_to_id", assigned_to_id),
+                    changes.get("status", task_status),
+                    False
+                )
+                for assigned_to_id, task_status in found.values()
+            ]
+        )
+
+    updated_ids = [task_id for task_id in task_ids if task_id in found]
+    skipped_ids = [task_id for task_id in task_ids if task_id not in found]
+
+    return updated_ids, skipped_ids
@@ -0,0 +1,133 @@
+# core/cache.py
+import hashlib
+import time
+import uuid
+
+from django.core.cache import caches
+from django.db import transaction
+
+from core.config import REPLICA_STICKY_SECONDS, TASK_LIST_CACHE_ALIAS, TASK_LIST_CACHE_TIMEOUT
+from core.routers import is_reading_from_replica
+
+
+def _cache():
+    return caches[TASK_LIST_CACHE_ALIAS]
+
+
+def _version_key(user_id):
+    return f"core:task_list:version:{user_id}"
+
+
+def _new_version():
+    return f"{int(time.time())}.{uuid.uuid4().hex}"
+
+
+def get_task_list_version(user_id):
+    """
+    Current cache version of a user's task list.
+
+    Versions are random tokens rather than counters, so a version key that
+    was evicted can never come back with a value older entries were stored
+    under. Each token starts with the unix time it was issued at.
+    """
+    cache = _cache()
+    key = _version_key(user_id)
+
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, _new_version(), None)
+        version = cache.get(key)
+
+    return version
+
+
+async def aget_task_list_version(user_id):
+    """
+    Async variant of get_task_list_version.
+    """
+    cache = _cache()
+    key = _version_key(user_id)
+
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, _new_version(), None)
+        version = await cache.aget(key)
+
+    return version
+
+
+def task_list_changed_at(version):
+    """
+    Unix time of the last write that touched the list, or later if the
+    version was (re)issued since. Never earlier, which makes it safe as a
+    floor for Last-Modified.
+    """
+    return int(version.split(".", 1)[0])
+
+
+def may_cache_task_list(version):
+    """
+    Whether a task list read in the current scope may be cached under
+    ``version``.
+
+    Not when it came from a replica within REPLICA_STICKY_SECONDS of the
+    write that issued the version: the replica may still lag behind that
+    write, and its rows would stay cached under the new version. Versions
+    carry whole seconds, hence the extra one.
+    """
+    if not is_reading_from_replica():
+        return True
+
+    return time.time() >= task_list_changed_at(version) + 1 + REPLICA_STICKY_SECONDS
+
+
+def task_list_cache_key(user, version, query_params):
+    """
+    Take the version once per request and reuse the key for both the
+    lookup and the store: re-reading the version in between could file
+    pre-write rows under a post-write version.
+    """
+    params = "&".join(
+        f"{name}={value}"
+        for name in sorted(query_params)
+        for value in query_params.getlist(name)
+    )
+    digest = hashlib.md5(params.encode()).hexdigest()
+
+    return f"core:task_page:{user.id}:{user.role}:{version}:{digest}"
+
+
+def get_cached_task_list(cache_key):
+    return _cache().get(cache_key)
+
+
+def set_cached_task_list(cache_key, data):
+    _cache().set(cache_key, data, TASK_LIST_CACHE_TIMEOUT)
+
+
+async def aget_cached_task_list(cache_key):
+    return await _cache().aget(cache_key)
+
+
+async def aset_cached_task_list(cache_key, data):
+    await _cache().aset(cache_key, data, TASK_LIST_CACHE_TIMEOUT)
+
+
+def invalidate_task_lists(*user_ids):
+    """
+    Drop every cached task list page of the given users.
+
+    Runs after the surrounding transaction commits, so a concurrent read
+    cannot re-cache rows from before the write under the new version.
+    """
+    user_ids = {user_id for user_id in user_ids if user_id is not None}
+
+    def bump():
+        _cache().set_many(
+            {_version_key(user_id): _new_version() for user_id in user_ids},
+            None
+        )
+
+    if user_ids:
+        transaction.on_commit(bump)
+
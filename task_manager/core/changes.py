@@ -0,0 +1,80 @@
+# core/changes.py
+from django.db import transaction
+from django.db.models import Max
+
+from core.cache import invalidate_task_lists
+from core.config import TASK_CHANGES_PAGE_SIZE
+from core.events import get_event_backend
+from core.models import Task, TaskChange
+from core.routers import pin_to_primary
+
+
+class ChangeLogExpired(Exception):
+    """
+    The requested position was pruned from the log; a full sync is needed.
+    """
+
+
+def record_task_changes(changes, kind):
+    """
+    Record that tasks were written, for every user who can see the change.
+
+    ``changes`` maps task id -> ids of the affected users (creator, current
+    and previous assignee; None is ignored); ``kind`` is one of
+    TaskChange.KIND_CHOICES. Appends the TaskChange rows that delta sync
+    and the event stream read, pins the users' reads to the primary for a
+    while, and once the transaction commits drops the users' cached task
+    lists and wakes their event streams.
+
+    Call it inside the transaction that makes the write, so the log and
+    the tasks can never disagree.
+    """
+    rows = [
+        TaskChange(task_id=task_id, user_id=user_id, kind=kind)
+        for task_id, user_ids in changes.items()
+        for user_id in dict.fromkeys(user_ids)
+        if user_id is not None
+    ]
+
+    TaskChange.objects.bulk_create(rows)
+
+    user_ids = {row.user_id for row in rows}
+    invalidate_task_lists(*user_ids)
+    pin_to_primary(*user_ids)
+    if user_ids:
+        transaction.on_commit(lambda: get_event_backend().publish(user_ids))
+
+
+def latest_change_id():
+    return TaskChange.objects.aggregate(latest=Max("id"))["latest"] or 0
+
+
+def changes_since(user, since, limit=TASK_CHANGES_PAGE_SIZE):
+    """
+    The user's log entries after ``since``, oldest first, at most ``limit``.
+
+    Returns (entries, live, has_more): ``entries`` are (id, task_id, kind)
+    tuples and ``live`` maps the ids of those tasks still visible to the
+    user to the Task; the others were deleted or left the user's scope.
+    Raises ChangeLogExpired when entries after ``since`` were pruned.
+    """
+    # prune_task_changes deletes a prefix of the log and always keeps the
+    # newest row, so a gap before the oldest row means lost changes
+    oldest = TaskChange.objects.order_by("id").values_list("id", flat=True).first()
+    if oldest is not None and since < oldest - 1:
+        raise ChangeLogExpired()
+
+    # NOTE: assumes log ids become visible in id order, which holds on
+    # SQLite (one writer at a time)
+    entries = list(
+        TaskChange.objects
+        .filter(user_id=user.id, id__gt=since)
+        .order_by("id")
+        .values_list("id", "task_id", "kind")[:limit + 1]
+    )
+    has_more = len(entries) > limit
+    entries = entries[:limit]
+
+    live = Task.objects.for_user(user).in_bulk({task_id for _, task_id, _ in entries})
+
+    return entries, live, has_more
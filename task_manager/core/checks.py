@@ -0,0 +1,78 @@
+# core/checks.py
+"""
+System checks for state every process must see the same way.
+
+Ending a session, revoking a token, enforcing a rate limit, pinning a
+writer's reads to the primary or waking another process's event streams
+only works when the web workers and ``run_jobs`` read the same cache
+entries. A per-process backend keeps
+each write in the process that made it, so commands that run the system
+checks (runserver, migrate, check) refuse to start with one configured
+for these aliases.
+"""
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+from core.config import (
+    AUTH_TOKEN_CACHE_ALIAS,
+    EVENT_BACKEND,
+    EVENT_BACKEND_OPTIONS,
+    PRINCIPAL_CACHE_ALIAS,
+    REPLICA_PIN_CACHE_ALIAS,
+    THROTTLE_BACKEND,
+    THROTTLE_BACKEND_OPTIONS,
+)
+
+# backends whose entries no other process can read
+PER_PROCESS_CACHE_BACKENDS = {
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+}
+
+
+def shared_cache_aliases():
+    """
+    (config name, cache alias) of every cache that must be shared.
+    """
+    aliases = [
+        ("PRINCIPAL_CACHE_ALIAS", PRINCIPAL_CACHE_ALIAS),
+        ("AUTH_TOKEN_CACHE_ALIAS", AUTH_TOKEN_CACHE_ALIAS),
+    ]
+
+    # a write on one worker must pin the reads the next worker serves
+    if settings.READ_REPLICAS:
+        aliases.append(("REPLICA_PIN_CACHE_ALIAS", REPLICA_PIN_CACHE_ALIAS))
+
+    # rate limits only hold across workers that count in one place
+    if THROTTLE_BACKEND == "core.throttles.CacheThrottleBackend":
+        aliases.append(("THROTTLE_BACKEND_OPTIONS", THROTTLE_BACKEND_OPTIONS.get("alias", "default")))
+
+    # events published by one process must reach the streams of another
+    if EVENT_BACKEND == "core.events.SharedCacheEventBackend":
+        aliases.append(("EVENT_BACKEND_OPTIONS", EVENT_BACKEND_OPTIONS.get("alias", "shared")))
+
+    return aliases
+
+
+@register(Tags.caches, Tags.security)
+def check_shared_caches(app_configs, **kwargs):
+    errors = []
+
+    for name, alias in shared_cache_aliases():
+        config = settings.CACHES.get(alias)
+
+        if config is None:
+            errors.append(Error(
+                f"{name} names the cache {alias!r}, which is not in settings.CACHES.",
+                id="core.E001",
+            ))
+        elif config["BACKEND"] in PER_PROCESS_CACHE_BACKENDS:
+            errors.append(Error(
+                f"{name} points at the cache {alias!r}, whose backend "
+                f"{config['BACKEND']} is not shared between processes.",
+                hint="Use a cache every worker reaches: file-based on a "
+                     "single host, Redis or Memcached across hosts.",
+                id="core.E002",
+            ))
+
+    return errors
@@ -1,10 +1,143 @@
+from importlib.util import find_spec
+from pathlib import Path
+
 # Pagination
 TASK_LIST_PAGINATION_SIZE = 10
 
 
+# SQLite PRAGMAs run on every new connection (core.signals); WAL lets
+# readers run alongside the single writer, busy_timeout makes writers wait
+# for the lock instead of failing with "database is locked"
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "busy_timeout": 5000,            # milliseconds
+    "synchronous": "NORMAL",         # durable in WAL mode except on power loss
+    "mmap_size": 256 * 1024 * 1024,  # bytes
+}
+
+
+# Password hashing (core/hashers.py): the profile hashing new passwords
+# ("argon2" needs argon2-cffi, "scrypt" is in the standard library), the
+# hasher of each profile, their costs, and the per-process pool every hash
+# runs on (threads, hashes allowed to wait for one before a 503)
+PASSWORD_HASHING_PROFILE = "argon2" if find_spec("argon2") else "scrypt"
+PASSWORD_HASHING_PROFILES = {
+    "argon2": "core.hashers.TunedArgon2PasswordHasher",
+    "scrypt": "core.hashers.TunedScryptPasswordHasher",
+    "pbkdf2": "core.hashers.BoundedPBKDF2PasswordHasher",
+}
+ARGON2_TIME_COST = 2
+ARGON2_MEMORY_COST = 19 * 1024   # KiB
+ARGON2_PARALLELISM = 1
+SCRYPT_WORK_FACTOR = 2 ** 15     # 32 MiB with a block size of 8
+SCRYPT_BLOCK_SIZE = 8
+SCRYPT_PARALLELISM = 1
+PASSWORD_HASH_WORKERS = 2
+PASSWORD_HASH_MAX_PENDING = 32
+
+
+# Reportee provisioning: rows per POST users/reportees/bulk; rows per
+# import_reportees chunk (one username query and one transaction each)
+# and the processes hashing its passwords
+REPORTEE_BULK_MAX_SIZE = 100
+REPORTEE_IMPORT_CHUNK_SIZE = 2000
+REPORTEE_IMPORT_WORKERS = 4
+
+
+# Identity cache: alias from settings.CACHES (shared by every process,
+# see core/checks.py) and how long a session's principal snapshot is
+# trusted before the user row is read again (seconds)
+PRINCIPAL_CACHE_ALIAS = "shared"
+PRINCIPAL_MAX_AGE = 60
+
+
+# Bearer tokens (revocation list lives in this cache alias, shared by
+# every process, see core/checks.py)
+AUTH_TOKEN_MAX_AGE = 15 * 60  # seconds
+AUTH_TOKEN_CACHE_ALIAS = "shared"
+
+
+# Task list cache (alias from settings.CACHES)
+TASK_LIST_CACHE_ALIAS = "default"
+TASK_LIST_CACHE_TIMEOUT = 5 * 60  # seconds
+
+
+# Bulk task operations
+TASK_BULK_MAX_SIZE = 500
+
+
+# Background jobs (run_jobs worker): pool size, idle poll interval,
+# attempts per job, retry backoff (doubling from the base, capped) and how
+# long a claimed job may run before another worker takes it over (seconds)
+JOB_WORKERS = 4
+JOB_POLL_SECONDS = 1.0
+JOB_MAX_ATTEMPTS = 5
+JOB_RETRY_BASE_SECONDS = 10
+JOB_RETRY_MAX_SECONDS = 15 * 60
+JOB_LEASE_SECONDS = 30 * 60
+JOB_BULK_ASSIGN_MAX_SIZE = 100_000   # task ids per background bulk assign
+
+
+# Delta sync (log rows read per GET tasks/changes; prune_task_changes default)
+TASK_CHANGES_PAGE_SIZE = 500
+TASK_CHANGES_RETENTION_DAYS = 30
+
+
+# Task archive: archive_tasks default age (days since a deleted or
+# completed task last changed) and tasks moved per transaction
+TASK_ARCHIVE_AFTER_DAYS = 90
+TASK_ARCHIVE_CHUNK_SIZE = 1000
+
+
+# Task search: backend per database vendor (others get the fallback, an
+# unindexed icontains scan), results per page, words used from a query
+TASK_SEARCH_BACKENDS = {"sqlite": "core.search.SQLiteFTSSearchBackend"}
+TASK_SEARCH_FALLBACK_BACKEND = "core.search.ContainsSearchBackend"
+TASK_SEARCH_PAGE_SIZE = 20
+TASK_SEARCH_MAX_TERMS = 8
+
+
+# Server-sent events: pub/sub backend that wakes open streams, and stream
+# timings (seconds). "core.events.SharedCacheEventBackend" (alias option, a
+# cache shared by every process, see core/checks.py; poll_seconds) reaches
+# streams from any worker, run_jobs or command;
+# "core.events.LocalEventBackend" only from the serving process, so writes
+# made elsewhere wait for the next heartbeat
+EVENT_BACKEND = "core.events.SharedCacheEventBackend"
+EVENT_BACKEND_OPTIONS = {"alias": "shared", "poll_seconds": 0.5}
+SSE_HEARTBEAT_SECONDS = 15
+SSE_MAX_STREAM_SECONDS = 5 * 60   # clients reconnect with Last-Event-ID
+SSE_RETRY_MS = 3000
+
+
+# Read replicas: how long a write keeps the affected users' reads on the
+# primary (seconds; must exceed replica lag) and where the pins live
+# (shared by every worker, see core/checks.py)
+REPLICA_STICKY_SECONDS = 10
+REPLICA_PIN_CACHE_ALIAS = "shared"
+
+
+# Task export (rows fetched per database round trip while streaming)
+TASK_EXPORT_CHUNK_SIZE = 2000
+
+
+# Request instrumentation histogram buckets (milliseconds)
+REQUEST_TIMING_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500)
+
+
+# Rate limit counters, shared by every worker: "core.throttles.SQLiteThrottleBackend"
+# (path option; one host) or "core.throttles.CacheThrottleBackend" (alias
+# option; a shared cache such as Redis, see core/checks.py)
+THROTTLE_BACKEND = "core.throttles.SQLiteThrottleBackend"
+THROTTLE_BACKEND_OPTIONS = {"path": Path(__file__).resolve().parent.parent / "throttle.sqlite3"}
+
+
 # Rate limits 
 TASK_LIST_RATE = "10/min"
 TASK_CREATE_RATE = "5/min"
+TASK_BULK_CREATE_RATE = "5/min"  # counted per batch, not per task
+TASK_EXPORT_RATE = "10/hour"
+TASK_SEARCH_RATE = "30/min"
 LOGIN_RATE = "3/min"
 SIGNUP_RATE = "5/min"
 
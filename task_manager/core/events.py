@@ -0,0 +1,184 @@
+# core/events.py
+"""
+Pub/sub that wakes a user's open SSE streams when their tasks change.
+
+Messages carry no payload beyond "user X has new changes": the stream
+reads the details from the TaskChange log itself, which is also what it
+resumes from. A lost or coalesced notification therefore never loses an
+event, and any broker that can fan out a user id is enough.
+"""
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from functools import lru_cache
+
+from django.core.cache import caches
+from django.utils.module_loading import import_string
+
+from core.config import EVENT_BACKEND, EVENT_BACKEND_OPTIONS
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    """
+    One open stream's mailbox. Notifications coalesce into a single flag.
+    """
+
+    def __init__(self, backend, user_id):
+        self.backend = backend
+        self.user_id = user_id
+        self.loop = asyncio.get_running_loop()
+        self.flag = asyncio.Event()
+
+    def notify(self):
+        # publishers run on worker threads, the stream on the event loop
+        self.loop.call_soon_threadsafe(self.flag.set)
+
+    async def wait(self, timeout):
+        """
+        True when notified within ``timeout`` seconds, False otherwise.
+        """
+        try:
+            await asyncio.wait_for(self.flag.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+
+        self.flag.clear()
+        return True
+
+    def close(self):
+        self.backend.unsubscribe(self)
+
+
+class LocalEventBackend:
+    """
+    In-process fan-out. Only streams served by this process are woken:
+    writes made by other workers, ``run_jobs`` or management commands
+    reach them at the next heartbeat. Fits single-process deployments.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.subscribers = {}   # user id -> {Subscription}
+
+    def subscribe(self, user_id):
+        subscription = Subscription(self, user_id)
+        with self.lock:
+            self.subscribers.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            subscribers = self.subscribers.get(subscription.user_id, set())
+            subscribers.discard(subscription)
+            if not subscribers:
+                self.subscribers.pop(subscription.user_id, None)
+
+    def publish(self, user_ids):
+        with self.lock:
+            subscriptions = [
+                subscription
+                for user_id in user_ids
+                for subscription in self.subscribers.get(user_id, ())
+            ]
+
+        for subscription in subscriptions:
+            subscription.notify()
+
+
+class SharedCacheEventBackend(LocalEventBackend):
+    """
+    Fan-out across processes through a cache they all reach (the ``alias``
+    must be shared, see core/checks.py).
+
+    publish() stamps each user's key with a fresh token. While a process
+    has open streams, one thread polls its subscribers' keys every
+    ``poll_seconds`` and wakes those whose token changed, so a write in
+    any process reaches a stream within a poll interval. Streams in the
+    publishing process are woken at once. A broker with real pub/sub
+    (e.g. Redis) plugs in behind the same three methods.
+    """
+
+    def __init__(self, alias="shared", poll_seconds=0.5, timeout=60 * 60):
+        super().__init__()
+        self.alias = alias
+        self.poll_seconds = poll_seconds
+        self.timeout = timeout
+        self.tokens = {}   # user id -> token last seen, for subscribed users
+        self.poller = None
+
+    @staticmethod
+    def key(user_id):
+        return f"events:user:{user_id}"
+
+    def subscribe(self, user_id):
+        subscription = super().subscribe(user_id)
+        with self.lock:
+            if self.poller is None:
+                self.poller = threading.Thread(target=self.poll, name="event-poller", daemon=True)
+                self.poller.start()
+        return subscription
+
+    def publish(self, user_ids):
+        tokens = {user_id: uuid.uuid4().hex for user_id in user_ids}
+        caches[self.alias].set_many({self.key(user_id): token for user_id, token in tokens.items()}, self.timeout)
+
+        with self.lock:
+            # local streams are woken below, not again by the poller
+            for user_id, token in tokens.items():
+                if user_id in self.tokens:
+                    self.tokens[user_id] = token
+
+        super().publish(user_ids)
+
+    def poll(self):
+        cache = caches[self.alias]
+
+        while True:
+            with self.lock:
+                keys = {self.key(user_id): user_id for user_id in self.subscribers}
+                if not keys:
+                    # the next subscribe() starts a new poller
+                    self.poller = None
+                    self.tokens.clear()
+                    return
+
+            try:
+                current = cache.get_many(keys)
+            except Exception:
+                logger.exception("Polling the %r cache for task events failed", self.alias)
+                current = None
+
+            if current is not None:
+                LocalEventBackend.publish(self, self.changed(keys, current))
+
+            time.sleep(self.poll_seconds)
+
+    def changed(self, keys, current):
+        """
+        Users whose token moved since the last poll. Users seen for the
+        first time are woken too: they may have subscribed just before a
+        publish this poll would otherwise take as the starting point.
+        """
+        woken = []
+
+        with self.lock:
+            for key, user_id in keys.items():
+                token = current.get(key)
+                if user_id not in self.tokens or token not in (None, self.tokens[user_id]):
+                    woken.append(user_id)
+                if token is not None or user_id not in self.tokens:
+                    self.tokens[user_id] = token
+
+            for user_id in self.tokens.keys() - self.subscribers.keys():
+                del self.tokens[user_id]
+
+        return woken
+
+
+@lru_cache(maxsize=None)
+def get_event_backend():
+    return import_string(EVENT_BACKEND)(**EVENT_BACKEND_OPTIONS)
@@ -0,0 +1,96 @@
+# core/export.py
+"""
+Row encoders for streaming task exports.
+
+Rows come from ``.values().iterator()``, so no model instances are built;
+each encoder turns rows into chunks of text as they arrive and holds at
+most one row in memory.
+
+Under ASGI the encoded chunks go through ``async_chunks``: given a sync
+iterator, StreamingHttpResponse would read all of it with
+``sync_to_async(list)`` before sending a byte.
+"""
+import csv
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+from django.db.models import F
+from rest_framework.utils.encoders import JSONEncoder
+
+from core.config import TASK_EXPORT_CHUNK_SIZE
+
+# column order of every export; "task_id" matches the list endpoint
+EXPORT_FIELDS = [
+    "task_id",
+    "title",
+    "description",
+    "status",
+    "assigned_to_id",
+    "created_by_id",
+    "created_at",
+    "updated_at",
+]
+
+
+def export_rows(qs):
+    """
+    Lazily fetched plain-dict rows of ``qs``, in list order.
+    """
+    return (
+        qs.order_by("-created_at", "-id")
+          .values(
+              *[name for name in EXPORT_FIELDS if name != "task_id"],
+              task_id=F("id")
+          )
+          .iterator(chunk_size=TASK_EXPORT_CHUNK_SIZE)
+    )
+
+
+async def async_chunks(chunks, batch_size=TASK_EXPORT_CHUNK_SIZE):
+    """
+    ``chunks`` as an async iterator, ``batch_size`` at a time. Every batch
+    is read on the same thread (thread_sensitive), which owns the database
+    cursor behind the rows.
+    """
+    next_batch = sync_to_async(lambda: list(islice(chunks, batch_size)), thread_sensitive=True)
+
+    try:
+        while batch := await next_batch():
+            for chunk in batch:
+                yield chunk
+    finally:
+        # closes the server-side cursor if the client went away early
+        await sync_to_async(chunks.close, thread_sensitive=True)()
+
+
+def ndjson_lines(rows):
+    encoder = JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    for row in rows:
+        yield encoder.encode({name: row[name] for name in EXPORT_FIELDS}) + "\n"
+
+
+class _Echo:
+    """
+    File-like object whose ``write`` hands the line back to csv.writer.
+    """
+
+    def write(self, value):
+        return value
+
+
+def csv_lines(rows):
+    writer = csv.writer(_Echo())
+
+    yield writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        yield writer.writerow([
+            value.isoformat() if hasattr(value, "isoformat") else value
+            for value in (row[name] for name in EXPORT_FIELDS)
+        ])
+
+
+EXPORT_FORMATS = {
+    "ndjson": (ndjson_lines, "application/x-ndjson"),
+    "csv": (csv_lines, "text/csv"),
+}
@@ -0,0 +1,143 @@
+# core/hashers.py
+"""
+Password hashers for the hashing profile in settings.PASSWORD_HASHERS.
+
+The first hasher there hashes new passwords; the others only verify
+hashes stored under an older profile, and Django rehashes those with the
+first one on the user's next successful login (User.check_password).
+
+Every hash and verify runs on a small per-process thread pool
+(PASSWORD_HASH_WORKERS; the hash functions release the GIL), so a burst
+of logins uses at most that many cores and leaves the rest to other
+requests. Requests beyond PASSWORD_HASH_MAX_PENDING waiting hashes are
+turned away with a 503 instead of piling up.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
+import django
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher,
+    PBKDF2PasswordHasher,
+    PBKDF2SHA1PasswordHasher,
+    ScryptPasswordHasher,
+    make_password,
+)
+from rest_framework import exceptions, status
+
+from core.config import (
+    ARGON2_MEMORY_COST,
+    ARGON2_PARALLELISM,
+    ARGON2_TIME_COST,
+    PASSWORD_HASH_MAX_PENDING,
+    PASSWORD_HASH_WORKERS,
+    SCRYPT_BLOCK_SIZE,
+    SCRYPT_PARALLELISM,
+    SCRYPT_WORK_FACTOR,
+)
+
+# set in the pool's threads: a hasher calling itself there (verify() ->
+# encode()) must not wait for a slot its own thread holds
+_pool_thread = threading.local()
+
+_slots = threading.BoundedSemaphore(PASSWORD_HASH_WORKERS + PASSWORD_HASH_MAX_PENDING)
+
+
+class PasswordHashingBusy(exceptions.APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Too many password checks in progress, retry shortly."
+    default_code = "password_hashing_busy"
+    wait = 1   # seconds, sent as Retry-After
+
+
+def _mark_pool_thread():
+    _pool_thread.active = True
+
+
+@lru_cache(maxsize=None)
+def hashing_executor():
+    return ThreadPoolExecutor(
+        PASSWORD_HASH_WORKERS,
+        thread_name_prefix="password-hash",
+        initializer=_mark_pool_thread,
+    )
+
+
+def run_bounded(fn, *args, **kwargs):
+    """
+    Run ``fn`` on the hashing pool and wait for it. Raises
+    PasswordHashingBusy when the pool and its queue are full.
+    """
+    if getattr(_pool_thread, "active", False):
+        return fn(*args, **kwargs)
+
+    if not _slots.acquire(blocking=False):
+        raise PasswordHashingBusy()
+    try:
+        return hashing_executor().submit(fn, *args, **kwargs).result()
+    finally:
+        _slots.release()
+
+
+def hash_passwords(passwords):
+    """
+    Hash a batch of passwords in parallel on the hashing pool, in order.
+    The batch takes one queue slot.
+    """
+    if not _slots.acquire(blocking=False):
+        raise PasswordHashingBusy()
+    try:
+        return list(hashing_executor().map(make_password, passwords))
+    finally:
+        _slots.release()
+
+
+def init_hashing_process():
+    """
+    Initializer of the process pools that hash in bulk (import_reportees):
+    each process is a hashing worker of its own.
+    """
+    django.setup()
+    _mark_pool_thread()
+
+
+class BoundedHasherMixin:
+    def encode(self, password, salt, *args, **kwargs):
+        return run_bounded(super().encode, password, salt, *args, **kwargs)
+
+    def verify(self, password, encoded):
+        return run_bounded(super().verify, password, encoded)
+
+    def harden_runtime(self, password, encoded):
+        return run_bounded(super().harden_runtime, password, encoded)
+
+
+class TunedArgon2PasswordHasher(BoundedHasherMixin, Argon2PasswordHasher):
+    """
+    Argon2id with the ARGON2_* costs (needs ``argon2-cffi``). Hashes made
+    with other costs are rehashed on login.
+    """
+    time_cost = ARGON2_TIME_COST
+    memory_cost = ARGON2_MEMORY_COST
+    parallelism = ARGON2_PARALLELISM
+
+
+class TunedScryptPasswordHasher(BoundedHasherMixin, ScryptPasswordHasher):
+    """
+    scrypt with the SCRYPT_* costs (standard library). Hashes made with
+    other costs are rehashed on login.
+    """
+    work_factor = SCRYPT_WORK_FACTOR
+    block_size = SCRYPT_BLOCK_SIZE
+    parallelism = SCRYPT_PARALLELISM
+    # OpenSSL refuses more than 32 MiB unless told otherwise
+    maxmem = 2 * 128 * SCRYPT_BLOCK_SIZE * SCRYPT_WORK_FACTOR
+
+
+class BoundedPBKDF2PasswordHasher(BoundedHasherMixin, PBKDF2PasswordHasher):
+    pass
+
+
+class BoundedPBKDF2SHA1PasswordHasher(BoundedHasherMixin, PBKDF2SHA1PasswordHasher):
+    pass
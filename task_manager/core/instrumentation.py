@@ -0,0 +1,153 @@
+# core/instrumentation.py
+import threading
+import time
+from bisect import bisect_left
+from contextlib import ExitStack
+
+from django.db import connections
+
+from core.config import REQUEST_TIMING_BUCKETS_MS
+
+
+class RequestMetrics:
+    """
+    Per-request timings, filled in by QueryInstrumentationMiddleware.
+
+    Doubles as a ``connection.execute_wrapper`` so every query on every
+    database alias is counted and timed.
+    """
+
+    def __init__(self):
+        self.queries = []          # SQL of every statement, in order
+        self.sql_time = 0.0
+        self.serialization_time = 0.0
+        self.total_time = 0.0
+        self.route = None
+        self.query_budget = None
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_time += time.perf_counter() - start
+            self.queries.append(sql)
+
+    def capture(self):
+        """
+        Context manager wrapping every configured database connection.
+        """
+        stack = ExitStack()
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(self))
+        return stack
+
+    @property
+    def query_count(self):
+        return len(self.queries)
+
+    @property
+    def over_budget(self):
+        return self.query_budget is not None and self.query_count > self.query_budget
+
+    def server_timing(self):
+        app_time = self.total_time - self.sql_time - self.serialization_time
+        return ", ".join([
+            f'db;dur={self.sql_time * 1000:.2f};desc="{self.query_count} queries"',
+            f"ser;dur={self.serialization_time * 1000:.2f}",
+            f"app;dur={max(app_time, 0) * 1000:.2f}",
+            f"total;dur={self.total_time * 1000:.2f}",
+        ])
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram; memory does not grow with the sample count.
+    """
+
+    def __init__(self, bounds):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)   # last bucket is +Inf
+        self.total = 0.0
+        self.samples = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.samples += 1
+
+    def as_dict(self):
+        labels = [str(bound) for bound in self.bounds] + ["+Inf"]
+        return {
+            "buckets": dict(zip(labels, self.counts)),
+            "count": self.samples,
+            "sum": round(self.total, 3),
+        }
+
+
+class RouteStats:
+    """
+    Process-wide per-route histograms of request timings and query counts.
+    """
+
+    QUERY_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55)
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.routes = {}
+
+    def record(self, metrics):
+        with self.lock:
+            route = self.routes.get(metrics.route)
+            if route is None:
+                route = self.routes[metrics.route] = {
+                    "total_ms": Histogram(REQUEST_TIMING_BUCKETS_MS),
+                    "sql_ms": Histogram(REQUEST_TIMING_BUCKETS_MS),
+                    "serialization_ms": Histogram(REQUEST_TIMING_BUCKETS_MS),
+                    "queries": Histogram(self.QUERY_BUCKETS),
+                    "over_budget": 0,
+                }
+
+            route["total_ms"].observe(metrics.total_time * 1000)
+            route["sql_ms"].observe(metrics.sql_time * 1000)
+            route["serialization_ms"].observe(metrics.serialization_time * 1000)
+            route["queries"].observe(metrics.query_count)
+            route["over_budget"] += metrics.over_budget
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                name: {
+                    key: value.as_dict() if isinstance(value, Histogram) else value
+                    for key, value in stats.items()
+                }
+                for name, stats in self.routes.items()
+            }
+
+    def reset(self):
+        with self.lock:
+            self.routes.clear()
+
+
+route_stats = RouteStats()
+
+
+class QueryBudgetTestMixin:
+    """
+    TestCase mixin: fail when a response used more queries than its view's
+    ``query_budget``. Needs QueryInstrumentationMiddleware to be installed.
+    """
+
+    def assertWithinQueryBudget(self, response):
+        metrics = getattr(response, "request_metrics", None)
+        if metrics is None:
+            self.fail("Response was not instrumented by QueryInstrumentationMiddleware")
+
+        if metrics.query_budget is None:
+            self.fail(f"View for {metrics.route} declares no query_budget")
+
+        if metrics.over_budget:
+            self.fail(
+                f"{metrics.route} ran {metrics.query_count} queries, "
+                f"budget is {metrics.query_budget}:\n" + "\n".join(metrics.queries)
+            )
@@ -0,0 +1,365 @@
+# core/jobs.py
+"""
+Database-backed background jobs.
+
+Views enqueue work that is too big for a request (enqueue) and answer
+202 with a status URL; the ``run_jobs`` command runs it on a thread or
+process pool. The Job table is the queue: workers claim due jobs with a
+conditional UPDATE (SELECT ... FOR UPDATE SKIP LOCKED where supported,
+SQLite's single writer elsewhere), so several workers can share it.
+
+Delivery is at least once. A failed attempt is retried with exponential
+backoff, and a worker that dies mid-job loses its claim after
+JOB_LEASE_SECONDS, so handlers must be safe to run again.
+"""
+import logging
+import multiprocessing
+import os
+import random
+import socket
+import threading
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from datetime import timedelta
+
+import django
+from django.db import IntegrityError, close_old_connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core.bulk_updates import bulk_update_owned_tasks
+from core.config import (
+    JOB_LEASE_SECONDS,
+    JOB_MAX_ATTEMPTS,
+    JOB_POLL_SECONDS,
+    JOB_RETRY_BASE_SECONDS,
+    JOB_RETRY_MAX_SECONDS,
+    JOB_WORKERS,
+    TASK_BULK_MAX_SIZE,
+)
+from core.models import Job, Task, User
+
+logger = logging.getLogger(__name__)
+
+# kind -> handler(job) returning the job's JSON result
+JOB_HANDLERS = {}
+
+
+class JobError(Exception):
+    """
+    A failure retrying cannot fix (bad input, missing rows): the job fails
+    at once with this message.
+    """
+
+
+def job_handler(kind):
+    def register(handler):
+        JOB_HANDLERS[kind] = handler
+        return handler
+
+    return register
+
+
+def enqueue(kind, payload, user, idempotency_key=None):
+    """
+    Queue a ``kind`` job for ``user``. Returns (job, created); with an
+    ``idempotency_key`` the user already used, the existing job comes back
+    and nothing is queued.
+    """
+    if idempotency_key is not None:
+        existing = Job.objects.filter(created_by_id=user.id, idempotency_key=idempotency_key).first()
+        if existing is not None:
+            return existing, False
+
+    try:
+        with transaction.atomic():
+            job = Job.objects.create(
+                kind=kind,
+                payload=payload,
+                company_id=user.company_id,
+                created_by_id=user.id,
+                idempotency_key=idempotency_key,
+                max_attempts=JOB_MAX_ATTEMPTS,
+            )
+    except IntegrityError:
+        # a concurrent request with the same key got there first
+        return Job.objects.get(created_by_id=user.id, idempotency_key=idempotency_key), False
+
+    return job, True
+
+
+def retry_delay(attempt):
+    """
+    Seconds before attempt ``attempt + 1``: doubling from
+    JOB_RETRY_BASE_SECONDS up to JOB_RETRY_MAX_SECONDS, plus up to 10%
+    jitter so jobs that failed together do not retry together.
+    """
+    delay = min(JOB_RETRY_BASE_SECONDS * 2 ** (attempt - 1), JOB_RETRY_MAX_SECONDS)
+    return delay * (1 + random.random() / 10)
+
+
+def claim_jobs(worker, limit):
+    """
+    Mark up to ``limit`` due jobs as RUNNING for ``worker``, oldest first,
+    counting the attempt. Returns their ids.
+    """
+    now = timezone.now()
+
+    with transaction.atomic():
+        job_ids = list(
+            Job.objects
+            .select_for_update(skip_locked=True)
+            .filter(status=Job.QUEUED, run_after__lte=now)
+            .order_by("run_after", "id")
+            .values_list("id", flat=True)[:limit]
+        )
+        Job.objects.filter(id__in=job_ids, status=Job.QUEUED).update(
+            status=Job.RUNNING,
+            locked_by=worker,
+            locked_at=now,
+            attempts=F("attempts") + 1,
+            updated_at=now,
+        )
+
+    return job_ids
+
+
+def requeue_stale_jobs():
+    """
+    Give up the claims of jobs running longer than JOB_LEASE_SECONDS (their
+    worker died or hung): queue them again, or fail them when they have
+    no attempts left. Returns how many were released.
+    """
+    now = timezone.now()
+    stale = Job.objects.filter(status=Job.RUNNING, locked_at__lt=now - timedelta(seconds=JOB_LEASE_SECONDS))
+
+    failed = stale.filter(attempts__gte=F("max_attempts")).update(
+        status=Job.FAILED,
+        error="Lease expired on the last attempt",
+        locked_by="",
+        finished_at=now,
+        updated_at=now,
+    )
+    requeued = stale.update(
+        status=Job.QUEUED,
+        error="Lease expired",
+        locked_by="",
+        run_after=now,
+        updated_at=now,
+    )
+
+    return failed + requeued
+
+
+def run_job(job_id, worker):
+    """
+    Run a job ``worker`` claimed and record the outcome. Updates only go
+    through while the claim is still ``worker``'s, so a job taken over
+    after a lease expiry is not overwritten.
+    """
+    job = Job.objects.select_related("created_by").get(id=job_id)
+    claimed = Job.objects.filter(id=job_id, status=Job.RUNNING, locked_by=worker)
+
+    try:
+        handler = JOB_HANDLERS.get(job.kind)
+        if handler is None:
+            raise JobError(f"Unknown job kind {job.kind!r}")
+        result = handler(job)
+    except JobError as exc:
+        outcome = {"status": Job.FAILED, "error": str(exc)}
+    except Exception as exc:
+        logger.exception("Job %s (%s) failed on attempt %s", job.id, job.kind, job.attempts)
+        outcome = {"status": Job.FAILED, "error": f"{type(exc).__name__}: {exc}"}
+
+        if job.attempts < job.max_attempts:
+            outcome.update(
+                status=Job.QUEUED,
+                locked_by="",
+                run_after=timezone.now() + timedelta(seconds=retry_delay(job.attempts)),
+            )
+    else:
+        outcome = {"status": Job.SUCCEEDED, "result": result, "error": ""}
+
+    now = timezone.now()
+    if outcome["status"] != Job.QUEUED:
+        outcome["finished_at"] = now
+    claimed.update(updated_at=now, **outcome)
+
+
+def run_pooled_job(job_id, worker):
+    # pool threads and processes keep their own connections between jobs
+    try:
+        run_job(job_id, worker)
+    finally:
+        close_old_connections()
+
+
+class InlineExecutor:
+    """
+    Runs every job in the worker's own thread as it is submitted
+    (``run_jobs --workers 0``), one at a time.
+    """
+
+    def submit(self, fn, *args):
+        future = Future()
+        try:
+            future.set_result(fn(*args))
+        except BaseException as exc:
+            future.set_exception(exc)
+        return future
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+class Worker:
+    """
+    Claims due jobs and runs them on a pool of ``workers`` threads (or
+    processes), never holding more claims than it has free slots, and
+    polls every ``poll_seconds`` while idle.
+    """
+
+    def __init__(self, workers=JOB_WORKERS, pool="thread", poll_seconds=JOB_POLL_SECONDS):
+        self.workers = workers
+        self.pool = pool
+        self.poll_seconds = poll_seconds
+        self.name = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.stopping = threading.Event()
+
+    def executor(self):
+        if self.workers == 0:
+            return InlineExecutor()
+        if self.pool == "process":
+            # spawn, not fork: a forked child would share the parent's
+            # database connections. Spawned children set Django up before
+            # unpickling their first job (a reference into this module).
+            return ProcessPoolExecutor(
+                self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=django.setup,
+            )
+        return ThreadPoolExecutor(self.workers, thread_name_prefix="job")
+
+    def stop(self):
+        """
+        Stop claiming; jobs already running are finished first.
+        """
+        self.stopping.set()
+
+    def run(self, once=False):
+        """
+        Work until stop(), or with ``once`` until no job is due. Returns
+        how many jobs were run.
+        """
+        run = run_job if self.workers == 0 else run_pooled_job
+        slots = max(self.workers, 1)
+        in_flight = set()
+        finished = 0
+
+        with self.executor() as executor:
+            while not self.stopping.is_set():
+                requeue_stale_jobs()
+                claimed = claim_jobs(self.name, slots - len(in_flight)) if len(in_flight) < slots else []
+                in_flight |= {executor.submit(run, job_id, self.name) for job_id in claimed}
+
+                if not in_flight:
+                    if once:
+                        break
+                    self.stopping.wait(self.poll_seconds)
+                    continue
+
+                done, in_flight = wait(in_flight, timeout=self.poll_seconds, return_when=FIRST_COMPLETED)
+                for future in done:
+                    future.result()   # surfaces a broken pool
+                finished += len(done)
+
+            done, _ = wait(in_flight)
+            finished += len(done)
+
+        return finished
+
+
+def chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def active_reportee(manager, reportee_id):
+    return User.objects.filter(
+        id=reportee_id,
+        role="REPORTEE",
+        company_id=manager.company_id,
+        is_active=True
+    ).first()
+
+
+@job_handler("tasks.bulk_assign")
+def bulk_assign_tasks(job):
+    """
+    Assign any number of the manager's tasks to one reportee, one
+    TASK_BULK_MAX_SIZE transaction at a time.
+    """
+    manager = job.created_by
+    reportee = active_reportee(manager, job.payload["assigned_to_id"])
+    if reportee is None:
+        raise JobError("Invalid reportee for this company")
+
+    updated, skipped_ids = 0, []
+    for task_ids in chunks(job.payload["task_ids"], TASK_BULK_MAX_SIZE):
+        updated_ids, skipped = bulk_update_owned_tasks(manager, task_ids, assigned_to_id=reportee.id)
+        updated += len(updated_ids)
+        skipped_ids += skipped
+
+    return {
+        "assigned_to_id": reportee.id,
+        "updated": updated,
+        "skipped_task_ids": skipped_ids,
+    }
+
+
+@job_handler("reportees.offboard")
+def offboard_reportee(job):
+    """
+    Deactivate one of the manager's reportees (ending their sessions and
+    tokens) and move the manager's live tasks assigned to them to
+    ``reassign_to_id``, or leave them unassigned. Tasks other managers
+    assigned to the reportee are theirs to move.
+    """
+    manager = job.created_by
+    reportee = User.objects.filter(
+        id=job.payload["reportee_id"],
+        role="REPORTEE",
+        company_id=manager.company_id,
+        manager_id=manager.id
+    ).first()
+    if reportee is None:
+        raise JobError("Invalid reportee for this manager")
+
+    reassign_to_id = job.payload.get("reassign_to_id")
+    if reassign_to_id is not None:
+        successor = active_reportee(manager, reassign_to_id)
+        if successor is None or successor.id == reportee.id:
+            raise JobError("Invalid reportee to reassign the tasks to")
+
+    if reportee.is_active:
+        reportee.is_active = False
+        reportee.save(update_fields=["is_active", "updated_at"])
+
+    task_ids = list(
+        Task.objects.filter(
+            assigned_to_id=reportee.id,
+            created_by_id=manager.id,
+            company_id=manager.company_id
+        ).order_by("id").values_list("id", flat=True)
+    )
+    for chunk in chunks(task_ids, TASK_BULK_MAX_SIZE):
+        bulk_update_owned_tasks(manager, chunk, assigned_to_id=reassign_to_id)
+
+    return {
+        "reportee_id": reportee.id,
+        "reassigned_to_id": reassign_to_id,
+        "tasks_moved": len(task_ids),
+    }
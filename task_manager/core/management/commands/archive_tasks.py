@@ -0,0 +1,60 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.archive import archivable_tasks, archive_tasks
+from core.config import TASK_ARCHIVE_AFTER_DAYS, TASK_ARCHIVE_CHUNK_SIZE
+
+
+class Command(BaseCommand):
+    help = "Move deleted and completed tasks into the task archive"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days", type=int, default=TASK_ARCHIVE_AFTER_DAYS,
+            help="Archive tasks unchanged for more than N days"
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=TASK_ARCHIVE_CHUNK_SIZE,
+            help="Tasks moved per transaction"
+        )
+        parser.add_argument(
+            "--deleted-only", action="store_true",
+            help="Leave completed tasks in place"
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true",
+            help="Only count the tasks that would be archived"
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        archivable = archivable_tasks(cutoff, completed=not options["deleted_only"])
+
+        if options["dry_run"]:
+            self.stdout.write(f"{archivable.count()} tasks would be archived")
+            return
+
+        # walk the table once, in id order, a chunk at a time
+        deleted = completed = chunks = 0
+        last_id = 0
+        while True:
+            task_ids = list(
+                archivable.filter(id__gt=last_id)
+                .order_by("id")
+                .values_list("id", flat=True)[:options["chunk_size"]]
+            )
+            if not task_ids:
+                break
+
+            moved = archive_tasks(archivable.filter(id__in=task_ids))
+            deleted += moved[0]
+            completed += moved[1]
+            chunks += 1
+            last_id = task_ids[-1]
+
+        self.stdout.write(
+            f"Archived {deleted + completed} tasks ({deleted} deleted, {completed} completed) "
+            f"in {chunks} chunks"
+        )
@@ -0,0 +1,139 @@
+import json
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from core.benchmarks import (
+    ApiBenchmark,
+    Scale,
+    run_benchmark,
+    run_concurrency_benchmark,
+    run_search_benchmark,
+    run_serialization_benchmark,
+    run_write_stress,
+)
+
+
+class Command(BaseCommand):
+    help = "Benchmark every core API route against a throwaway database"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--companies", type=int, default=Scale.companies)
+        parser.add_argument(
+            "--managers", type=int, default=Scale.managers,
+            help="Managers per company"
+        )
+        parser.add_argument(
+            "--reportees", type=int, default=Scale.reportees,
+            help="Reportees per manager"
+        )
+        parser.add_argument(
+            "--tasks", type=int, default=Scale.tasks,
+            help="Tasks per manager"
+        )
+        parser.add_argument(
+            "--requests", type=int, default=50,
+            help="Timed requests per route"
+        )
+        parser.add_argument(
+            "--route", action="append", dest="routes",
+            choices=ApiBenchmark.available_routes(),
+            help="Only run this route (repeatable)"
+        )
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--asgi", action="store_true",
+            help="Compare sync and async views through the ASGI handler"
+        )
+        parser.add_argument(
+            "--concurrency", type=int, default=10,
+            help="Requests in flight at once (with --asgi), threads (with --write-stress)"
+        )
+        parser.add_argument(
+            "--serialization", action="store_true",
+            help="Time list page encoding instead of routes (uses --page-size)"
+        )
+        parser.add_argument(
+            "--page-size", type=int, action="append", dest="page_sizes",
+            help="Rows per page for --serialization (repeatable; default 10, 100, 1000)"
+        )
+        parser.add_argument(
+            "--search", action="store_true",
+            help="Time search pages through the FTS index and the icontains "
+                 "fallback (--requests runs per query)"
+        )
+        parser.add_argument(
+            "--write-stress", action="store_true",
+            help="Compare bare and tuned SQLite settings under concurrent writes "
+                 "(--concurrency threads, --requests writes each)"
+        )
+        parser.add_argument(
+            "--output", default="-",
+            help="Where to write the JSON report ('-' for stdout)"
+        )
+
+    def handle(self, *args, **options):
+        scale = Scale(
+            companies=options["companies"],
+            managers=options["managers"],
+            reportees=options["reportees"],
+            tasks=options["tasks"],
+        )
+
+        if options["write_stress"]:
+            # uses its own throwaway database files
+            self.write_report(
+                run_write_stress(threads=options["concurrency"], writes=options["requests"]),
+                options["output"]
+            )
+            return
+
+        # Same isolation as `manage.py test`: never touch the real database
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(
+            verbosity=0,
+            autoclobber=True,
+            serialize=False
+        )
+
+        try:
+            if options["serialization"]:
+                report = run_serialization_benchmark(
+                    page_sizes=options["page_sizes"] or (10, 100, 1000),
+                    repeat=options["requests"],
+                )
+            elif options["search"]:
+                report = run_search_benchmark(scale=scale, repeat=options["requests"])
+            elif options["asgi"]:
+                report = run_concurrency_benchmark(
+                    scale=scale,
+                    requests=options["requests"],
+                    concurrency=options["concurrency"],
+                    routes=options["routes"],
+                    seed_value=options["seed"],
+                )
+            else:
+                report = run_benchmark(
+                    scale=scale,
+                    requests=options["requests"],
+                    routes=options["routes"],
+                    seed_value=options["seed"],
+                )
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        self.write_report(report, options["output"])
+
+    def write_report(self, report, path):
+        output = json.dumps(report, indent=2)
+
+        if path == "-":
+            self.stdout.write(output)
+            return
+
+        with open(path, "w") as fh:
+            fh.write(output + "\n")
+
+        self.stdout.write(f"Benchmark report written to {path}")
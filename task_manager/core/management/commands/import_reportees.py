@@ -0,0 +1,104 @@
+import csv
+import json
+import multiprocessing
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+
+from core.config import REPORTEE_IMPORT_CHUNK_SIZE, REPORTEE_IMPORT_WORKERS
+from core.hashers import hash_passwords, init_hashing_process
+from core.models import User
+from core.provisioning import IMPORT_FORMATS, provision_reportees, read_reportee_rows
+
+
+class Command(BaseCommand):
+    help = "Create a manager's reportees from a CSV, JSON or NDJSON file"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="File to import, - for stdin")
+        parser.add_argument("--manager", required=True, help="Username of the reportees' manager")
+        parser.add_argument(
+            "--format", choices=IMPORT_FORMATS,
+            help="File format (default: from the file extension)"
+        )
+        parser.add_argument(
+            "--workers", type=int, default=REPORTEE_IMPORT_WORKERS,
+            help="Processes hashing passwords (0 hashes in this process)"
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=REPORTEE_IMPORT_CHUNK_SIZE,
+            help="Rows per username check and transaction"
+        )
+
+    def handle(self, *args, **options):
+        manager = User.objects.filter(
+            username=options["manager"],
+            role="MANAGER",
+            is_active=True
+        ).first()
+        if manager is None:
+            raise CommandError(f"No active manager {options['manager']!r}")
+
+        path = options["path"]
+        fmt = options["format"] or Path(path).suffix.lstrip(".").lower()
+        if fmt not in IMPORT_FORMATS:
+            raise CommandError(f"Cannot tell the format of {path!r}; pass --format")
+
+        if path == "-":
+            stream = sys.stdin.buffer
+        else:
+            try:
+                stream = open(path, "rb")
+            except OSError as exc:
+                raise CommandError(f"Cannot open {path!r}: {exc}")
+
+        if options["workers"]:
+            # spawn, not fork: a forked child would inherit this process's
+            # database connection and hashing pool mid-use
+            executor = ProcessPoolExecutor(
+                options["workers"],
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_hashing_process,
+            )
+
+            def hash_batch(passwords):
+                return list(executor.map(make_password, passwords, chunksize=16))
+        else:
+            executor = None
+            hash_batch = hash_passwords
+
+        created = failed = 0
+        started = time.perf_counter()
+
+        try:
+            rows = read_reportee_rows(stream, fmt)
+            for results in provision_reportees(manager, rows, options["chunk_size"], hash_batch):
+                for result in results:
+                    if "errors" in result:
+                        failed += 1
+                        self.stderr.write(f"row {result['index'] + 1}: {json.dumps(result['errors'])}")
+                    else:
+                        created += 1
+
+                elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f"{created + failed} rows, {created} created, {failed} failed "
+                    f"({(created + failed) / elapsed:.1f} rows/s)"
+                )
+        except (ValueError, csv.Error) as exc:
+            raise CommandError(f"Cannot read {path!r}: {exc}")
+        finally:
+            if stream is not sys.stdin.buffer:
+                stream.close()
+            if executor is not None:
+                executor.shutdown()
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            f"Created {created} reportees for {manager.username}, {failed} rows failed, "
+            f"in {elapsed:.1f}s ({created / elapsed:.1f} reportees/s)"
+        )
@@ -0,0 +1,49 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.config import TASK_CHANGES_RETENTION_DAYS
+from core.models import TaskChange
+
+
+class Command(BaseCommand):
+    help = "Delete delta-sync log rows older than the retention period"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days", type=int, default=TASK_CHANGES_RETENTION_DAYS,
+            help="Keep changes from the last N days"
+        )
+        parser.add_argument(
+            "--chunk-size", type=int, default=10000,
+            help="Rows deleted per statement"
+        )
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        newest = TaskChange.objects.order_by("-id").values_list("id", flat=True).first()
+        expired = (
+            TaskChange.objects
+            .filter(created_at__lt=cutoff)
+            .order_by("-id")
+            .values_list("id", flat=True)
+            .first()
+        )
+
+        if expired is None:
+            self.stdout.write("Nothing to prune")
+            return
+
+        # Delete a prefix of the log, but never the newest row: the changes
+        # endpoint spots expired tokens by the gap before the oldest row.
+        upto = min(expired, newest - 1)
+        start = TaskChange.objects.order_by("id").values_list("id", flat=True).first()
+
+        deleted = 0
+        while start <= upto:
+            end = min(start + options["chunk_size"] - 1, upto)
+            deleted += TaskChange.objects.filter(id__gte=start, id__lte=end).delete()[0]
+            start = end + 1
+
+        self.stdout.write(f"Pruned {deleted} task changes up to #{upto}")
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS
+
+from core.search import search_backend_for
+
+
+class Command(BaseCommand):
+    help = "Rebuild (or check) the task full-text search index"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check", action="store_true",
+            help="Only verify the index; exit with an error if it is out of step"
+        )
+        parser.add_argument(
+            "--optimize", action="store_true",
+            help="Merge the index into one segment after rebuilding"
+        )
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        using = options["database"]
+        backend = search_backend_for(using)
+
+        if options["check"]:
+            if not backend.check(using):
+                raise CommandError("Task search index is out of step with the tasks")
+            self.stdout.write("Task search index is in sync")
+            return
+
+        backend.rebuild(using)
+        if options["optimize"]:
+            backend.optimize(using)
+        self.stdout.write("Rebuilt task search index")
@@ -0,0 +1,35 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.summary import drifted_task_counts, rebuild_task_counts
+
+
+class Command(BaseCommand):
+    help = "Recompute the task summary counters from the tasks, reporting drift"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check", action="store_true",
+            help="Only report drift; exit with an error if there is any"
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=1000,
+            help="Counter rows inserted per statement"
+        )
+
+    def handle(self, *args, **options):
+        drift = drifted_task_counts()
+
+        for (company_id, user_id, status), stored, actual in drift:
+            self.stdout.write(
+                f"company {company_id} user {user_id} {status}: "
+                f"stored {stored}, actual {actual}"
+            )
+
+        if options["check"]:
+            if drift:
+                raise CommandError(f"{len(drift)} task counters drifted")
+            self.stdout.write("Task counters are in sync")
+            return
+
+        rebuild_task_counts(batch_size=options["batch_size"])
+        self.stdout.write(f"Rebuilt task counters ({len(drift)} had drifted)")
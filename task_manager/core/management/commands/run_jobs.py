@@ -0,0 +1,50 @@
+import signal
+
+from django.core.management.base import BaseCommand
+
+from core.config import JOB_POLL_SECONDS, JOB_WORKERS
+from core.jobs import Worker
+
+
+class Command(BaseCommand):
+    help = "Run queued background jobs"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers", type=int, default=JOB_WORKERS,
+            help="Jobs run at once (0: one at a time in this thread)"
+        )
+        parser.add_argument(
+            "--pool", choices=["thread", "process"], default="thread",
+            help="Run jobs on threads (default) or on separate processes"
+        )
+        parser.add_argument(
+            "--poll-interval", type=float, default=JOB_POLL_SECONDS,
+            help="Seconds between queue checks while idle"
+        )
+        parser.add_argument(
+            "--once", action="store_true",
+            help="Exit once no job is due instead of waiting for more"
+        )
+
+    def handle(self, *args, **options):
+        worker = Worker(
+            workers=options["workers"],
+            pool=options["pool"],
+            poll_seconds=options["poll_interval"],
+        )
+
+        # finish the running jobs on Ctrl+C / SIGTERM, claim nothing new
+        previous = {
+            signum: signal.signal(signum, lambda *_: worker.stop())
+            for signum in (signal.SIGINT, signal.SIGTERM)
+        }
+
+        self.stdout.write(f"Worker {worker.name} started")
+        try:
+            finished = worker.run(once=options["once"])
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+
+        self.stdout.write(f"Worker {worker.name} stopped after {finished} jobs")
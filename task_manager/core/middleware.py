@@ -0,0 +1,93 @@
+# core/middleware.py
+import logging
+import time
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+
+from core.instrumentation import RequestMetrics, route_stats
+
+logger = logging.getLogger(__name__)
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Record query count, SQL time, serialization time and total time for
+    every request.
+
+    Timings are sent back in a ``Server-Timing`` header and aggregated into
+    per-route histograms (core.instrumentation.route_stats). Views can
+    declare ``query_budget``; requests that exceed it are logged, and
+    QueryBudgetTestMixin turns them into test failures.
+
+    Install it first in MIDDLEWARE so session reads and writes are counted.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        metrics = RequestMetrics()
+        request.request_metrics = metrics
+
+        start = time.perf_counter()
+        with metrics.capture():
+            response = self.get_response(request)
+        metrics.total_time = time.perf_counter() - start
+
+        return self.record(request, response, metrics)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        request.request_metrics = metrics
+
+        # The ORM runs on the request's thread-sensitive worker thread, and
+        # connections are per thread: install the wrappers over there.
+        start = time.perf_counter()
+        capture = await sync_to_async(metrics.capture)()
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(capture.close)()
+        metrics.total_time = time.perf_counter() - start
+
+        return self.record(request, response, metrics)
+
+    def record(self, request, response, metrics):
+        match = getattr(request, "resolver_match", None)
+        if match is not None:
+            metrics.route = f"{request.method} /{match.route}"
+            view_class = getattr(match.func, "view_class", None)
+            metrics.query_budget = getattr(view_class, "query_budget", None)
+        else:
+            metrics.route = f"{request.method} <unmatched>"
+
+        if metrics.over_budget:
+            logger.warning(
+                "%s ran %d queries, budget is %d",
+                metrics.route,
+                metrics.query_count,
+                metrics.query_budget,
+            )
+
+        route_stats.record(metrics)
+        response["Server-Timing"] = metrics.server_timing()
+        response.request_metrics = metrics
+        return response
+
+    def process_template_response(self, request, response):
+        # DRF responses render after this hook; time the render itself
+        started = time.perf_counter()
+
+        def rendered(response):
+            request.request_metrics.serialization_time = time.perf_counter() - started
+
+        response.add_post_render_callback(rendered)
+        return response
@@ -0,0 +1,29 @@
+# Generated by Django 6.0 on 2026-10-18 12:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["company", "created_by", "-created_at", "-id"],
+                name="task_company_creator_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["company", "assigned_to", "-created_at", "-id"],
+                name="task_company_assignee_live_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 6.0 on 2026-10-18 13:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_task_live_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["company", "created_by", "-updated_at", "-id"],
+                name="task_creator_updated_live_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                condition=models.Q(("is_deleted", False)),
+                fields=["company", "assigned_to", "-updated_at", "-id"],
+                name="task_assignee_updated_live_idx",
+            ),
+        ),
+    ]
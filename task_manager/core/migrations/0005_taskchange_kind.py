@@ -0,0 +1,28 @@
+# Generated by Django 6.0 on 2026-10-18 14:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_taskchange"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="taskchange",
+            name="kind",
+            field=models.CharField(
+                choices=[
+                    ("created", "Created"),
+                    ("assigned", "Assigned"),
+                    ("status", "Status changed"),
+                    ("deleted", "Deleted"),
+                ],
+                default="status",
+                max_length=16,
+            ),
+            preserve_default=False,
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Hand-written migration: the FTS5 table and its triggers are raw SQL.
+
+from django.db import migrations
+
+# External-content FTS5 index over core_task (see core/search.py). The
+# triggers keep it in step with every write, whatever issues it.
+CREATE_SQL = [
+    """
+    CREATE VIRTUAL TABLE core_task_fts USING fts5(
+        title, description, company_id,
+        content='core_task', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    # a title match counts ten times a description match, the tenant not at all
+    "INSERT INTO core_task_fts(core_task_fts, rank) VALUES ('rank', 'bm25(10.0, 1.0, 0.0)')",
+    """
+    CREATE TRIGGER core_task_fts_insert AFTER INSERT ON core_task BEGIN
+        INSERT INTO core_task_fts(rowid, title, description, company_id)
+        VALUES (new.id, new.title, new.description, new.company_id);
+    END
+    """,
+    """
+    CREATE TRIGGER core_task_fts_delete AFTER DELETE ON core_task BEGIN
+        INSERT INTO core_task_fts(core_task_fts, rowid, title, description, company_id)
+        VALUES ('delete', old.id, old.title, old.description, old.company_id);
+    END
+    """,
+    # status, assignment and soft-delete updates leave the index alone
+    """
+    CREATE TRIGGER core_task_fts_update AFTER UPDATE OF title, description, company_id ON core_task BEGIN
+        INSERT INTO core_task_fts(core_task_fts, rowid, title, description, company_id)
+        VALUES ('delete', old.id, old.title, old.description, old.company_id);
+        INSERT INTO core_task_fts(rowid, title, description, company_id)
+        VALUES (new.id, new.title, new.description, new.company_id);
+    END
+    """,
+    "INSERT INTO core_task_fts(core_task_fts) VALUES ('rebuild')",
+]
+
+DROP_SQL = [
+    "DROP TRIGGER IF EXISTS core_task_fts_update",
+    "DROP TRIGGER IF EXISTS core_task_fts_delete",
+    "DROP TRIGGER IF EXISTS core_task_fts_insert",
+    "DROP TABLE IF EXISTS core_task_fts",
+]
+
+
+def run_on_sqlite(statements):
+    # other databases search through their own backend (TASK_SEARCH_BACKENDS)
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor == "sqlite":
+            for sql in statements:
+                schema_editor.execute(sql)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0006_taskcounter"),
+    ]
+
+    operations = [
+        migrations.RunPython(run_on_sqlite(CREATE_SQL), run_on_sqlite(DROP_SQL)),
+    ]
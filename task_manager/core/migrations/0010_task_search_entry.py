@@ -0,0 +1,38 @@
+# Hand-written migration: model state for the unmanaged TaskSearchEntry,
+# whose table 0007 creates.
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0009_task_archive"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TaskSearchEntry",
+            fields=[
+                (
+                    "task",
+                    models.OneToOneField(
+                        db_column="rowid",
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        primary_key=True,
+                        related_name="search_entry",
+                        serialize=False,
+                        to="core.task",
+                    ),
+                ),
+                ("query", models.TextField(db_column="core_task_fts")),
+                ("rank", models.FloatField()),
+            ],
+            options={
+                "db_table": "core_task_fts",
+                "managed": False,
+            },
+        ),
+    ]
@@ -1,3 +1,8 @@
 from .company import Company
 from .user import User
 from .task import Task
+from .task_archive import TaskArchive
+from .task_search_entry import TaskSearchEntry
+from .task_change import TaskChange
+from .task_counter import TaskCounter
+from .job import Job
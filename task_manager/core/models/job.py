@@ -0,0 +1,89 @@
+# core/models/job.py
+from django.db import models
+from django.utils import timezone
+from .user import User
+from .company import Company
+
+
+class Job(models.Model):
+    """
+    A unit of background work, run by the ``run_jobs`` worker.
+
+    ``kind`` names a handler registered in core.jobs and ``payload`` is
+    its JSON input. A job is QUEUED until a worker claims it (RUNNING,
+    ``locked_by``/``locked_at`` set); a failed attempt puts it back in the
+    queue with ``run_after`` pushed out, until ``max_attempts`` is used up.
+    ``idempotency_key`` (the client's Idempotency-Key header) is unique per
+    user, so a retried request gets the job it already enqueued.
+    """
+
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+
+    STATUS_CHOICES = (
+        (QUEUED, "Queued"),
+        (RUNNING, "Running"),
+        (SUCCEEDED, "Succeeded"),
+        (FAILED, "Failed"),
+    )
+
+    kind = models.CharField(max_length=64)
+    payload = models.JSONField(default=dict)
+
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=QUEUED)
+
+    company = models.ForeignKey(
+        Company,
+        on_delete=models.CASCADE,
+        related_name="+"
+    )
+
+    created_by = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="+"
+    )
+
+    idempotency_key = models.CharField(max_length=255, null=True, blank=True)
+
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField()
+    run_after = models.DateTimeField(default=timezone.now)
+
+    locked_by = models.CharField(max_length=255, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["created_by", "idempotency_key"],
+                condition=models.Q(idempotency_key__isnull=False),
+                name="job_idempotency_key",
+            ),
+        ]
+        indexes = [
+            # the claim query: due queued jobs, oldest first
+            models.Index(
+                fields=["run_after", "id"],
+                condition=models.Q(status="QUEUED"),
+                name="job_queued_idx",
+            ),
+            # stale lease recovery
+            models.Index(
+                fields=["locked_at"],
+                condition=models.Q(status="RUNNING"),
+                name="job_running_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.kind} #{self.id} ({self.status})"
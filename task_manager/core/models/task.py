@@ -3,6 +3,62 @@ from django.db import models
 from .user import User
 from .company import Company
 
+
+class TaskQuerySet(models.QuerySet):
+    def for_user(self, user):
+        """
+        Tasks visible to ``user``: managers see the tasks they created,
+        reportees see the tasks assigned to them, both within their company.
+        Live ones only through Task.objects.
+        """
+        if user.role == "MANAGER":
+            return self.filter(
+                created_by_id=user.id,
+                company_id=user.company_id
+            )
+
+        if user.role == "REPORTEE":
+            return self.filter(
+                assigned_to_id=user.id,
+                company_id=user.company_id
+            )
+
+        return self.none()
+
+    def apply_list_filters(self, params):
+        """
+        Narrow a listing by the validated query params of
+        TaskListQuerySerializer; absent params do not filter.
+        """
+        return self.filter(**{
+            lookup: params[name]
+            for name, lookup in LIST_FILTERS.items()
+            if params.get(name) is not None
+        })
+
+
+class LiveTaskManager(models.Manager.from_queryset(TaskQuerySet)):
+    """
+    Default manager: soft-deleted tasks are left out of every query, so
+    views never filter ``is_deleted`` themselves. Task.all_objects sees
+    them too.
+    """
+
+    def get_queryset(self):
+        return super().get_queryset().filter(is_deleted=False)
+
+
+# list query param -> ORM lookup
+LIST_FILTERS = {
+    "status": "status__in",
+    "assigned_to": "assigned_to_id",
+    "created_after": "created_at__gte",
+    "created_before": "created_at__lt",
+    "updated_after": "updated_at__gte",
+    "updated_before": "updated_at__lt",
+}
+
+
 class Task(models.Model):
     STATUS_CHOICES = (
         ("DEV", "Development"),
@@ -45,5 +101,41 @@ class Task(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = LiveTaskManager()
+    all_objects = TaskQuerySet.as_manager()
+
+    # orderings the list endpoint accepts; each one is served by the
+    # indexes below (ascending by scanning them backwards), id breaks ties
+    LIST_ORDERINGS = ("-created_at", "created_at", "-updated_at", "updated_at")
+
+    class Meta:
+        # saves, related lookups and cascades must reach deleted tasks too
+        base_manager_name = "all_objects"
+        indexes = [
+            # manager task list, in cursor order (created_at, id)
+            models.Index(
+                fields=["company", "created_by", "-created_at", "-id"],
+                condition=models.Q(is_deleted=False),
+                name="task_company_creator_live_idx",
+            ),
+            # reportee task list, in cursor order (created_at, id)
+            models.Index(
+                fields=["company", "assigned_to", "-created_at", "-id"],
+                condition=models.Q(is_deleted=False),
+                name="task_company_assignee_live_idx",
+            ),
+            # same two lists ordered by last change (updated_at, id)
+            models.Index(
+                fields=["company", "created_by", "-updated_at", "-id"],
+                condition=models.Q(is_deleted=False),
+                name="task_creator_updated_live_idx",
+            ),
+            models.Index(
+                fields=["company", "assigned_to", "-updated_at", "-id"],
+                condition=models.Q(is_deleted=False),
+                name="task_assignee_updated_live_idx",
+            ),
+        ]
+
     def __str__(self):
         return self.title
\ No newline at end of file
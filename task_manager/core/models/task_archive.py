@@ -0,0 +1,85 @@
+# core/models/task_archive.py
+from django.db import models
+from .user import User
+from .company import Company
+from .task import Task
+
+
+class TaskArchiveQuerySet(models.QuerySet):
+    def for_user(self, user):
+        """
+        Archived tasks ``user`` could see when they were live (same rules
+        as TaskQuerySet.for_user), deleted ones included.
+        """
+        if user.role == "MANAGER":
+            return self.filter(created_by_id=user.id, company_id=user.company_id)
+
+        if user.role == "REPORTEE":
+            return self.filter(assigned_to_id=user.id, company_id=user.company_id)
+
+        return self.none()
+
+
+class TaskArchive(models.Model):
+    """
+    Tasks moved out of core_task by ``archive_tasks``: deleted or completed
+    ones untouched for a while. Rows keep the task's id and fields as they
+    were, so the hot table (and its indexes and counts) only holds current
+    work and history is still there to read (GET tasks/archive).
+    """
+
+    id = models.BigIntegerField(primary_key=True)   # the task's id
+
+    title = models.CharField(max_length=255)
+    description = models.TextField(blank=True)
+    status = models.CharField(max_length=20, choices=Task.STATUS_CHOICES)
+
+    assigned_to = models.ForeignKey(
+        User,
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="+"
+    )
+
+    created_by = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="+"
+    )
+
+    company = models.ForeignKey(
+        Company,
+        on_delete=models.CASCADE,
+        related_name="+"
+    )
+
+    is_deleted = models.BooleanField()
+
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    objects = TaskArchiveQuerySet.as_manager()
+
+    # fields copied from the task as they are
+    TASK_FIELDS = (
+        "id", "title", "description", "status", "assigned_to_id",
+        "created_by_id", "company_id", "is_deleted", "created_at", "updated_at",
+    )
+
+    class Meta:
+        indexes = [
+            # GET tasks/archive, newest change first (updated_at, id)
+            models.Index(
+                fields=["company", "created_by", "-updated_at", "-id"],
+                name="taskarchive_creator_idx",
+            ),
+            models.Index(
+                fields=["company", "assigned_to", "-updated_at", "-id"],
+                name="taskarchive_assignee_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return self.title
@@ -0,0 +1,48 @@
+# core/models/task_change.py
+from django.db import models
+from .user import User
+from .task import Task
+
+
+class TaskChange(models.Model):
+    """
+    Append-only log of task writes, one row per affected user.
+
+    The auto-increment id is the change sequence clients sync against
+    (TaskChangesAPIView) and the event id of the SSE stream. A row only says *that* the task changed for
+    this user; the current state is read from the task itself, so a task
+    that is deleted or has left the user's scope becomes a tombstone.
+    """
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="+",
+        db_index=False   # covered by taskchange_user_seq_idx
+    )
+
+    # no constraint: entries outlive tasks moved to the archive (clients
+    # still need the tombstone); prune_task_changes ages them out
+    task = models.ForeignKey(
+        Task,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+"
+    )
+
+    KIND_CHOICES = (
+        ("created", "Created"),
+        ("assigned", "Assigned"),
+        ("status", "Status changed"),
+        ("deleted", "Deleted"),
+    )
+
+    kind = models.CharField(max_length=16, choices=KIND_CHOICES)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # "changes for this user after sequence N", in sequence order
+            models.Index(fields=["user", "id"], name="taskchange_user_seq_idx"),
+        ]
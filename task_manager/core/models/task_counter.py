@@ -0,0 +1,42 @@
+# core/models/task_counter.py
+from django.db import models
+from .user import User
+from .company import Company
+from .task import Task
+
+
+class TaskCounter(models.Model):
+    """
+    Live task count per (company, user, status), the dashboard summary.
+
+    A task counts for its creator and for its assignee, i.e. in the same
+    lists Task.objects.for_user() returns. Kept in step by the write paths
+    through core.summary.record_task_counts; rebuild_task_summary
+    recomputes it and reports drift.
+    """
+
+    company = models.ForeignKey(
+        Company,
+        on_delete=models.CASCADE,
+        related_name="+",
+        db_index=False   # covered by taskcounter_key
+    )
+
+    user = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="+"
+    )
+
+    status = models.CharField(max_length=20, choices=Task.STATUS_CHOICES)
+
+    # not Positive: a drifted row must not make task writes fail
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["company", "user", "status"],
+                name="taskcounter_key"
+            ),
+        ]
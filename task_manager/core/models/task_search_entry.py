@@ -0,0 +1,32 @@
+# core/models/task_search_entry.py
+from django.db import models
+from .task import Task
+
+
+class TaskSearchEntry(models.Model):
+    """
+    A row of the ``core_task_fts`` FTS5 index (migration 0007), declared
+    so search can join it to core_task through the ORM. The table and the
+    triggers filling it are SQLite-only and created by SQL, hence
+    ``managed = False``.
+
+    ``query`` is the table's hidden column of the same name: filtering on
+    it compiles to ``core_task_fts.core_task_fts = %s``, which FTS5 reads
+    as MATCH. ``rank`` is the configured bm25() of that match.
+    """
+
+    task = models.OneToOneField(
+        Task,
+        primary_key=True,
+        db_column="rowid",
+        db_constraint=False,
+        on_delete=models.DO_NOTHING,
+        related_name="search_entry"
+    )
+
+    query = models.TextField(db_column="core_task_fts")
+    rank = models.FloatField()
+
+    class Meta:
+        managed = False
+        db_table = "core_task_fts"
@@ -1,5 +1,6 @@
 # core/models/user.py
 from django.db import models
+from django.contrib.auth.hashers import check_password
 from django.contrib.auth.models import (
     AbstractBaseUser,
     PermissionsMixin,
@@ -14,9 +15,10 @@ class UserManager(BaseUserManager):
         if not username:
             raise ValueError("Username is required")
 
-        if "company" not in extra_fields:
+        if "company" not in extra_fields and "company_id" not in extra_fields:
             raise ValueError("User must belong to a company")
 
+        # hashed before the INSERT: one query, no follow-up UPDATE
         user = self.model(username=username, **extra_fields)
         user.set_password(password)
         user.save(using=self._db)
@@ -68,5 +70,22 @@ class User(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD = "username"
     REQUIRED_FIELDS = []
 
+    def check_password(self, raw_password):
+        """
+        Django's check, with the rehash (the stored hash predates the
+        current hashing profile) saved as such: signals treat it as the
+        same password, so it keeps the user's sessions and tokens.
+        """
+        def setter(raw_password):
+            self.set_password(raw_password)
+            self._password = None
+            self._rehashing_password = True
+            try:
+                self.save(update_fields=["password"])
+            finally:
+                del self._rehashing_password
+
+        return check_password(raw_password, self.password, setter)
+
     def __str__(self):
         return self.username
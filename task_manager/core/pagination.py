@@ -0,0 +1,125 @@
+# core/pagination.py
+import base64
+import json
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+DEFAULT_ORDERING = "-created_at"
+
+
+def encode_cursor(value, task_id, ordering=DEFAULT_ORDERING):
+    """
+    Opaque cursor pointing at the last task of a page, tied to the
+    ordering it was issued for.
+    """
+    raw = json.dumps([value.isoformat(), task_id, ordering], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor, ordering=DEFAULT_ORDERING):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        value, task_id, *issued_for = json.loads(base64.urlsafe_b64decode(padded))
+        value = parse_datetime(value)
+    except (ValueError, TypeError):
+        raise InvalidCursor("Invalid cursor")
+
+    # cursors from before orderings existed carry no ordering
+    issued_for = issued_for[0] if issued_for else DEFAULT_ORDERING
+
+    if value is None or not isinstance(task_id, int) or issued_for != ordering:
+        raise InvalidCursor("Invalid cursor")
+
+    return value, task_id
+
+
+def encode_search_cursor(rank, task_id, terms):
+    """
+    Cursor after the last result of a search page, tied to the query's
+    words. Ranks are floats and survive the JSON round trip exactly.
+    """
+    raw = json.dumps([rank, task_id, " ".join(terms)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_search_cursor(cursor, terms):
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        rank, task_id, issued_for = json.loads(base64.urlsafe_b64decode(padded))
+    except (ValueError, TypeError):
+        raise InvalidCursor("Invalid cursor")
+
+    if (
+        not isinstance(rank, (int, float)) or isinstance(rank, bool)
+        or not isinstance(task_id, int) or issued_for != " ".join(terms)
+    ):
+        raise InvalidCursor("Invalid cursor")
+
+    return rank, task_id
+
+
+def seek_after_cursor(qs, cursor, page_size, ordering=DEFAULT_ORDERING):
+    """
+    Slice of ``qs`` holding the page after ``cursor`` plus one extra row,
+    in ``ordering`` (a datetime field, "-" for descending) with id as the
+    tie-breaker. Shared by the sync and async paginators.
+    """
+    field = ordering.lstrip("-")
+    descending = ordering.startswith("-")
+    qs = qs.order_by(ordering, "-id" if descending else "id")
+
+    if cursor:
+        value, task_id = decode_cursor(cursor, ordering)
+        past = "lt" if descending else "gt"
+        qs = qs.filter(
+            Q(**{f"{field}__{past}": value})
+            | Q(**{field: value, f"id__{past}": task_id})
+        )
+
+    # one extra row tells us whether another page exists
+    return qs[:page_size + 1]
+
+
+def _cursor_page(tasks, page_size, ordering, position):
+    next_cursor = None
+    if len(tasks) > page_size:
+        tasks = tasks[:page_size]
+        if position is None:
+            last = tasks[-1]
+            value, task_id = getattr(last, ordering.lstrip("-")), last.id
+        else:
+            value, task_id = position(tasks[-1])
+        next_cursor = encode_cursor(value, task_id, ordering)
+
+    return tasks, next_cursor
+
+
+def paginate_by_cursor(qs, cursor, page_size, ordering=DEFAULT_ORDERING, position=None):
+    """
+    Keyset pagination on (<ordering field>, id).
+
+    Seeks past the cursor instead of using OFFSET, so every page costs one
+    query no matter how deep the client scrolls.
+    Returns (tasks, next_cursor); next_cursor is None on the last page.
+
+    ``qs`` may yield rows other than Task instances (e.g. values_list());
+    ``position`` then returns a row's (ordering value, id).
+    """
+    tasks = list(seek_after_cursor(qs, cursor, page_size, ordering))
+    return _cursor_page(tasks, page_size, ordering, position)
+
+
+async def apaginate_by_cursor(qs, cursor, page_size, ordering=DEFAULT_ORDERING, position=None):
+    """
+    Async variant of paginate_by_cursor.
+    """
+    tasks = [
+        task async for task in seek_after_cursor(qs, cursor, page_size, ordering)
+    ]
+    return _cursor_page(tasks, page_size, ordering, position)
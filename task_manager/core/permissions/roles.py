@@ -5,6 +5,7 @@ ROLE_PERMISSIONS = {
         "task:update:any",
         "task:delete",
         "reportee:create",
+        "reportee:offboard",
         "task:view:any",
     },
     "REPORTEE": {
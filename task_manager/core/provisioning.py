@@ -0,0 +1,120 @@
+# core/provisioning.py
+"""
+Creating reportees in bulk, for POST users/reportees/bulk and the
+``import_reportees`` command.
+
+Rows are handled a chunk at a time: each chunk is validated row by row,
+checked against existing usernames with one ``IN`` query, hashed by the
+caller's ``hash_passwords`` (a thread or process pool) and inserted with
+one bulk_create in one transaction. Rows come back as results by index,
+like POST tasks/bulk.
+"""
+import csv
+import io
+import json
+from itertools import islice
+
+from django.db import IntegrityError, transaction
+
+from core.config import REPORTEE_IMPORT_CHUNK_SIZE
+from core.hashers import hash_passwords as pooled_hash_passwords
+from core.models import User
+from core.serializers.user import ReporteeImportRowSerializer
+
+IMPORT_FORMATS = ("csv", "json", "ndjson")
+
+
+def read_reportee_rows(stream, fmt):
+    """
+    Rows of a binary import file: CSV with a header row (``username``,
+    ``password``), a JSON array, or NDJSON (one object per line). CSV and
+    NDJSON are read as they are consumed.
+    """
+    if fmt == "json":
+        return json.load(stream)
+
+    text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+    if fmt == "csv":
+        return csv.DictReader(text)
+    return (json.loads(line) for line in text if line.strip())
+
+
+def provision_reportee_chunk(manager, rows, start=0, hash_passwords=pooled_hash_passwords):
+    """
+    Create the valid ``rows`` as reportees of ``manager``. Returns one
+    result per row, indexed from ``start``: ``{"index", "id", "username"}``
+    or ``{"index", "errors"}``.
+    """
+    results = [None] * len(rows)
+    valid = {}   # username -> (position, validated row)
+
+    for position, row in enumerate(rows):
+        serializer = ReporteeImportRowSerializer(data=row)
+        if not serializer.is_valid():
+            results[position] = {"index": start + position, "errors": serializer.errors}
+        elif serializer.validated_data["username"] in valid:
+            results[position] = {
+                "index": start + position,
+                "errors": {"username": ["Duplicate username in this batch"]},
+            }
+        else:
+            valid[serializer.validated_data["username"]] = (position, serializer.validated_data)
+
+    def drop_taken():
+        # Check every username of the chunk with a single query; returns
+        # how many were taken
+        taken = User.objects.filter(username__in=list(valid)).values_list("username", flat=True)
+        for username in taken:
+            position, _ = valid.pop(username)
+            results[position] = {
+                "index": start + position,
+                "errors": {"username": ["Username already exists"]},
+            }
+        return len(taken)
+
+    drop_taken()
+
+    # hash only rows that can still be created
+    hashes = dict(zip(valid, hash_passwords([data["password"] for _, data in valid.values()])))
+
+    while valid:
+        users = [
+            User(
+                username=username,
+                password=hashes[username],
+                role="REPORTEE",
+                company_id=manager.company_id,
+                manager_id=manager.id
+            )
+            for username in valid
+        ]
+        try:
+            with transaction.atomic():
+                created = User.objects.bulk_create(users)
+        except IntegrityError:
+            # a username was taken since the check: drop it and retry.
+            # Anything else (the manager or company deleted meanwhile)
+            # would fail the same way again.
+            if not drop_taken():
+                raise
+            continue
+
+        for user in created:
+            position, _ = valid[user.username]
+            results[position] = {"index": start + position, "id": user.id, "username": user.username}
+        break
+
+    return results
+
+
+def provision_reportees(manager, rows, chunk_size=REPORTEE_IMPORT_CHUNK_SIZE, hash_passwords=pooled_hash_passwords):
+    """
+    Run provision_reportee_chunk over ``rows`` (any iterable, consumed a
+    chunk at a time) and yield each chunk's results.
+    """
+    rows = iter(rows)
+    start = 0
+
+    while chunk := list(islice(rows, chunk_size)):
+        yield provision_reportee_chunk(manager, chunk, start=start, hash_passwords=hash_passwords)
+        start += len(chunk)
@@ -0,0 +1,123 @@
+# core/rendering.py
+"""
+Schema-specific JSON encoding for task list pages.
+
+Pages are fetched as ``values_list`` tuples in TASK_ROW_COLUMNS order and
+encoded straight to bytes: no model instances, no per-task dicts on the
+stdlib path, and no type dispatch per value. The output is byte for byte
+what JSONRenderer makes of TaskListAPIView.serialize_task() dicts, so
+clients and cached pages cannot tell the paths apart.
+
+orjson is used when it is installed; the stdlib encoder is the fallback.
+"""
+import json
+import time
+from operator import itemgetter
+
+from django.http import HttpResponse
+
+try:
+    import orjson
+except ImportError:   # optional speedup
+    orjson = None
+
+# values_list() columns of a list row, and the key each one is rendered as
+TASK_ROW_COLUMNS = ("id", "title", "status", "assigned_to_id", "created_at", "updated_at")
+TASK_ROW_KEYS = ("task_id", "title", "status", "assigned_to_id", "created_at", "updated_at")
+
+# JSONRenderer keeps non-ASCII as is but escapes these two for JavaScript
+_JS_UNSAFE = (("\u2028", "\\u2028"), ("\u2029", "\\u2029"))
+
+encode_string = json.encoder.encode_basestring   # C version when available
+
+
+def encode_datetime(value):
+    # same as DRF's JSONEncoder: ISO 8601 with "Z" for UTC
+    text = value.isoformat()
+    if text.endswith("+00:00"):
+        text = text[:-6] + "Z"
+    return '"' + text + '"'
+
+
+def nullable(encode):
+    return lambda value: "null" if value is None else encode(value)
+
+
+def compile_row_encoder(keys, encoders):
+    """
+    Function turning a row tuple into a JSON object string. The keys are
+    encoded once into a %-format template; each column has its own value
+    encoder.
+    """
+    template = "{" + ",".join(encode_string(key) + ":%s" for key in keys) + "}"
+
+    def encode_row(row):
+        return template % tuple([encode(value) for encode, value in zip(encoders, row)])
+
+    return encode_row
+
+
+encode_task_row = compile_row_encoder(
+    TASK_ROW_KEYS,
+    (str, encode_string, encode_string, nullable(str), encode_datetime, encode_datetime)
+)
+
+
+def task_row_position(ordering):
+    """
+    (ordering value, id) of a row, for the next-page cursor.
+    """
+    return itemgetter(TASK_ROW_COLUMNS.index(ordering.lstrip("-")), 0)
+
+
+def _stdlib_encode_task_page(meta, rows):
+    """
+    JSON bytes of a list page: the ``meta`` keys, then "tasks" rendered
+    from ``rows`` (TASK_ROW_COLUMNS tuples).
+    """
+    head = json.dumps(meta, ensure_ascii=False, separators=(",", ":"))[:-1]
+    if meta:
+        head += ","
+
+    content = head + '"tasks":[' + ",".join(map(encode_task_row, rows)) + "]}"
+    for char, escaped in _JS_UNSAFE:
+        content = content.replace(char, escaped)
+
+    return content.encode()
+
+
+def _orjson_encode_task_page(meta, rows):
+    """
+    Same output as _stdlib_encode_task_page, built by orjson.
+    """
+    content = orjson.dumps(
+        {**meta, "tasks": [dict(zip(TASK_ROW_KEYS, row)) for row in rows]},
+        option=orjson.OPT_UTC_Z
+    )
+    for char, escaped in _JS_UNSAFE:
+        content = content.replace(char.encode(), escaped.encode())
+
+    return content
+
+
+if orjson is not None:
+    TASK_PAGE_ENCODER = "orjson"
+    encode_task_page = _orjson_encode_task_page
+else:
+    TASK_PAGE_ENCODER = "stdlib"
+    encode_task_page = _stdlib_encode_task_page
+
+
+def json_response(request, encode, *args, status=200):
+    """
+    HttpResponse holding ``encode(*args)``; the encoding time is reported
+    as serialization time by the instrumentation middleware.
+    """
+    started = time.perf_counter()
+    content = encode(*args)
+
+    metrics = getattr(request, "request_metrics", None)
+    if metrics is not None:
+        metrics.serialization_time += time.perf_counter() - started
+
+    return HttpResponse(content, status=status, content_type="application/json")
@@ -0,0 +1,112 @@
+# core/routers.py
+"""
+Read-replica routing.
+
+Views that only read (task list, summary, export, auth/me) open a replica
+scope once the user is authenticated; inside it PrimaryReplicaRouter sends
+reads of this app's models to one of settings.READ_REPLICAS. Everything
+else (writes, sessions, auth, any view without the scope) stays on the
+primary.
+
+Read-your-writes: every task write pins the affected users to the primary
+for REPLICA_STICKY_SECONDS, longer than the replicas are expected to lag,
+so they never read their own change from a replica that has not caught up.
+Pins live in the shared REPLICA_PIN_CACHE_ALIAS, so a write on one worker
+pins the reads every other worker serves.
+"""
+import random
+from contextvars import ContextVar
+
+from django.conf import settings
+from django.core.cache import caches
+
+from core.config import REPLICA_PIN_CACHE_ALIAS, REPLICA_STICKY_SECONDS
+
+# alias reads go to in the current replica scope, None outside of one
+replica_alias = ContextVar("replica_alias", default=None)
+
+
+def _pin_key(user_id):
+    return f"core:replica:pinned:{user_id}"
+
+
+def pin_to_primary(*user_ids):
+    """
+    Send these users' reads to the primary for the sticky window.
+    """
+    caches[REPLICA_PIN_CACHE_ALIAS].set_many(
+        {_pin_key(user_id): True for user_id in user_ids if user_id is not None},
+        REPLICA_STICKY_SECONDS
+    )
+
+
+def is_pinned_to_primary(user_id):
+    return caches[REPLICA_PIN_CACHE_ALIAS].get(_pin_key(user_id), False)
+
+
+def choose_replica(user):
+    """
+    A replica alias for ``user``'s reads, or None to read from the primary.
+    """
+    if not settings.READ_REPLICAS or is_pinned_to_primary(user.id):
+        return None
+
+    return random.choice(settings.READ_REPLICAS)
+
+
+def enter_replica_scope(user):
+    """
+    Start routing reads for ``user``; pass the result to exit_replica_scope.
+    """
+    return replica_alias.set(choose_replica(user))
+
+
+def exit_replica_scope(token):
+    replica_alias.reset(token)
+
+
+def is_reading_from_replica():
+    return replica_alias.get() is not None
+
+
+class PrimaryReplicaRouter:
+    """
+    Reads of core models go to the scope's replica; everything else is
+    left to Django's defaults ("default", or the instance's database).
+    """
+
+    def db_for_read(self, model, **hints):
+        alias = replica_alias.get()
+        if alias is not None and model._meta.app_label == "core":
+            return alias
+        return None
+
+    def db_for_write(self, model, **hints):
+        # an instance read from a replica is still saved to the primary
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db in settings.READ_REPLICAS:
+            return "default"
+        return None
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # replicas hold the same rows as the primary
+        return True
+
+
+class ReplicaReadsMixin:
+    """
+    For DRF views that only read: route the handler's queries through a
+    replica scope. Authentication runs before the scope, on the primary.
+    """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self.replica_token = enter_replica_scope(request.user)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        token = getattr(self, "replica_token", None)
+        if token is not None:
+            self.replica_token = None
+            exit_replica_scope(token)
+
+        return super().finalize_response(request, response, *args, **kwargs)
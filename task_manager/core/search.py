@@ -0,0 +1,137 @@
+# core/search.py
+"""
+Full-text task search.
+
+A backend turns a task queryset scoped to one company plus the query's
+words into the matching tasks, best match first, and seeks past a (rank, id) cursor.
+Lower ranks are better, as with SQLite's bm25().
+
+On SQLite the index is the ``core_task_fts`` FTS5 table (migration 0007):
+an external-content index over core_task, kept in step by triggers, so
+bulk_create, queryset updates and raw SQL cannot leave it stale. Every
+other database gets ContainsSearchBackend, a plain icontains scan; a
+native index (e.g. PostgreSQL tsvector + GIN) plugs in behind the same
+methods through TASK_SEARCH_BACKENDS.
+"""
+import re
+from functools import lru_cache
+
+from django.db import DatabaseError, connections
+from django.db.models import Case, F, FloatField, Q, Value, When
+from django.utils.module_loading import import_string
+
+from core.config import TASK_SEARCH_BACKENDS, TASK_SEARCH_FALLBACK_BACKEND, TASK_SEARCH_MAX_TERMS
+
+_WORD = re.compile(r"\w+")
+
+
+def search_terms(query):
+    """
+    The words of a search query, lowercased and deduplicated. Operators and
+    punctuation are dropped, so user input never reaches the index's query
+    syntax.
+    """
+    return list(dict.fromkeys(_WORD.findall(query.lower())))[:TASK_SEARCH_MAX_TERMS]
+
+
+class SQLiteFTSSearchBackend:
+    """
+    FTS5 over title (weighted 10) and description; the last word is
+    matched as a prefix for search-as-you-type. The index drives the
+    query and each match is joined to its task by primary key, so the
+    cost follows the number of matches, not the size of the table. The
+    company id is indexed too and ANDed into every query, which keeps
+    other tenants' matches out of the ranking.
+    """
+
+    table = "core_task_fts"
+
+    def match_expression(self, terms, company_id):
+        words = " ".join(f'"{term}"' for term in terms) + "*"
+        return f'company_id : "{company_id}" AND {{title description}} : ({words})'
+
+    def search(self, qs, terms, company_id, after=None):
+        # joined through TaskSearchEntry: core_task_fts MATCH ... drives
+        # the query, core_task is looked up by rowid
+        qs = qs.filter(
+            search_entry__query=self.match_expression(terms, company_id)
+        ).annotate(search_rank=F("search_entry__rank"))
+
+        if after is not None:
+            rank, task_id = after
+            qs = qs.filter(Q(search_rank__gt=rank) | Q(search_rank=rank, id__gt=task_id))
+
+        return qs.order_by("search_rank", "id")
+
+    def run(self, using, command):
+        with connections[using].cursor() as cursor:
+            cursor.execute(f"INSERT INTO {self.table}({self.table}) VALUES (%s)", [command])
+
+    def rebuild(self, using="default"):
+        """
+        Reindex every task from core_task.
+        """
+        self.run(using, "rebuild")
+
+    def optimize(self, using="default"):
+        """
+        Merge the index's segments into one; worth it after big imports.
+        """
+        self.run(using, "optimize")
+
+    def check(self, using="default"):
+        """
+        True when the index matches the tasks.
+        """
+        with connections[using].cursor() as cursor:
+            try:
+                cursor.execute(
+                    f"INSERT INTO {self.table}({self.table}, rank) VALUES ('integrity-check', 1)"
+                )
+            except DatabaseError:
+                return False
+        return True
+
+
+class ContainsSearchBackend:
+    """
+    Unindexed fallback: every word must appear in the title or the
+    description, and tasks matching all of them in the title come first.
+    Scans the tenant's tasks on every query.
+    """
+
+    def search(self, qs, terms, company_id, after=None):
+        in_title = Q()
+        for term in terms:
+            qs = qs.filter(Q(title__icontains=term) | Q(description__icontains=term))
+            in_title &= Q(title__icontains=term)
+
+        qs = qs.annotate(search_rank=Case(
+            When(in_title, then=Value(-1.0)),
+            default=Value(0.0),
+            output_field=FloatField()
+        ))
+
+        if after is not None:
+            rank, task_id = after
+            qs = qs.filter(Q(search_rank__gt=rank) | Q(search_rank=rank, id__gt=task_id))
+
+        return qs.order_by("search_rank", "id")
+
+    def rebuild(self, using="default"):
+        pass
+
+    def optimize(self, using="default"):
+        pass
+
+    def check(self, using="default"):
+        return True
+
+
+@lru_cache(maxsize=None)
+def get_search_backend(vendor):
+    return import_string(TASK_SEARCH_BACKENDS.get(vendor, TASK_SEARCH_FALLBACK_BACKEND))()
+
+
+def search_backend_for(using):
+    return get_search_backend(connections[using].vendor)
@@ -0,0 +1,17 @@
+from rest_framework import serializers
+
+from core.config import JOB_BULK_ASSIGN_MAX_SIZE
+
+
+class TaskBulkAssignJobSerializer(serializers.Serializer):
+    task_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=JOB_BULK_ASSIGN_MAX_SIZE
+    )
+    assigned_to_id = serializers.IntegerField()
+
+
+class ReporteeOffboardSerializer(serializers.Serializer):
+    # leave out to unassign the reportee's tasks
+    reassign_to_id = serializers.IntegerField(required=False)
@@ -1,5 +1,7 @@
 from rest_framework import serializers
 from core.models import Task, User
+from core.config import TASK_BULK_MAX_SIZE
+from core.search import search_terms
 
 
 class TaskCreateSerializer(serializers.Serializer):
@@ -16,3 +18,62 @@ class TaskStatusUpdateSerializer(serializers.Serializer):
     status = serializers.ChoiceField(
         choices=["DEV", "TEST", "STUCK", "COMPLETED"]
     )
+
+
+class TaskBulkAssignSerializer(serializers.Serializer):
+    task_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=TASK_BULK_MAX_SIZE
+    )
+    assigned_to_id = serializers.IntegerField()
+
+
+class TaskBulkStatusUpdateSerializer(serializers.Serializer):
+    task_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        allow_empty=False,
+        max_length=TASK_BULK_MAX_SIZE
+    )
+    status = serializers.ChoiceField(
+        choices=["DEV", "TEST", "STUCK", "COMPLETED"]
+    )
+
+
+class TaskListQuerySerializer(serializers.Serializer):
+    """
+    Query params of the task list. Ranges are half-open: *_after is
+    inclusive, *_before exclusive.
+    """
+    status = serializers.ListField(
+        child=serializers.ChoiceField(
+            choices=["DEV", "TEST", "STUCK", "COMPLETED"]
+        ),
+        required=False
+    )
+    assigned_to = serializers.IntegerField(required=False)
+    created_after = serializers.DateTimeField(required=False)
+    created_before = serializers.DateTimeField(required=False)
+    updated_after = serializers.DateTimeField(required=False)
+    updated_before = serializers.DateTimeField(required=False)
+    ordering = serializers.ChoiceField(
+        choices=Task.LIST_ORDERINGS,
+        default=Task.LIST_ORDERINGS[0]
+    )
+    cursor = serializers.CharField(required=False)
+    page = serializers.IntegerField(min_value=1, required=False)
+
+
+class TaskChangesQuerySerializer(serializers.Serializer):
+    since = serializers.IntegerField(min_value=0, required=False)
+
+
+class TaskSearchQuerySerializer(serializers.Serializer):
+    q = serializers.CharField(max_length=200)
+    cursor = serializers.CharField(required=False)
+
+    def validate(self, attrs):
+        attrs["terms"] = search_terms(attrs["q"])
+        if not attrs["terms"]:
+            raise serializers.ValidationError({"q": "Enter at least one word to search for."})
+        return attrs
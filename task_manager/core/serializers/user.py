@@ -10,3 +10,14 @@ class ReporteeCreateSerializer(serializers.Serializer):
         if User.objects.filter(username=value).exists():
             raise serializers.ValidationError("Username already exists")
         return value
+
+
+class ReporteeImportRowSerializer(ReporteeCreateSerializer):
+    """
+    One row of a batch or import file. Taken usernames are looked up for
+    the whole batch at once (core.provisioning), not per row.
+    """
+    username = serializers.CharField(max_length=255)
+
+    def validate_username(self, value):
+        return value
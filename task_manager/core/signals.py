@@ -0,0 +1,44 @@
+# core/signals.py
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.authentication import invalidate_principal, revoke_user_tokens
+from core.config import SQLITE_PRAGMAS
+from core.models import User
+
+
+@receiver(connection_created)
+def configure_sqlite_connection(sender, connection, **kwargs):
+    """
+    Apply SQLITE_PRAGMAS to each new SQLite connection. A database entry
+    can override them with its own "PRAGMAS" dict (empty: none).
+    """
+    if connection.vendor != "sqlite":
+        return
+
+    pragmas = connection.settings_dict.get("PRAGMAS", SQLITE_PRAGMAS)
+    with connection.cursor() as cursor:
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+
+
+@receiver(post_save, sender=User)
+def invalidate_principal_on_save(sender, instance, update_fields=None, **kwargs):
+    # login() only touches last_login, which the principal does not carry
+    if update_fields is not None and set(update_fields) <= {"last_login"}:
+        return
+
+    # a login rehash stores the same password under the current profile
+    if getattr(instance, "_rehashing_password", False) and set(update_fields) == {"password"}:
+        return
+
+    transaction.on_commit(lambda: invalidate_principal(instance.id))
+    transaction.on_commit(lambda: revoke_user_tokens(instance.id))
+
+
+@receiver(post_delete, sender=User)
+def invalidate_principal_on_delete(sender, instance, **kwargs):
+    transaction.on_commit(lambda: invalidate_principal(instance.id))
+    transaction.on_commit(lambda: revoke_user_tokens(instance.id))
@@ -0,0 +1,159 @@
+# core/summary.py
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import Case, Count, F, Value, When
+
+from core.models import Task, TaskCounter
+
+
+def task_state(task):
+    """
+    The fields of ``task`` that decide which counters it is in.
+    """
+    return (task.company_id, task.created_by_id, task.assigned_to_id, task.status, task.is_deleted)
+
+
+STATE_FIELDS = ("company_id", "created_by_id", "assigned_to_id", "status", "is_deleted")
+
+
+def locked_task_state(task, update_fields=()):
+    """
+    Lock ``task``'s row and return its committed state (see task_state),
+    or None when the row is gone. The committed values of the fields not
+    in ``update_fields`` are copied onto ``task``, so task_state(task)
+    after the save describes the row as written.
+
+    Call it inside the write's transaction, before the save: two writes to
+    one task then move the counters one after the other, each from the
+    state the previous one left, instead of both from the same stale read.
+    """
+    row = Task.all_objects.select_for_update().filter(id=task.id).values(*STATE_FIELDS).first()
+    if row is None:
+        return None
+
+    updated = {Task._meta.get_field(name).attname for name in update_fields}
+    for field, value in row.items():
+        if field not in updated:
+            setattr(task, field, value)
+
+    return tuple(row[field] for field in STATE_FIELDS)
+
+
+def counter_keys(state):
+    company_id, created_by_id, assigned_to_id, status, is_deleted = state
+    if is_deleted:
+        return []
+
+    return [
+        (company_id, user_id, status)
+        for user_id in dict.fromkeys((created_by_id, assigned_to_id))
+        if user_id is not None
+    ]
+
+
+def record_task_counts(before=(), after=()):
+    """
+    Move the TaskCounter rows from the ``before`` to the ``after`` task
+    states (see task_state; leave ``before`` empty for new tasks).
+
+    Call it inside the transaction that makes the write. Costs at most two
+    queries however many tasks changed: an INSERT that makes sure the
+    incremented rows exist, and one UPDATE applying every delta as
+    ``count = count + CASE ...``, so concurrent writers never lose counts.
+    """
+    deltas = Counter()
+    for state in before:
+        deltas.subtract(counter_keys(state))
+    for state in after:
+        deltas.update(counter_keys(state))
+
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+
+    TaskCounter.objects.bulk_create(
+        [
+            TaskCounter(company_id=company_id, user_id=user_id, status=status)
+            for (company_id, user_id, status), delta in deltas.items()
+            if delta > 0
+        ],
+        ignore_conflicts=True
+    )
+
+    # IN lists rather than OR-ing the keys keeps the WHERE clause flat
+    # (SQLite caps expression depth); rows outside ``deltas`` get + 0
+    TaskCounter.objects.filter(
+        company_id__in={company_id for company_id, _, _ in deltas},
+        user_id__in={user_id for _, user_id, _ in deltas}
+    ).update(
+        count=F("count") + Case(
+            *[
+                When(company_id=company_id, user_id=user_id, status=status, then=Value(delta))
+                for (company_id, user_id, status), delta in deltas.items()
+            ],
+            default=Value(0)
+        )
+    )
+
+
+def computed_task_counts():
+    """
+    The counters recomputed from the tasks: {(company, user, status): n}.
+    """
+    counts = Counter()
+    live = Task.objects.order_by()
+
+    for user_field in ("created_by_id", "assigned_to_id"):
+        rows = (
+            live.filter(**{f"{user_field}__isnull": False})
+                .values_list("company_id", user_field, "status")
+                .annotate(n=Count("id"))
+        )
+        for company_id, user_id, status, n in rows:
+            counts[(company_id, user_id, status)] += n
+
+    return counts
+
+
+def summarize(rows):
+    """
+    Dashboard payload for (status, count) rows: every status, plus total.
+    """
+    counts = dict.fromkeys((status for status, _ in Task.STATUS_CHOICES), 0)
+    counts.update(rows)
+
+    return {"counts": counts, "total": sum(counts.values())}
+
+
+def drifted_task_counts():
+    """
+    [(key, stored, actual)] for every counter that disagrees with the tasks.
+    """
+    actual = computed_task_counts()
+    stored = {
+        (company_id, user_id, status): count
+        for company_id, user_id, status, count in
+        TaskCounter.objects.values_list("company_id", "user_id", "status", "count")
+    }
+
+    return [
+        (key, stored.get(key, 0), actual.get(key, 0))
+        for key in sorted(stored.keys() | actual.keys())
+        if stored.get(key, 0) != actual.get(key, 0)
+    ]
+
+
+def rebuild_task_counts(batch_size=1000):
+    """
+    Replace every counter with one recomputed from the tasks.
+    """
+    with transaction.atomic():
+        TaskCounter.objects.all().delete()
+        TaskCounter.objects.bulk_create(
+            [
+                TaskCounter(company_id=company_id, user_id=user_id, status=status, count=count)
+                for (company_id, user_id, status), count in computed_task_counts().items()
+            ],
+            batch_size=batch_size
+        )
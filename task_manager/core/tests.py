@@ -1,3 +1,2672 @@
-from django.test import TestCase
+import asyncio
+import base64
+import csv
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+import uuid
+from datetime import datetime, timedelta
+from unittest import mock
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core import signing
+from django.core.cache import CacheHandler, caches
+from django.core.management import CommandError, call_command
+from django.contrib.auth.hashers import get_hasher, identify_hasher, make_password
+from django.db import DatabaseError, IntegrityError, connection, connections
+from django.test import AsyncClient, Client, RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.http import http_date, parse_http_date
+from rest_framework.renderers import JSONRenderer
+
+from core.authentication import AUTH_TOKEN_SALT, issue_token
+from core.benchmarks import (
+    ASYNC_ROUTES,
+    ApiBenchmark,
+    Scale,
+    percentile,
+    run_benchmark,
+    run_concurrency_benchmark,
+    run_search_benchmark,
+    run_serialization_benchmark,
+    run_write_stress,
+    search_queries,
+    seed,
+    unthrottled_rates,
+)
+from core.bulk_updates import bulk_update_owned_tasks
+from core.cache import get_task_list_version
+from core.checks import PER_PROCESS_CACHE_BACKENDS, check_shared_caches
+from core.config import (
+    AUTH_TOKEN_MAX_AGE,
+    PRINCIPAL_MAX_AGE,
+    REPLICA_PIN_CACHE_ALIAS,
+    REPLICA_STICKY_SECONDS,
+    SQLITE_PRAGMAS,
+    TASK_BULK_MAX_SIZE,
+    TASK_LIST_PAGINATION_SIZE,
+    TASK_LIST_RATE,
+)
+from core.events import SharedCacheEventBackend, get_event_backend
+from core.hashers import run_bounded
+from core.instrumentation import QueryBudgetTestMixin
+from core.jobs import JOB_HANDLERS, JobError, Worker, claim_jobs, enqueue, requeue_stale_jobs
+from core.models import Company, Job, Task, TaskArchive, TaskChange, TaskCounter, User
+from core.pagination import seek_after_cursor
+from core.provisioning import provision_reportee_chunk
+from core.rendering import (
+    TASK_ROW_KEYS,
+    _orjson_encode_task_page,
+    _stdlib_encode_task_page,
+    orjson,
+)
+from core.search import ContainsSearchBackend, SQLiteFTSSearchBackend, search_terms
+from core.summary import drifted_task_counts, locked_task_state
+from core.throttles import SQLiteThrottleBackend, UserRateThrottle
+
+
+def setUpModule():
+    # a shared cache and rate limit counters of its own, so tests never
+    # clear or use up a dev server's
+    tmp = tempfile.TemporaryDirectory()
+    unittest.addModuleCleanup(tmp.cleanup)
+
+    shared = {**settings.CACHES["shared"], "LOCATION": os.path.join(tmp.name, "cache")}
+    overrides = override_settings(CACHES={**settings.CACHES, "shared": shared})
+    overrides.enable()
+    unittest.addModuleCleanup(overrides.disable)
+
+    throttles = isolate_throttles(tmp.name)
+    unittest.addModuleCleanup(throttles.stop)
+
+
+def isolate_throttles(directory):
+    """
+    Count rate limits in a fresh SQLite file in ``directory`` until the
+    returned patcher is stopped.
+    """
+    path = os.path.join(directory, f"throttle-{uuid.uuid4().hex}.sqlite3")
+    patcher = mock.patch(
+        "core.throttles.get_throttle_backend",
+        return_value=SQLiteThrottleBackend(path)
+    )
+    patcher.start()
+    return patcher
+
+
+def other_process_caches():
+    """
+    The caches another process (a second web worker, ``run_jobs``) opens
+    from the same settings: file, database and network backends reach the
+    same entries, locmem ones start out empty.
+    """
+    return CacheHandler({
+        alias: (
+            {**config, "LOCATION": f"other-process:{alias}"}
+            if config["BACKEND"].endswith(".LocMemCache") else config
+        )
+        for alias, config in settings.CACHES.items()
+    })
+
+
+class AcmeTestCase(TestCase):
+    """
+    One company, "Acme", with ``manager`` and their reportees named in
+    ``reportee_names`` (``reportee`` is the first), plus ``other_manager``
+    when ``with_other_manager`` is set. Caches and rate limit counters
+    start empty in every test.
+    """
+    reportee_names = ("reportee",)
+    with_other_manager = False
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.company = Company.objects.create(name="Acme")
+        cls.manager = cls.create_user("manager", "MANAGER")
+        if cls.with_other_manager:
+            cls.other_manager = cls.create_user("other-manager", "MANAGER")
+
+        cls.reportees = [
+            cls.create_user(username, "REPORTEE", manager=cls.manager)
+            for username in cls.reportee_names
+        ]
+        cls.reportee = cls.reportees[0] if cls.reportees else None
+
+    @classmethod
+    def create_user(cls, username, role, company=None, manager=None):
+        return User.objects.create_user(
+            username=username,
+            password="secret",
+            role=role,
+            company=company or cls.company,
+            manager=manager
+        )
+
+    def setUp(self):
+        for cache in caches.all():
+            cache.clear()
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.addCleanup(isolate_throttles(tmp.name).stop)
+
+    def call(self, user, method, path, payload=None):
+        self.client.force_login(user)
+        response = getattr(self.client, method)(path, payload, content_type="application/json")
+        self.assertLess(response.status_code, 300, response.content)
+        return response.json()
+
+
+class TaskIndexUsageTests(AcmeTestCase):
+    """
+    The task hot paths must be served by the partial composite indexes
+    declared on Task.Meta, not by a table scan plus a sort.
+    """
+
+    def setUp(self):
+        super().setUp()
+        if connection.vendor != "sqlite":
+            self.skipTest("EXPLAIN output is only asserted on SQLite")
+
+    def assertUsesIndex(self, qs, index_name):
+        plan = qs.explain()
+        self.assertIn(f"USING INDEX {index_name}", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_manager_list_uses_creator_index(self):
+        qs = Task.objects.for_user(self.manager).order_by("-created_at", "-id")
+        self.assertUsesIndex(qs[:10], "task_company_creator_live_idx")
+
+    def test_reportee_list_uses_assignee_index(self):
+        qs = Task.objects.for_user(self.reportee).order_by("-created_at", "-id")
+        self.assertUsesIndex(qs[:10], "task_company_assignee_live_idx")
+
+    def test_every_list_ordering_is_served_by_an_index(self):
+        # ascending orderings scan the same indexes backwards
+        indexes = {
+            "created_at": ("task_company_creator_live_idx", "task_company_assignee_live_idx"),
+            "updated_at": ("task_creator_updated_live_idx", "task_assignee_updated_live_idx"),
+        }
+
+        for ordering in Task.LIST_ORDERINGS:
+            creator_idx, assignee_idx = indexes[ordering.lstrip("-")]
+            for user, index_name in ((self.manager, creator_idx), (self.reportee, assignee_idx)):
+                with self.subTest(ordering=ordering, role=user.role):
+                    qs = seek_after_cursor(
+                        Task.objects.for_user(user).apply_list_filters({"status": ["DEV"]}),
+                        None,
+                        10,
+                        ordering
+                    )
+                    self.assertUsesIndex(qs, index_name)
+
+    def test_single_task_lookup_uses_primary_key(self):
+        # id is unique, so the primary key beats any composite index here
+        qs = Task.objects.for_user(self.manager).filter(id=1)
+        self.assertIn("USING INTEGER PRIMARY KEY", qs.explain())
+
+
+@override_settings(
+    REST_FRAMEWORK={
+        **settings.REST_FRAMEWORK,
+        "DEFAULT_THROTTLE_RATES": unthrottled_rates(),
+    }
+)
+class TaskCursorPaginationTests(AcmeTestCase):
+    """
+    Keyset pages on GET /tasks: every task exactly once, a last page
+    without a cursor, and a 400 for cursors the server did not issue.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.manager)
+
+    def create_tasks(self, count):
+        return Task.objects.bulk_create([
+            Task(title=f"Task {i}", created_by=self.manager, company=self.company)
+            for i in range(count)
+        ])
+
+    def pages(self, query=None):
+        pages, cursor = [], None
+        while True:
+            response = self.client.get(
+                "/tasks", {**(query or {}), **({"cursor": cursor} if cursor else {})}
+            )
+            self.assertEqual(response.status_code, 200, response.content)
+            pages.append([task["task_id"] for task in response.json()["tasks"]])
+            cursor = response.json()["next_cursor"]
+            if cursor is None:
+                return pages
+
+    def test_last_page_has_no_cursor(self):
+        tasks = self.create_tasks(2 * TASK_LIST_PAGINATION_SIZE)
+
+        pages = self.pages()
+
+        # a full last page is not followed by an empty one
+        self.assertEqual([len(page) for page in pages], [TASK_LIST_PAGINATION_SIZE] * 2)
+        self.assertEqual(sum(pages, []), sorted((t.id for t in tasks), reverse=True))
+
+    def test_tied_timestamps_are_ordered_by_id(self):
+        tasks = self.create_tasks(2 * TASK_LIST_PAGINATION_SIZE + 3)
+        Task.objects.update(created_at=timezone.now(), updated_at=timezone.now())
+        ids = [t.id for t in tasks]
+
+        for ordering, expected in (
+            ("-created_at", sorted(ids, reverse=True)),
+            ("created_at", sorted(ids)),
+            ("-updated_at", sorted(ids, reverse=True)),
+        ):
+            with self.subTest(ordering=ordering):
+                self.assertEqual(sum(self.pages({"ordering": ordering}), []), expected)
+
+    def test_tasks_created_between_pages_are_not_repeated(self):
+        self.create_tasks(TASK_LIST_PAGINATION_SIZE + 1)
+        first = self.client.get("/tasks").json()
+
+        self.create_tasks(3)
+        second = self.client.get("/tasks", {"cursor": first["next_cursor"]}).json()
+
+        self.assertEqual(len(second["tasks"]), 1)
+        self.assertNotIn(
+            second["tasks"][0]["task_id"],
+            [task["task_id"] for task in first["tasks"]]
+        )
+
+    def test_invalid_cursors_are_rejected(self):
+        self.create_tasks(TASK_LIST_PAGINATION_SIZE + 1)
+        cursor = self.client.get("/tasks").json()["next_cursor"]
+        value, task_id, ordering = json.loads(
+            base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        )
+
+        def forge(*parts):
+            raw = json.dumps(parts).encode()
+            return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+        for cursor in (
+            "not-a-cursor",
+            cursor[:-4],
+            base64.urlsafe_b64encode(b"[1, 2").decode(),
+            forge(value),
+            forge("yesterday", task_id, ordering),
+            forge(value, str(task_id), ordering),
+            forge(value, task_id, "title"),
+        ):
+            with self.subTest(cursor=cursor):
+                response = self.client.get("/tasks", {"cursor": cursor})
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json(), {"detail": "Invalid cursor"})
+
+
+@override_settings(
+    REST_FRAMEWORK={
+        **settings.REST_FRAMEWORK,
+        "DEFAULT_THROTTLE_RATES": unthrottled_rates(),
+    }
+)
+class TaskBulkCreateTests(QueryBudgetTestMixin, AcmeTestCase):
+    """
+    POST tasks/bulk validates every item on its own, reports each one by
+    index and inserts the valid ones with a single bulk_create.
+    """
+    with_other_manager = True
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.other_reportee = cls.create_user("other-reportee", "REPORTEE", manager=cls.other_manager)
+
+    def post(self, user, payload):
+        self.client.force_login(user)
+        return self.client.post("/tasks/bulk", payload, content_type="application/json")
+
+    def test_valid_batch_is_created_with_one_insert(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post(self.manager, [
+                {"title": "Write spec", "assigned_to_id": self.reportee.id},
+                {"title": "Review spec", "description": "Before Friday"},
+            ])
+
+        self.assertEqual(response.status_code, 201, response.content)
+        body = response.json()
+        self.assertEqual((body["created"], body["failed"]), (2, 0))
+        self.assertEqual(
+            [(result["index"], result["assigned_to_id"]) for result in body["results"]],
+            [(0, self.reportee.id), (1, None)]
+        )
+
+        tasks = Task.objects.filter(id__in=[result["id"] for result in body["results"]])
+        self.assertEqual(
+            sorted(tasks.values_list("title", "created_by_id", "company_id")),
+            [("Review spec", self.manager.id, self.company.id), ("Write spec", self.manager.id, self.company.id)]
+        )
+
+        task_inserts = [q for q in queries.captured_queries if q["sql"].startswith('INSERT INTO "core_task"')]
+        self.assertEqual(len(task_inserts), 1)
+
+    def test_invalid_items_are_reported_by_index(self):
+        response = self.post(self.manager, [
+            {"title": "Valid"},
+            {"description": "No title"},
+            {"title": "Not my reportee", "assigned_to_id": self.other_reportee.id},
+            {"title": "Unknown reportee", "assigned_to_id": 999999},
+        ])
+
+        self.assertEqual(response.status_code, 207, response.content)
+        body = response.json()
+        self.assertEqual((body["created"], body["failed"]), (1, 3))
+
+        results = body["results"]
+        self.assertEqual([result["index"] for result in results], [0, 1, 2, 3])
+        self.assertIn("id", results[0])
+        self.assertIn("title", results[1]["errors"])
+        for result in results[2:]:
+            self.assertEqual(
+                result["errors"],
+                {"assigned_to_id": ["Invalid reportee for this manager or company"]}
+            )
+
+        self.assertEqual(list(Task.objects.values_list("title", flat=True)), ["Valid"])
+
+    def test_batch_without_valid_items_creates_nothing(self):
+        response = self.post(self.manager, [{"title": ""}, {"assigned_to_id": self.reportee.id}])
+
+        self.assertEqual(response.status_code, 400, response.content)
+        self.assertEqual(response.json()["created"], 0)
+        self.assertFalse(Task.objects.exists())
+
+    def test_rejected_batches(self):
+        for payload in (
+            [],
+            {"title": "Not a list"},
+            [{"title": f"Task {i}"} for i in range(TASK_BULK_MAX_SIZE + 1)],
+        ):
+            with self.subTest(size=len(payload)):
+                response = self.post(self.manager, payload)
+                self.assertEqual(response.status_code, 400, response.content)
+
+        self.assertFalse(Task.objects.exists())
+
+    def test_batch_of_max_size_is_accepted(self):
+        # assigned tasks log two changes each: the most INSERT batches
+        response = self.post(self.manager, [
+            {"title": f"Task {i}", "assigned_to_id": self.reportee.id} for i in range(TASK_BULK_MAX_SIZE)
+        ])
+
+        self.assertEqual(response.status_code, 201, response.content)
+        self.assertWithinQueryBudget(response)
+        self.assertEqual(Task.objects.count(), TASK_BULK_MAX_SIZE)
+
+    def test_reportees_cannot_create_tasks(self):
+        response = self.post(self.reportee, [{"title": "Mine now"}])
+
+        self.assertEqual(response.status_code, 403)
+        self.assertFalse(Task.objects.exists())
+
+
+@override_settings(
+    REST_FRAMEWORK={
+        **settings.REST_FRAMEWORK,
+        "DEFAULT_THROTTLE_RATES": unthrottled_rates(),
+    }
+)
+class TaskBulkUpdateTests(AcmeTestCase):
+    """
+    tasks/bulk/assign and tasks/bulk/status update the manager's own live
+    tasks with one UPDATE and skip every other id.
+    """
+    reportee_names = ("reportee-0", "reportee-1")
+    with_other_manager = True
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.outsider = cls.create_user("outsider", "REPORTEE", company=Company.objects.create(name="Globex"))
+
+    def setUp(self):
+        super().setUp()
+        self.mine = [
+            Task.objects.create(title=f"Mine {i}", created_by=self.manager, company=self.company)
+            for i in range(3)
+        ]
+        self.theirs = Task.objects.create(title="Theirs", created_by=self.other_manager, company=self.company)
+        self.deleted = Task.objects.create(
+            title="Deleted", created_by=self.manager, company=self.company, is_deleted=True
+        )
+
+    def patch(self, user, path, payload):
+        self.client.force_login(user)
+        return self.client.patch(path, payload, content_type="application/json")
+
+    def test_assign_reports_updated_and_skipped_ids(self):
+        task_ids = [self.mine[2].id, self.theirs.id, 999999, self.mine[0].id, self.deleted.id, self.mine[2].id]
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.patch(self.manager, "/tasks/bulk/assign", {
+                "task_ids": task_ids,
+                "assigned_to_id": self.reportees[1].id,
+            })
+
+        self.assertEqual(response.status_code, 200, response.content)
+        body = response.json()
+        self.assertEqual(body["updated_task_ids"], [self.mine[2].id, self.mine[0].id])
+        self.assertEqual(body["skipped_task_ids"], [self.theirs.id, 999999, self.deleted.id])
+
+        self.assertEqual(
+            dict(Task.all_objects.values_list("id", "assigned_to_id")),
+            {
+                self.mine[0].id: self.reportees[1].id,
+                self.mine[1].id: None,
+                self.mine[2].id: self.reportees[1].id,
+                self.theirs.id: None,
+                self.deleted.id: None,
+            }
+        )
+
+        task_updates = [q for q in queries.captured_queries if q["sql"].startswith('UPDATE "core_task"')]
+        self.assertEqual(len(task_updates), 1)
+
+    def test_assign_needs_a_reportee_of_the_company(self):
+        for assigned_to_id in (self.outsider.id, self.other_manager.id, 999999):
+            with self.subTest(assigned_to_id=assigned_to_id):
+                response = self.patch(self.manager, "/tasks/bulk/assign", {
+                    "task_ids": [self.mine[0].id],
+                    "assigned_to_id": assigned_to_id,
+                })
+                self.assertEqual(response.status_code, 400, response.content)
+
+        self.assertFalse(Task.objects.filter(assigned_to__isnull=False).exists())
+
+    def test_status_reports_updated_and_skipped_ids(self):
+        response = self.patch(self.manager, "/tasks/bulk/status", {
+            "task_ids": [self.mine[0].id, self.theirs.id, self.mine[1].id],
+            "status": "STUCK",
+        })
+
+        self.assertEqual(response.status_code, 200, response.content)
+        body = response.json()
+        self.assertEqual(body["updated_task_ids"], [self.mine[0].id, self.mine[1].id])
+        self.assertEqual(body["skipped_task_ids"], [self.theirs.id])
+        self.assertEqual(
+            dict(Task.objects.values_list("id", "status")),
+            {self.mine[0].id: "STUCK", self.mine[1].id: "STUCK", self.mine[2].id: "DEV", self.theirs.id: "DEV"}
+        )
+
+    def test_nothing_owned_is_a_no_op(self):
+        response = self.patch(self.other_manager, "/tasks/bulk/status", {
+            "task_ids": [task.id for task in self.mine],
+            "status": "COMPLETED",
+        })
+
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json()["updated_task_ids"], [])
+        self.assertFalse(Task.objects.filter(status="COMPLETED").exists())
+
+    def test_rejected_requests(self):
+        for path, payload in (
+            ("/tasks/bulk/assign", {"task_ids": [], "assigned_to_id": self.reportee.id}),
+            ("/tasks/bulk/assign", {"task_ids": list(range(1, TASK_BULK_MAX_SIZE + 2)), "assigned_to_id": self.reportee.id}),
+            ("/tasks/bulk/status", {"task_ids": [self.mine[0].id], "status": "DONE"}),
+            ("/tasks/bulk/status", {"task_ids": list(range(1, TASK_BULK_MAX_SIZE + 2)), "status": "TEST"}),
+        ):
+            with self.subTest(path=path, size=len(payload["task_ids"])):
+                response = self.patch(self.manager, path, payload)
+                self.assertEqual(response.status_code, 400, response.content)
+
+        self.assertFalse(Task.objects.filter(status="TEST").exists())
+
+    def test_reportees_cannot_bulk_update(self):
+        Task.objects.filter(id=self.mine[0].id).update(assigned_to=self.reportee)
+
+        for path, payload in (
+            ("/tasks/bulk/assign", {"task_ids": [self.mine[0].id], "assigned_to_id": self.reportee.id}),
+            ("/tasks/bulk/status", {"task_ids": [self.mine[0].id], "status": "COMPLETED"}),
+        ):
+            with self.subTest(path=path):
+                self.assertEqual(self.patch(self.reportee, path, payload).status_code, 403)
+
+        self.assertEqual(Task.objects.get(id=self.mine[0].id).status, "DEV")
+
+
+@override_settings(
+    REST_FRAMEWORK={
+        **settings.REST_FRAMEWORK,
+        "DEFAULT_THROTTLE_RATES": unthrottled_rates(),
+    }
+)
+class TaskListCacheTests(AcmeTestCase):
+    """
+    Cached task list pages are dropped once a write touching the user
+    commits, and never for a write that rolls back.
+    """
+    reportee_names = ("reportee-0", "reportee-1")
+
+    def setUp(self):
+        super().setUp()
+        self.task = Task.objects.create(
+            title="Cached", created_by=self.manager, assigned_to=self.reportees[0], company=self.company
+        )
+        self.other = Task.objects.create(title="Other", created_by=self.manager, company=self.company)
+
+    def listed(self, user):
+        self.client.force_login(user)
+        response = self.client.get("/tasks")
+        self.assertEqual(response.status_code, 200, response.content)
+        return {task["task_id"]: task["title"] for task in response.json()["tasks"]}
+
+    def prime(self, *users):
+        """
+        Cache the users' first pages, then rename every task behind the
+        cache's back: a page that still matches its snapshot was served
+        from the cache.
+        """
+        self.snapshots = {user.id: self.listed(user) for user in users}
+        Task.all_objects.update(title=f"Renamed {uuid.uuid4().hex}")
+
+    def write(self, user, method, path, payload=None):
+        self.client.force_login(user)
+        response = getattr(self.client, method)(path, payload, content_type="application/json")
+        self.assertLess(response.status_code, 300, response.content)
+
+    def assertCached(self, user):
+        self.assertEqual(self.listed(user), self.snapshots[user.id])
+
+    def assertFresh(self, user):
+        self.assertNotEqual(self.listed(user), self.snapshots[user.id])
+
+    def test_lists_are_served_from_the_cache(self):
+        self.prime(self.manager, self.reportees[0])
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertCached(self.manager)
+        self.assertFalse([q for q in queries.captured_queries if "core_task" in q["sql"]])
+        self.assertCached(self.reportees[0])
+
+    def test_writes_drop_the_lists_of_every_affected_user(self):
+        manager, (assignee, other_reportee) = self.manager, self.reportees
+        writes = [
+            ("create", manager, "post", "/tasks/create", {"title": "New", "assigned_to_id": other_reportee.id}, [other_reportee]),
+            ("bulk create", manager, "post", "/tasks/bulk", [{"title": "New"}], []),
+            ("assign", manager, "patch", f"/tasks/{self.task.id}/assign", {"assigned_to_id": other_reportee.id}, [assignee, other_reportee]),
+            ("bulk assign", manager, "patch", "/tasks/bulk/assign", {"task_ids": [self.task.id], "assigned_to_id": assignee.id}, [assignee, other_reportee]),
+            ("status", manager, "patch", f"/tasks/{self.task.id}/status", {"status": "TEST"}, [assignee]),
+            ("bulk status", manager, "patch", "/tasks/bulk/status", {"task_ids": [self.task.id], "status": "STUCK"}, [assignee]),
+            ("self status", assignee, "patch", f"/tasks/{self.task.id}/self", {"status": "COMPLETED"}, [assignee]),
+            ("delete", manager, "delete", f"/tasks/{self.other.id}", None, []),
+        ]
+
+        for name, writer, method, path, payload, reportees in writes:
+            with self.subTest(write=name):
+                self.prime(manager, *self.reportees)
+
+                with self.captureOnCommitCallbacks(execute=True):
+                    self.write(writer, method, path, payload)
+
+                self.assertFresh(manager)
+                for reportee in self.reportees:
+                    if reportee in reportees:
+                        self.assertFresh(reportee)
+                    else:
+                        self.assertCached(reportee)
+
+    def test_lists_are_dropped_only_once_the_write_commits(self):
+        self.prime(self.manager)
+
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.write(self.manager, "patch", f"/tasks/{self.task.id}/status", {"status": "TEST"})
+
+        self.assertCached(self.manager)
+        for callback in callbacks:
+            callback()
+        self.assertFresh(self.manager)
+
+    def test_rolled_back_writes_keep_the_lists(self):
+        self.prime(self.manager, self.reportees[0])
+        version = get_task_list_version(self.manager.id)
+
+        with (
+            mock.patch("core.views.task.record_task_counts", side_effect=DatabaseError("disk I/O error")),
+            self.captureOnCommitCallbacks(execute=True) as callbacks,
+            self.assertRaises(DatabaseError),
+        ):
+            self.write(self.manager, "patch", f"/tasks/{self.task.id}/status", {"status": "TEST"})
+
+        self.assertEqual(callbacks, [])
+        self.assertEqual(get_task_list_version(self.manager.id), version)
+        self.assertCached(self.manager)
+        self.assertCached(self.reportees[0])
+
+
+@override_settings(
+    REST_FRAMEWORK={
+        **settings.REST_FRAMEWORK,
+        "DEFAULT_THROTTLE_RATES": unthrottled_rates(),
+    }
+)
+class TaskListConditionalGetTests(AcmeTestCase):
+    """
+    GET /tasks answers If-None-Match and If-Modified-Since with a 304
+    until a write changes what the list shows.
+    """
+
+    def setUp(self):
+        super().setUp()
+        an_hour_ago = timezone.now() - timedelta(hours=1)
+        self.tasks = Task.objects.bulk_create([
+            Task(title=f"Task {i}", created_by=self.manager, assigned_to=self.reportee, company=self.company)
+            for i in range(3)
+        ])
+        Task.objects.update(created_at=an_hour_ago, updated_at=an_hour_ago)
+        self.client.force_login(self.manager)
+
+    def get(self, query=None, **headers):
+        return self.client.get("/tasks", query or {}, headers=headers)
+
+    def write(self, method, path, payload=None):
+        # HTTP dates have one second resolution: each write lands 10s
+        # after the previous one
+        self.clock = getattr(self, "clock", time.time()) + 10
+        with (
+            mock.patch("core.cache.time.time", return_value=self.clock),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            response = getattr(self.client, method)(path, payload, content_type="application/json")
+        self.assertLess(response.status_code, 300, response.content)
+
+    def test_validators_are_sent(self):
+        response = self.get()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response["ETag"].startswith('W/"'))
+        self.assertIn("Last-Modified", response)
+        self.assertEqual(
+            set(response["Cache-Control"].split(", ")),
+            {"private", "no-cache"}
+        )
+
+    def test_matching_etag_is_not_modified(self):
+        etag = self.get()["ETag"]
+
+        response = self.get(If_None_Match=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+        self.assertIn("private", response["Cache-Control"])
+
+        self.assertEqual(self.get(If_None_Match='W/"stale"').status_code, 200)
+
+    def test_etag_depends_on_the_query_and_the_user(self):
+        etag = self.get()["ETag"]
+
+        self.assertEqual(self.get({"status": "DEV"}, If_None_Match=etag).status_code, 200)
+
+        self.client.force_login(self.reportee)
+        self.assertEqual(self.get(If_None_Match=etag).status_code, 200)
+
+    def test_if_modified_since_is_not_modified(self):
+        last_modified = self.get()["Last-Modified"]
+
+        self.assertEqual(self.get(If_Modified_Since=last_modified).status_code, 304)
+
+        earlier = http_date(parse_http_date(last_modified) - 60)
+        self.assertEqual(self.get(If_Modified_Since=earlier).status_code, 200)
+
+    def test_validators_change_after_writes(self):
+        for method, path, payload in (
+            ("post", "/tasks/create", {"title": "New"}),
+            ("patch", f"/tasks/{self.tasks[0].id}/status", {"status": "TEST"}),
+            ("patch", "/tasks/bulk/status", {"task_ids": [self.tasks[1].id], "status": "STUCK"}),
+            ("delete", f"/tasks/{self.tasks[2].id}", None),
+        ):
+            with self.subTest(method=method, path=path):
+                before = self.get()
+                self.write(method, path, payload)
+
+                response = self.get(If_None_Match=before["ETag"])
+                self.assertEqual(response.status_code, 200)
+                self.assertNotEqual(response["ETag"], before["ETag"])
+
+                response = self.get(If_Modified_Since=before["Last-Modified"])
+                self.assertEqual(response.status_code, 200)
+
+    def test_last_modified_does_not_go_back_after_a_delete(self):
+        Task.objects.filter(id=self.tasks[0].id).update(updated_at=timezone.now())
+        self.write("patch", f"/tasks/{self.tasks[1].id}/status", {"status": "TEST"})
+        before = self.get()
+
+        self.write("delete", f"/tasks/{self.tasks[1].id}")
+        after = self.get()
+
+        self.assertNotEqual(after["ETag"], before["ETag"])
+        self.assertGreaterEqual(
+            parse_http_date(after["Last-Modified"]),
+            parse_http_date(before["Last-Modified"])
+        )
+
+
+class SessionIdentityTests(AcmeTestCase):
+    """
+    Sessions authenticate from a principal snapshot, which a change to the
+    user ends in every process at once, and which never outlives
+    PRINCIPAL_MAX_AGE without the row being checked again.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.reportee)
+        self.assertEqual(self.me().status_code, 200)
+
+    def me(self):
+        return self.client.get("/auth/me")
+
+    def deactivate(self):
+        self.reportee.is_active = False
+        with self.captureOnCommitCallbacks(execute=True):
+            self.reportee.save(update_fields=["is_active", "updated_at"])
+
+    def test_later_requests_do_not_read_the_user(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.me()
+
+        self.assertEqual(response.json()["id"], self.reportee.id)
+        self.assertFalse([q for q in queries.captured_queries if "core_user" in q["sql"]])
+
+    def test_deactivated_user_is_rejected(self):
+        self.deactivate()
+
+        self.assertEqual(self.me().status_code, 401)
+
+    def test_deactivation_in_another_process_is_rejected(self):
+        with mock.patch("core.authentication.caches", other_process_caches()):
+            self.deactivate()
+
+        self.assertEqual(self.me().status_code, 401)
+
+    async def test_async_views_reject_a_deactivated_user(self):
+        client = AsyncClient()
+        await client.aforce_login(self.reportee)
+        self.assertEqual((await client.get("/async/tasks")).status_code, 200)
+
+        with mock.patch("core.authentication.caches", other_process_caches()):
+            await sync_to_async(self.deactivate)()
+
+        self.assertEqual((await client.get("/async/tasks")).status_code, 401)
+
+    def test_snapshot_is_checked_again_once_it_is_old(self):
+        # an UPDATE that bypasses the signals leaves the version alone
+        User.objects.filter(id=self.reportee.id).update(is_active=False)
+        self.assertEqual(self.me().status_code, 200)
+
+        later = time.time() + PRINCIPAL_MAX_AGE
+        with mock.patch("core.authentication.time.time", return_value=later):
+            self.assertEqual(self.me().status_code, 401)
+
+    def test_old_snapshot_of_an_active_user_is_renewed(self):
+        later = time.time() + PRINCIPAL_MAX_AGE
+        with mock.patch("core.authentication.time.time", return_value=later):
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(self.me().status_code, 200)
+            self.assertTrue([q for q in queries.captured_queries if "core_user" in q["sql"]])
+
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(self.me().status_code, 200)
+            self.assertFalse([q for q in queries.captured_queries if "core_user" in q["sql"]])
+
+
+class TaskDeleteTests(AcmeTestCase):
+    """
+    Deletes act as the request's user: managers soft delete their own
+    tasks and nobody else's.
+    """
+    with_other_manager = True
+
+    def setUp(self):
+        super().setUp()
+        self.managers_task = Task.objects.create(title="Manager's", created_by=self.manager, company=self.company)
+        self.other_managers_task = Task.objects.create(
+            title="Other manager's", created_by=self.other_manager, company=self.company
+        )
+
+    def delete(self, user, task):
+        self.client.force_login(user)
+        return self.client.delete(f"/tasks/{task.id}")
+
+    def test_manager_deletes_own_task(self):
+        # not the first manager in the table
+        response = self.delete(self.other_manager, self.other_managers_task)
+
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertTrue(Task.all_objects.get(id=self.other_managers_task.id).is_deleted)
+
+    def test_other_tasks_are_not_found(self):
+        outsider = self.create_user("outsider", "MANAGER", company=Company.objects.create(name="Globex"))
+
+        for user, task in (
+            (self.other_manager, self.managers_task),
+            (outsider, self.managers_task),
+            (outsider, self.other_managers_task),
+            (self.reportee, self.managers_task),
+        ):
+            with self.subTest(user=user.username, task=task.title):
+                self.assertIn(self.delete(user, task).status_code, (403, 404))
+
+        self.assertFalse(Task.all_objects.filter(is_deleted=True).exists())
+
+
+class BearerTokenTests(AcmeTestCase):
+    """
+    Bearer tokens authenticate without database or session reads, expire
+    after AUTH_TOKEN_MAX_AGE, and revocations reach every process.
+    """
+
+    def login(self):
+        response = self.client.post(
+            "/auth/login",
+            {"username": "reportee", "password": "secret", "session": False},
+            content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        return response.json()["token"]
+
+    def me(self, token, client=None):
+        return (client or self.client).get("/auth/me", headers={"authorization": f"Bearer {token}"})
+
+    def assertRejected(self, response, detail):
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json(), {"detail": detail})
+        self.assertEqual(response["WWW-Authenticate"], "Bearer")
+
+    def test_tokens_authenticate_without_queries(self):
+        token = self.login()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.me(token)
+
+        self.assertEqual(response.json()["id"], self.reportee.id)
+        self.assertEqual(queries.captured_queries, [])
+
+    def test_logout_revokes_only_that_token(self):
+        token, other_token = self.login(), self.login()
+
+        response = self.client.post("/auth/logout", headers={"authorization": f"Bearer {token}"})
+        self.assertEqual(response.status_code, 200)
+
+        self.assertRejected(self.me(token), "Token revoked")
+        self.assertEqual(self.me(other_token).status_code, 200)
+
+    def test_revocations_reach_every_process(self):
+        token = self.login()
+
+        with mock.patch("core.authentication.caches", other_process_caches()):
+            response = self.client.post("/auth/logout", headers={"authorization": f"Bearer {token}"})
+        self.assertEqual(response.status_code, 200)
+
+        self.assertRejected(self.me(token), "Token revoked")
+
+    def test_saving_the_user_revokes_earlier_tokens(self):
+        token = self.login()
+
+        self.reportee.is_active = False
+        with (
+            mock.patch("core.authentication.caches", other_process_caches()),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            self.reportee.save(update_fields=["is_active", "updated_at"])
+
+        self.assertRejected(self.me(token), "Token revoked")
+
+    def test_expired_tokens_are_rejected(self):
+        token = self.login()
+
+        later = time.time() + AUTH_TOKEN_MAX_AGE + 1
+        with mock.patch("django.core.signing.time.time", return_value=later):
+            self.assertRejected(self.me(token), "Token expired")
+
+    def test_tampered_tokens_are_rejected(self):
+        token = self.login()
+        payload, timestamp, signature = token.rsplit(":", 2)
+        forged = signing.loads(token, salt=AUTH_TOKEN_SALT)
+
+        for tampered in (
+            f"{payload}:{timestamp}:{signature[:-1]}{'A' if signature[-1] != 'A' else 'B'}",
+            f"{payload}x:{timestamp}:{signature}",
+            signing.dumps({**forged, "role": "MANAGER"}),
+            signing.dumps({**forged, "role": "MANAGER"}, key="not-the-secret-key", salt=AUTH_TOKEN_SALT),
+            "not-a-token",
+        ):
+            with self.subTest(token=tampered):
+                self.assertRejected(self.me(tampered), "Invalid token")
+
+    def test_malformed_headers_are_rejected(self):
+        for header in ("Bearer", f"Bearer {self.login()} extra"):
+            with self.subTest(header=header):
+                response = self.client.get("/auth/me", headers={"authorization": header})
+                self.assertRejected(response, "Invalid token header")
+
+
+class SharedCacheCheckTests(TestCase):
+    """
+    manage.py refuses caches that would keep identity, token, rate limit,
+    replica pin or event state per process.
+    """
+
+    def errors(self, shared):
+        caches_setting = {"default": settings.CACHES["default"]}
+        if shared is not None:
+            caches_setting["shared"] = {"BACKEND": shared}
+
+        with override_settings(CACHES=caches_setting):
+            return [error.id for error in check_shared_caches(None)]
+
+    def test_shared_backends_pass(self):
+        self.assertEqual(self.errors("django.core.cache.backends.filebased.FileBasedCache"), [])
+        self.assertEqual(self.errors("django.core.cache.backends.redis.RedisCache"), [])
+
+    def test_per_process_backends_fail(self):
+        for backend in PER_PROCESS_CACHE_BACKENDS:
+            with self.subTest(backend=backend):
+                self.assertIn("core.E002", self.errors(backend))
+
+    def test_missing_alias_fails(self):
+        self.assertIn("core.E001", self.errors(None))
+
+    def test_cache_throttle_backend_needs_a_shared_alias(self):
+        with (
+            mock.patch("core.checks.THROTTLE_BACKEND", "core.throttles.CacheThrottleBackend"),
+            mock.patch("core.checks.THROTTLE_BACKEND_OPTIONS", {"alias": "default"}),
+        ):
+            errors = check_shared_caches(None)
+
+        self.assertEqual(
+            [(error.id, error.msg.split()[0]) for error in errors],
+            [("core.E002", "THROTTLE_BACKEND_OPTIONS")]
+        )
+
+    def test_every_shared_alias_is_checked(self):
+        with override_settings(CACHES={"default": settings.CACHES["default"]}, READ_REPLICAS=["replica"]):
+            messages = " ".join(error.msg for error in check_shared_caches(None))
+
+        for name in ("PRINCIPAL_CACHE_ALIAS", "AUTH_TOKEN_CACHE_ALIAS", "REPLICA_PIN_CACHE_ALIAS", "EVENT_BACKEND_OPTIONS"):
+            self.assertIn(name, messages)
+
+
+class SQLiteConnectionProfileTests(TestCase):
+    def test_pragmas_are_applied_on_connect(self):
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA busy_timeout")
+            self.assertEqual(cursor.fetchone()[0], SQLITE_PRAGMAS["busy_timeout"])
+            cursor.execute("PRAGMA synchronous")
+            self.assertEqual(cursor.fetchone()[0], 1)   # NORMAL
+
+        self.assertEqual(connection.transaction_mode, "IMMEDIATE")
+
+
+class SQLiteWriteStressTests(unittest.TestCase):
+    """
+    Plain unittest: Django's test cases refuse connections from threads to
+    databases they were not set up with, and the stress runs use their own.
+    """
+
+    def test_tuned_profile_survives_concurrent_writes(self):
+        report = run_write_stress(threads=4, writes=10)
+
+        tuned = report["profiles"]["tuned"]
+        self.assertEqual((tuned["writes"], tuned["errors"]), (40, 0))
+        self.assertIn("bare", report["profiles"])
+
+
+class SlidingWindowThrottleTests(TestCase):
+    """
+    Run the throttle engine against the SQLite backend, standing in for a
+    store shared by several workers.
+    """
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, "throttle.sqlite3")
+        self.now = 1_000_040.0  # 20s into a minute window
+
+        patcher = mock.patch(
+            "core.throttles.get_throttle_backend",
+            return_value=SQLiteThrottleBackend(self.path)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_throttle(self, rate="3/min"):
+        throttle = UserRateThrottle()
+        throttle.rate = rate
+        throttle.num_requests, throttle.duration = throttle.parse_rate(rate)
+        throttle.timer = lambda: self.now
+        return throttle
+
+    def hit(self, throttle=None):
+        request = RequestFactory().get("/")
+        request.user = mock.Mock(is_authenticated=True, pk=1)
+        return (throttle or self.make_throttle()).allow_request(request, None)
+
+    def test_blocks_after_rate_is_used_up(self):
+        self.assertEqual([self.hit() for _ in range(4)], [True, True, True, False])
+
+    def test_rejected_requests_do_not_count(self):
+        for _ in range(10):
+            self.hit()
+
+        backend = SQLiteThrottleBackend(self.path)
+        self.assertEqual(backend.get("throttle_user_1:16667"), 3)
+
+    def test_previous_window_is_weighted_by_overlap(self):
+        for _ in range(3):
+            self.hit()
+
+        # 30s into the next window half of the previous 3 hits still count
+        self.now += 70
+        self.assertEqual([self.hit() for _ in range(2)], [True, False])
+
+    def test_workers_share_counters(self):
+        other_worker = SQLiteThrottleBackend(self.path)
+
+        self.hit()
+        self.hit()
+        with mock.patch(
+            "core.throttles.get_throttle_backend",
+            return_value=other_worker
+        ):
+            self.assertEqual([self.hit(), self.hit()], [True, False])
+
+    def test_wait_reports_time_until_next_slot(self):
+        throttle = self.make_throttle()
+        for _ in range(4):
+            allowed = self.hit(throttle)
+
+        self.assertFalse(allowed)
+        # count=3 becomes the fading window: 40s left + 1/3 of the next one
+        self.assertAlmostEqual(throttle.wait(), 60.0, places=5)
+
+
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+)
+class BenchmarkHarnessTests(TestCase):
+    """
+    Smoke-run the benchmark harness at a tiny scale: every route must
+    answer with its expected status and produce a complete report row.
+    """
+
+    def test_every_route_is_benchmarked_without_errors(self):
+        report = run_benchmark(
+            scale=Scale(companies=1, managers=2, reportees=2, tasks=20),
+            requests=3
+        )
+
+        self.assertEqual(set(report["routes"]), set(ApiBenchmark.available_routes()))
+        for route, row in report["routes"].items():
+            with self.subTest(route=route):
+                self.assertEqual(row["errors"], 0)
+                self.assertEqual(row["requests"], 3)
+                self.assertLessEqual(row["p50_ms"], row["p99_ms"])
+                self.assertIn("queries_per_request", row)
+
+    def test_sync_and_async_variants_are_benchmarked_without_errors(self):
+        report = run_concurrency_benchmark(
+            scale=Scale(companies=1, managers=2, reportees=2, tasks=20),
+            requests=4,
+            concurrency=2
+        )
+
+        self.assertEqual(set(report["routes"]), set(ASYNC_ROUTES))
+        for route, variants in report["routes"].items():
+            for variant, row in variants.items():
+                with self.subTest(route=route, variant=variant):
+                    self.assertEqual(row["errors"], 0)
+                    self.assertEqual(row["concurrency"], 2)
+
+    def test_serialization_benchmark_reports_every_page_size(self):
+        report = run_serialization_benchmark(page_sizes=(5, 20), repeat=2)
+
+        self.assertEqual(set(report["page_sizes"]), {5, 20})
+        for row in report["page_sizes"].values():
+            self.assertGreater(row["speedup"], 0)
+
+    def test_search_benchmark_reports_every_query(self):
+        report = run_search_benchmark(
+            scale=Scale(companies=1, managers=1, reportees=2, tasks=200),
+            repeat=2
+        )
+
+        self.assertEqual(set(report["queries"]), set(search_queries()))
+        self.assertGreater(report["queries"]["common"]["matches"], 0)
+        for row in report["queries"].values():
+            self.assertGreater(row["speedup"], 0)
+
+    def test_percentile_interpolates(self):
+        self.assertEqual(percentile([1, 2, 3, 4], 50), 2.5)
+        self.assertEqual(percentile([5], 99), 5)
+
+
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+)
+class QueryBudgetTests(QueryBudgetTestMixin, TestCase):
+    """
+    Every route must stay within the query_budget declared on its view.
+    """
+
+    def test_every_route_stays_within_budget(self):
+        bench = ApiBenchmark(
+            seed(Scale(companies=1, managers=2, reportees=2, tasks=20))
+        )
+
+        for route in ApiBenchmark.available_routes():
+            with self.subTest(route=route):
+                client, method, path, payload, _ = getattr(bench, f"route_{route}")()
+                response = getattr(client, method)(
+                    path,
+                    {} if payload is None else payload,
+                    content_type="application/json"
+                )
+                self.assertWithinQueryBudget(response)
+
+    def test_server_timing_header(self):
+        response = self.client.get("/free-resource")
+        self.assertRegex(
+            response["Server-Timing"],
+            r'^db;dur=[\d.]+;desc="0 queries", ser;dur=[\d.]+, app;dur=[\d.]+, total;dur=[\d.]+$'
+        )
+
+
+@override_settings(
+    PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"]
+)
+class AsyncTaskViewTests(QueryBudgetTestMixin, AcmeTestCase):
+    """
+    The async/ routes must be indistinguishable from their sync twins.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.tasks = Task.objects.bulk_create([
+            Task(
+                title=f"Task {i}",
+                created_by=cls.manager,
+                assigned_to=cls.reportee,
+                company=cls.company
+            )
+            for i in range(15)
+        ])
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.manager)
+        self.async_client = AsyncClient()
+        self.async_client.cookies = self.client.cookies
+
+    async def test_list_matches_sync_view(self):
+        for query in ("", "?page=2"):
+            with self.subTest(query=query):
+                expected = await self.async_client.get(f"/tasks{query}")
+                response = await self.async_client.get(f"/async/tasks{query}")
+
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.content, expected.content)
+                self.assertEqual(response["ETag"], expected["ETag"])
+                self.assertWithinQueryBudget(response)
+
+    async def test_list_answers_conditional_get(self):
+        first = await self.async_client.get("/async/tasks")
+        response = await self.async_client.get(
+            "/async/tasks",
+            headers={"if-none-match": first["ETag"]}
+        )
+        self.assertEqual(response.status_code, 304)
+
+    async def test_writes_with_bearer_token(self):
+        client = AsyncClient()
+        bearer = {"authorization": f"Bearer {issue_token(self.manager)}"}
+
+        response = await client.post(
+            "/async/tasks/create",
+            {"title": "New", "assigned_to_id": self.reportee.id},
+            content_type="application/json",
+            headers=bearer
+        )
+        self.assertEqual(response.status_code, 201)
+        task_id = response.json()["id"]
+
+        response = await client.patch(
+            f"/async/tasks/{task_id}/status",
+            {"status": "TEST"},
+            content_type="application/json",
+            headers=bearer
+        )
+        self.assertEqual(response.json()["new_status"], "TEST")
+
+        response = await client.patch(
+            f"/async/tasks/{task_id}/status",
+            {"status": "NOPE"},
+            content_type="application/json",
+            headers=bearer
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("status", response.json())
+
+        listing = await client.get("/async/tasks", headers=bearer)
+        self.assertEqual(listing.json()["tasks"][0]["task_id"], task_id)
+
+    async def test_bodies_are_parsed_like_sync_views(self):
+        for path in ("/tasks/create", "/async/tasks/create"):
+            with self.subTest(path=path):
+                response = await self.async_client.post(path, {"title": "Form", "assigned_to_id": self.reportee.id})
+                self.assertEqual(response.status_code, 201, response.content)
+                self.assertEqual(response.json()["assigned_to_id"], self.reportee.id)
+
+                response = await self.async_client.post(
+                    path,
+                    "title=Urlencoded",
+                    content_type="application/x-www-form-urlencoded"
+                )
+                self.assertEqual(response.status_code, 201, response.content)
+
+                response = await self.async_client.post(path, "<title/>", content_type="application/xml")
+                self.assertEqual(response.status_code, 415)
+
+    async def test_reportee_cannot_touch_other_tasks(self):
+        await self.async_client.aforce_login(self.reportee)
+
+        response = await self.async_client.patch(
+            f"/async/tasks/{self.tasks[0].id}/assign",
+            {"assigned_to_id": self.reportee.id},
+            content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 403)
+
+        response = await self.async_client.patch(
+            f"/async/tasks/{self.tasks[0].id}/self",
+            {"status": "COMPLETED"},
+            content_type="application/json"
+        )
+        self.assertEqual(response.json()["new_status"], "COMPLETED")
+
+    async def test_anonymous_requests_get_bearer_challenge(self):
+        response = await AsyncClient().get("/async/tasks")
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response["WWW-Authenticate"], "Bearer")
+
+
+class TaskPageEncoderTests(TestCase):
+    """
+    The list fast path must render exactly what JSONRenderer would.
+    """
+
+    def test_encoders_match_json_renderer(self):
+        utc = timezone.get_fixed_timezone(0)
+        rows = [
+            (1, 'Quotes " \\ and ünïcode \u2028', "DEV", None,
+             datetime(2026, 1, 2, 3, 4, 5, tzinfo=utc),
+             datetime(2026, 1, 2, 3, 4, 5, 678, tzinfo=utc)),
+            (2, "", "COMPLETED", 7,
+             datetime(2026, 1, 1, tzinfo=utc),
+             datetime(2026, 1, 1, tzinfo=utc)),
+        ]
+        encoders = [_stdlib_encode_task_page]
+        if orjson is not None:
+            encoders.append(_orjson_encode_task_page)
+
+        for meta in ({"page_size": 10, "next_cursor": "abc"}, {}):
+            expected = JSONRenderer().render({
+                **meta,
+                "tasks": [dict(zip(TASK_ROW_KEYS, row)) for row in rows],
+            })
+            for encode in encoders:
+                with self.subTest(encoder=encode.__name__, meta=meta):
+                    self.assertEqual(encode(meta, rows), expected)
+
+
+class TaskExportTests(AcmeTestCase):
+    """
+    Exports stream the same rows the list endpoint scopes to, without
+    building model instances.
+    """
+    with_other_manager = True
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.tasks = Task.objects.bulk_create([
+            Task(
+                title=f'Task {i}, "quoted"',
+                created_by=cls.manager,
+                assigned_to=cls.reportee if i % 2 else None,
+                company=cls.company
+            )
+            for i in range(6)
+        ])
+        Task.objects.create(title="Deleted", created_by=cls.manager, company=cls.company, is_deleted=True)
+        Task.objects.create(title="Not mine", created_by=cls.other_manager, company=cls.company)
+
+    def export(self, user, query=""):
+        self.client.force_login(user)
+        response = self.client.get(f"/tasks/export{query}")
+        self.assertTrue(response.streaming)
+        return response, b"".join(response.streaming_content).decode()
+
+    def test_ndjson_is_scoped_like_the_list(self):
+        with mock.patch.object(Task, "from_db", side_effect=AssertionError("model built")):
+            response, body = self.export(self.manager)
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(
+            [row["task_id"] for row in rows],
+            [task.id for task in reversed(self.tasks)]
+        )
+
+        _, body = self.export(self.reportee)
+        self.assertEqual(
+            {json.loads(line)["task_id"] for line in body.splitlines()},
+            {task.id for task in self.tasks if task.assigned_to_id}
+        )
+
+    def test_csv_has_header_and_escapes_values(self):
+        response, body = self.export(self.manager, "?output=csv")
+
+        self.assertEqual(response["Content-Type"], "text/csv")
+        rows = list(csv.DictReader(io.StringIO(body)))
+        self.assertEqual(len(rows), len(self.tasks))
+        self.assertEqual(rows[-1]["title"], 'Task 0, "quoted"')
+
+    def test_unknown_output_is_rejected(self):
+        self.client.force_login(self.manager)
+        self.assertEqual(self.client.get("/tasks/export?output=xml").status_code, 400)
+
+    async def test_asgi_gets_an_async_stream(self):
+        # a sync iterator would be read whole with sync_to_async(list)
+        _, expected = await sync_to_async(self.export)(self.manager)
+        async_client = AsyncClient()
+        async_client.cookies = self.client.cookies
+
+        response = await async_client.get("/tasks/export")
+        self.assertTrue(response.is_async)
+        body = b"".join([chunk async for chunk in response.streaming_content]).decode()
+
+        self.assertEqual(body, expected)
+
+
+@override_settings(
+    REST_FRAMEWORK={
+        **settings.REST_FRAMEWORK,
+        "DEFAULT_THROTTLE_RATES": unthrottled_rates(),
+    }
+)
+class TaskListFilterTests(AcmeTestCase):
+    """
+    Filters and orderings on GET /tasks, validated and applied server-side.
+    """
+    reportee_names = ("reportee-0", "reportee-1")
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        statuses = ["DEV", "TEST", "STUCK", "COMPLETED"]
+        cls.tasks = Task.objects.bulk_create([
+            Task(
+                title=f"Task {i}",
+                status=statuses[i % 4],
+                created_by=cls.manager,
+                assigned_to=cls.reportees[i % 2],
+                company=cls.company
+            )
+            for i in range(24)
+        ])
+
+        # spread timestamps out so ranges and orderings are deterministic
+        base = timezone.now() - timedelta(days=30)
+        for i, task in enumerate(cls.tasks):
+            Task.objects.filter(id=task.id).update(
+                created_at=base + timedelta(days=i),
+                updated_at=base + timedelta(days=30 - i)
+            )
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.manager)
+
+    def list_ids(self, query):
+        ids, cursor = [], None
+        while True:
+            response = self.client.get(
+                "/tasks", {**query, **({"cursor": cursor} if cursor else {})}
+            )
+            self.assertEqual(response.status_code, 200, response.content)
+            ids += [task["task_id"] for task in response.json()["tasks"]]
+            cursor = response.json()["next_cursor"]
+            if cursor is None:
+                return ids
+
+    def test_status_accepts_several_values(self):
+        ids = self.list_ids({"status": ["DEV", "STUCK"]})
+        expected = [t.id for t in self.tasks if t.status in ("DEV", "STUCK")]
+        self.assertEqual(sorted(ids), sorted(expected))
+
+    def test_assignee_and_created_range(self):
+        created = Task.objects.order_by("created_at").values_list("created_at", flat=True)
+        ids = self.list_ids({
+            "assigned_to": self.reportees[0].id,
+            "created_after": created[4].isoformat(),
+            "created_before": created[10].isoformat(),
+        })
+        self.assertEqual(
+            sorted(ids),
+            [t.id for t in self.tasks[4:10] if t.assigned_to_id == self.reportees[0].id]
+        )
+
+    def test_orderings_paginate_through_every_row(self):
+        expected = {
+            "-created_at": [t.id for t in reversed(self.tasks)],
+            "created_at": [t.id for t in self.tasks],
+            "-updated_at": [t.id for t in self.tasks],
+            "updated_at": [t.id for t in reversed(self.tasks)],
+        }
+        for ordering in Task.LIST_ORDERINGS:
+            with self.subTest(ordering=ordering):
+                self.assertEqual(self.list_ids({"ordering": ordering}), expected[ordering])
+
+    def test_page_mode_uses_ordering(self):
+        response = self.client.get("/tasks", {"page": 1, "ordering": "created_at"})
+        self.assertEqual(response.json()["tasks"][0]["task_id"], self.tasks[0].id)
+
+    def test_cursor_is_bound_to_its_ordering(self):
+        cursor = self.client.get("/tasks").json()["next_cursor"]
+        response = self.client.get("/tasks", {"cursor": cursor, "ordering": "updated_at"})
+        self.assertEqual(response.status_code, 400)
+
+    def test_invalid_params_are_rejected(self):
+        for query in (
+            {"status": "DONE"},
+            {"ordering": "title"},
+            {"created_after": "yesterday"},
+            {"page": 0},
+        ):
+            with self.subTest(query=query):
+                response = self.client.get("/tasks", query)
+                self.assertEqual(response.status_code, 400)
+
+
+@override_settings(
+    REST_FRAMEWORK={
+        **settings.REST_FRAMEWORK,
+        "DEFAULT_THROTTLE_RATES": unthrottled_rates(),
+    }
+)
+class TaskChangesTests(AcmeTestCase):
+    """
+    Delta sync returns only what changed after the token, with tombstones
+    for tasks that were deleted or left the user's scope.
+    """
+    reportee_names = ("reportee-0", "reportee-1")
+
+    def sync(self, user, token):
+        self.client.force_login(user)
+        return self.client.get("/tasks/changes", {"since": token}).json()
+
+    def test_delta_after_writes(self):
+        token = self.call(self.manager, "get", "/tasks/changes")["next_token"]
+        reportee_token = self.call(self.reportees[0], "get", "/tasks/changes")["next_token"]
+
+        created = [
+            self.call(self.manager, "post", "/tasks/create", {
+                "title": f"Task {i}", "assigned_to_id": self.reportees[0].id,
+            })["id"]
+            for i in range(3)
+        ]
+        delta = self.sync(self.manager, token)
+        self.assertCountEqual([task["task_id"] for task in delta["changes"]], created)
+        self.assertEqual(delta["deleted"], [])
+
+        # steady state: nothing new, same token back
+        self.assertEqual(self.sync(self.manager, delta["next_token"])["changes"], [])
+        token = delta["next_token"]
+
+        self.call(self.reportees[0], "patch", f"/tasks/{created[0]}/self", {"status": "COMPLETED"})
+        self.call(self.manager, "patch", f"/tasks/{created[1]}/assign", {"assigned_to_id": self.reportees[1].id})
+        self.call(self.manager, "delete", f"/tasks/{created[2]}")
+
+        delta = self.sync(self.manager, token)
+        self.assertEqual(
+            [(task["task_id"], task["status"]) for task in delta["changes"]],
+            [(created[0], "COMPLETED"), (created[1], "DEV")]
+        )
+        self.assertEqual(delta["deleted"], [created[2]])
+
+        # the reassigned and deleted tasks are tombstones for the old assignee
+        delta = self.sync(self.reportees[0], reportee_token)
+        self.assertEqual([task["task_id"] for task in delta["changes"]], [created[0]])
+        self.assertCountEqual(delta["deleted"], created[1:])
+
+    def test_bulk_writes_are_logged(self):
+        token = self.call(self.manager, "get", "/tasks/changes")["next_token"]
+        result = self.call(self.manager, "post", "/tasks/bulk", [{"title": "A"}, {"title": "B"}])
+        task_ids = [row["id"] for row in result["results"]]
+        self.call(self.manager, "patch", "/tasks/bulk/status", {"task_ids": task_ids, "status": "STUCK"})
+
+        delta = self.sync(self.manager, token)
+        self.assertCountEqual(
+            [(task["task_id"], task["status"]) for task in delta["changes"]],
+            [(task_id, "STUCK") for task_id in task_ids]
+        )
+
+    def test_pages_through_long_deltas(self):
+        token = self.call(self.manager, "get", "/tasks/changes")["next_token"]
+        self.call(self.manager, "post", "/tasks/bulk", [{"title": str(i)} for i in range(5)])
+
+        seen = []
+        with mock.patch("core.views.task.TASK_CHANGES_PAGE_SIZE", 2):
+            while True:
+                delta = self.sync(self.manager, token)
+                seen += [task["task_id"] for task in delta["changes"]]
+                token = delta["next_token"]
+                if not delta["has_more"]:
+                    break
+
+        self.assertEqual(len(seen), 5)
+
+    def test_pruned_token_is_gone(self):
+        self.call(self.manager, "post", "/tasks/bulk", [{"title": str(i)} for i in range(3)])
+        TaskChange.objects.update(created_at=timezone.now() - timedelta(days=60))
+
+        call_command("prune_task_changes", days=30, stdout=io.StringIO())
+
+        self.assertEqual(TaskChange.objects.count(), 1)
+        self.client.force_login(self.manager)
+        self.assertEqual(self.client.get("/tasks/changes", {"since": 0}).status_code, 410)
+
+
+@override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, "DEFAULT_THROTTLE_RATES": unthrottled_rates()})
+class TaskEventStreamTests(AcmeTestCase):
+    """
+    The SSE stream pushes logged changes and resumes from Last-Event-ID.
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_login(self.manager)
+        self.async_client = AsyncClient()
+        self.async_client.cookies = self.client.cookies
+
+    async def open(self, headers=None):
+        response = await self.async_client.get("/tasks/events", headers=headers or {})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        self.assertEqual(response["Cache-Control"], "no-cache")
+
+        stream = aiter(response.streaming_content)
+        self.assertTrue((await anext(stream)).startswith(b"retry: "))
+        return stream
+
+    @sync_to_async
+    def write(self, method, path, payload):
+        # on the sync thread, like a WSGI worker publishing to ASGI streams
+        with self.captureOnCommitCallbacks(execute=True):
+            response = getattr(self.client, method)(path, payload, content_type="application/json")
+        self.assertLess(response.status_code, 300, response.content)
+        return response.json()
+
+    async def create_task(self, title):
+        response = await self.write(
+            "post",
+            "/tasks/create",
+            {"title": title, "assigned_to_id": self.reportee.id}
+        )
+        return response["id"]
+
+    @staticmethod
+    def parse(frame):
+        fields = dict(line.split(": ", 1) for line in frame.decode().strip().split("\n"))
+        return int(fields["id"]), fields["event"], json.loads(fields["data"])
+
+    async def test_pushes_writes_to_open_streams(self):
+        stream = await self.open()
+
+        task_id = await self.create_task("Live")
+        change_id, event, data = self.parse(await anext(stream))
+        self.assertEqual(event, "task.created")
+        self.assertEqual(data["task_id"], task_id)
+        self.assertEqual(data["task"]["title"], "Live")
+
+        await self.write("patch", f"/tasks/{task_id}/status", {"status": "TEST"})
+        next_id, event, data = self.parse(await anext(stream))
+        self.assertGreater(next_id, change_id)
+        self.assertEqual((event, data["task"]["status"]), ("task.status", "TEST"))
+        await stream.aclose()
+
+    async def test_resumes_from_last_event_id(self):
+        first = await self.create_task("Seen")
+        stream = await self.open()
+
+        missed = [await self.create_task(f"Missed {i}") for i in range(2)]
+        await stream.aclose()
+
+        seen_id = await TaskChange.objects.filter(
+            task_id=first, user_id=self.manager.id
+        ).values_list("id", flat=True).aget()
+        stream = await self.open(headers={"last-event-id": str(seen_id)})
+
+        replayed = [self.parse(await anext(stream))[2]["task_id"] for _ in missed]
+        self.assertEqual(replayed, missed)
+        await stream.aclose()
+
+    async def test_heartbeat_and_deadline(self):
+        with (
+            mock.patch("core.views.events.SSE_HEARTBEAT_SECONDS", 0.01),
+            mock.patch("core.views.events.SSE_MAX_STREAM_SECONDS", 0.05),
+        ):
+            stream = await self.open()
+            frames = [frame async for frame in stream]
+
+        self.assertTrue(frames)
+        self.assertTrue(all(frame == b": heartbeat\n\n" for frame in frames))
+
+    async def test_pruned_position_gets_reset(self):
+        await self.create_task("Old")
+        await self.create_task("New")
+        await TaskChange.objects.filter(
+            id=await TaskChange.objects.order_by("id").values_list("id", flat=True).afirst()
+        ).adelete()
+
+        stream = await self.open(headers={"last-event-id": "0"})
+        self.assertIn(b"event: reset", await anext(stream))
+
+        response = await self.async_client.get("/tasks/events", headers={"last-event-id": "abc"})
+        self.assertEqual(response.status_code, 400)
+
+    async def test_writes_in_another_process_wake_the_stream(self):
+        stream = await self.open()
+        # park the stream in wait(), past the log read and the wake-up the
+        # poller gives every new subscriber
+        frame = asyncio.ensure_future(anext(stream))
+        while self.manager.id not in get_event_backend().tokens:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.1)
+
+        # the writer (another worker, run_jobs) has its own backend; only
+        # the shared cache connects it to this stream
+        with mock.patch("core.changes.get_event_backend", return_value=SharedCacheEventBackend()):
+            task_id = await self.create_task("Elsewhere")
+            _, event, data = self.parse(await asyncio.wait_for(frame, 5))
+
+        self.assertEqual((event, data["task_id"]), ("task.created", task_id))
+        await stream.aclose()
+
+    async def test_shared_cache_backend_wakes_only_changed_users(self):
+        backend = SharedCacheEventBackend(poll_seconds=0.01)
+        mine = backend.subscribe(self.manager.id)
+        theirs = backend.subscribe(self.reportee.id)
+        # new subscribers are woken once by the first poll
+        self.assertTrue(await mine.wait(1))
+        self.assertTrue(await theirs.wait(1))
+
+        SharedCacheEventBackend().publish([self.manager.id])
+
+        self.assertTrue(await mine.wait(1))
+        self.assertFalse(await theirs.wait(0.1))
+
+        mine.close()
+        theirs.close()
+        await asyncio.sleep(0.1)
+        self.assertIsNone(backend.poller)   # no streams left, no polling
+
+    async def test_streams_that_never_run_leave_no_subscription(self):
+        backend = get_event_backend()
+
+        # the client is gone before the first frame is pulled
+        response = await self.async_client.get("/tasks/events")
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn(self.manager.id, backend.subscribers)
+
+        with mock.patch("core.views.events.latest_change_id", side_effect=DatabaseError("gone")):
+            response = await self.async_client.get("/tasks/events")
+            with self.assertRaises(DatabaseError):
+                await anext(aiter(response.streaming_content))
+        self.assertNotIn(self.manager.id, backend.subscribers)
+
+
+@override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, "DEFAULT_THROTTLE_RATES": unthrottled_rates()})
+class TaskSummaryTests(QueryBudgetTestMixin, AcmeTestCase):
+    """
+    Every write path keeps the counters equal to a recount of the tasks.
+    """
+    reportee_names = ("reportee-0", "reportee-1")
+
+    def assertInSync(self):
+        self.assertEqual(drifted_task_counts(), [])
+
+    async def test_write_paths_keep_counters_in_sync(self):
+        first, second = self.reportees
+
+        task_id = (await sync_to_async(self.call)(
+            self.manager, "post", "/tasks/create", {"title": "A", "assigned_to_id": first.id}
+        ))["id"]
+        bulk = await sync_to_async(self.call)(
+            self.manager, "post", "/tasks/bulk",
+            [{"title": "B"}, {"title": "C", "assigned_to_id": second.id}]
+        )
+        bulk_ids = [row["id"] for row in bulk["results"]]
+
+        await sync_to_async(self.call)(self.manager, "patch", f"/tasks/{task_id}/status", {"status": "TEST"})
+        await sync_to_async(self.call)(first, "patch", f"/tasks/{task_id}/self", {"status": "COMPLETED"})
+        await sync_to_async(self.call)(self.manager, "patch", f"/tasks/{task_id}/assign", {"assigned_to_id": second.id})
+        await sync_to_async(self.call)(
+            self.manager, "patch", "/tasks/bulk/assign", {"task_ids": bulk_ids, "assigned_to_id": first.id}
+        )
+        await sync_to_async(self.call)(
+            self.manager, "patch", "/tasks/bulk/status", {"task_ids": bulk_ids, "status": "STUCK"}
+        )
+        await sync_to_async(self.call)(self.manager, "delete", f"/tasks/{bulk_ids[0]}")
+
+        client = AsyncClient()
+        await client.aforce_login(self.manager)
+        response = await client.post(
+            "/async/tasks/create",
+            {"title": "D", "assigned_to_id": second.id},
+            content_type="application/json"
+        )
+        await client.patch(
+            f"/async/tasks/{response.json()['id']}/status",
+            {"status": "TEST"},
+            content_type="application/json"
+        )
+
+        await sync_to_async(self.assertInSync)()
+
+    def test_write_racing_another_write_keeps_counters_in_sync(self):
+        first, second = self.reportees
+
+        def racing(module):
+            # another request moves the task on between this request's
+            # read and its transaction
+            def lock(task, *args):
+                bulk_update_owned_tasks(self.manager, [task.id], status="STUCK")
+                return locked_task_state(task, *args)
+
+            return mock.patch(f"{module}.locked_task_state", lock)
+
+        writes = [
+            (self.manager, "patch", "/tasks/{}/assign", {"assigned_to_id": second.id}),
+            (self.manager, "patch", "/tasks/{}/status", {"status": "TEST"}),
+            (first, "patch", "/tasks/{}/self", {"status": "COMPLETED"}),
+            (self.manager, "delete", "/tasks/{}", None),
+            (self.manager, "patch", "/async/tasks/{}/status", {"status": "TEST"}),
+        ]
+        for user, method, path, payload in writes:
+            with self.subTest(path=path):
+                task = Task.objects.create(
+                    title="Raced", created_by=self.manager, company=self.company, assigned_to=first
+                )
+                call_command("rebuild_task_summary", stdout=io.StringIO())
+
+                module = "core.views.task_async" if path.startswith("/async/") else "core.views.task"
+                with racing(module):
+                    self.call(user, method, path.format(task.id), payload)
+
+                self.assertInSync()
+
+    def test_summary_endpoint(self):
+        first, second = self.reportees
+        self.call(self.manager, "post", "/tasks/bulk", [
+            {"title": "A", "assigned_to_id": first.id},
+            {"title": "B", "assigned_to_id": first.id},
+            {"title": "C"},
+        ])
+        task_id = Task.objects.filter(title="A").values_list("id", flat=True).get()
+        self.call(first, "patch", f"/tasks/{task_id}/self", {"status": "COMPLETED"})
+
+        self.client.force_login(self.manager)
+        response = self.client.get("/tasks/summary")
+        self.assertWithinQueryBudget(response)
+
+        data = response.json()
+        self.assertEqual(data["counts"], {"DEV": 2, "TEST": 0, "STUCK": 0, "COMPLETED": 1})
+        self.assertEqual(data["total"], 3)
+        self.assertEqual(data["reportees"], [{
+            "user_id": first.id,
+            "counts": {"DEV": 1, "TEST": 0, "STUCK": 0, "COMPLETED": 1},
+            "total": 2,
+        }])
+
+        data = self.call(second, "get", "/tasks/summary")
+        self.assertEqual((data["total"], "reportees" in data), (0, False))
+
+    def test_rebuild_command_reports_and_fixes_drift(self):
+        self.call(self.manager, "post", "/tasks/bulk", [{"title": "A"}, {"title": "B"}])
+        call_command("rebuild_task_summary", check=True, stdout=io.StringIO())
+
+        TaskCounter.objects.update(count=7)
+        Task.objects.filter(title="A").update(status="STUCK")   # bypasses the counters
+
+        with self.assertRaises(CommandError):
+            call_command("rebuild_task_summary", check=True, stdout=io.StringIO())
+
+        out = io.StringIO()
+        call_command("rebuild_task_summary", stdout=out)
+        self.assertIn("2 had drifted", out.getvalue())
+        self.assertInSync()
+
+
+@override_settings(
+    READ_REPLICAS=["replica"],
+    REST_FRAMEWORK={**settings.REST_FRAMEWORK, "DEFAULT_THROTTLE_RATES": unthrottled_rates()}
+)
+class ReadReplicaRoutingTests(AcmeTestCase):
+    """
+    A second SQLite file stands in for a replica; replicate() copies the
+    primary into it, so anything written afterwards shows which database
+    a read was served from.
+    """
+    # not {"default", "replica"}: the runner would look for the alias
+    # before setUpClass has registered it
+    databases = "__all__"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.directory = tempfile.TemporaryDirectory()
+        connections.settings["replica"] = {
+            **connections.settings["default"],
+            "NAME": os.path.join(cls.directory.name, "replica.sqlite3"),
+        }
+        call_command("migrate", database="replica", verbosity=0, interactive=False)
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        connections["replica"].close()
+        del connections.settings["replica"]
+        cls.directory.cleanup()
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.task = Task.objects.create(title="Replicated", created_by=cls.manager, company=cls.company)
+
+    def setUp(self):
+        super().setUp()
+        for model in (Task, User, Company):
+            model.objects.using("replica").all().delete()
+        for model in (Company, User, Task):
+            model.objects.using("replica").bulk_create(model.objects.using("default").all())
+
+        # written to the primary only, without pinning anyone
+        Task.objects.create(title="Unreplicated", created_by=self.manager, company=self.company)
+        self.client.force_login(self.manager)
+
+    def titles(self, path="/tasks"):
+        response = self.client.get(path)
+        self.assertEqual(response.status_code, 200)
+        return {task["title"] for task in response.json()["tasks"]}
+
+    def test_reads_go_to_a_replica(self):
+        self.assertEqual(self.titles(), {"Replicated"})
+
+        export = self.client.get("/tasks/export")
+        titles = {json.loads(line)["title"] for line in b"".join(export.streaming_content).splitlines()}
+        self.assertEqual(titles, {"Replicated"})
+
+        # auth and sessions stay on the primary
+        self.assertEqual(self.client.get("/auth/me").json()["id"], self.manager.id)
+
+    def test_writers_read_their_writes_from_the_primary(self):
+        response = self.client.post(
+            "/tasks/create",
+            {"title": "Mine", "assigned_to_id": self.reportee.id},
+            content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertFalse(Task.objects.using("replica").filter(title="Mine").exists())
+
+        self.assertEqual(self.titles(), {"Replicated", "Unreplicated", "Mine"})
+
+        # the new assignee was affected by the write too
+        self.client.force_login(self.reportee)
+        self.assertEqual(self.titles(), {"Mine"})
+
+        # once the sticky window is over (and the pages cached from the
+        # primary are gone) reads go back to the replica
+        for cache in caches.all():
+            cache.clear()
+        self.client.force_login(self.manager)
+        self.assertEqual(self.titles(), {"Replicated"})
+
+    def create_task(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post("/tasks/create", {"title": "Mine"}, content_type="application/json")
+        self.assertEqual(response.status_code, 201)
+
+    def replicate_task(self):
+        Task.objects.using("replica").bulk_create(Task.objects.filter(title="Mine"))
+
+    def test_pins_reach_every_worker(self):
+        with mock.patch("core.routers.caches", other_process_caches()):
+            self.create_task()
+
+        self.assertEqual(self.titles(), {"Replicated", "Unreplicated", "Mine"})
+
+    def test_lagging_replica_reads_are_not_cached(self):
+        self.create_task()
+        # a read that missed the pin (say it was evicted) hits the replica
+        caches[REPLICA_PIN_CACHE_ALIAS].clear()
+        self.assertEqual(self.titles(), {"Replicated"})
+
+        # once the replica catches up, the stale page is not served
+        self.replicate_task()
+        self.assertEqual(self.titles(), {"Replicated", "Mine"})
+
+    def test_replica_reads_are_cached_after_the_sticky_window(self):
+        self.create_task()
+        caches[REPLICA_PIN_CACHE_ALIAS].clear()
+
+        later = time.time() + REPLICA_STICKY_SECONDS + 2
+        with mock.patch("core.cache.time.time", return_value=later):
+            self.assertEqual(self.titles(), {"Replicated"})
+            self.replicate_task()
+            self.assertEqual(self.titles(), {"Replicated"})
+
+    async def test_async_list_reads_from_a_replica(self):
+        client = AsyncClient()
+        await client.aforce_login(self.manager)
+
+        response = await client.get("/async/tasks")
+        self.assertEqual([task["title"] for task in response.json()["tasks"]], ["Replicated"])
+
+    def test_instances_read_from_a_replica_are_saved_to_the_primary(self):
+        task = Task.objects.using("replica").get(id=self.task.id)
+        task.title = "Renamed"
+        task.save(update_fields=["title"])
+
+        self.assertEqual(Task.objects.get(id=self.task.id).title, "Renamed")
+        self.assertEqual(Task.objects.using("replica").get(id=self.task.id).title, "Replicated")
+
+
+@override_settings(
+    REST_FRAMEWORK={**settings.REST_FRAMEWORK, "DEFAULT_THROTTLE_RATES": unthrottled_rates()}
+)
+class TaskSearchTests(QueryBudgetTestMixin, AcmeTestCase):
+    """
+    Search sees exactly the tasks the user can list, and the index follows
+    every kind of write.
+    """
+    with_other_manager = True
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.outsider = cls.create_user("outsider", "MANAGER", company=Company.objects.create(name="Globex"))
+
+    def setUp(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("the FTS5 index only exists on SQLite")
+        super().setUp()
+
+    def task(self, title, description="", created_by=None, **fields):
+        created_by = created_by or self.manager
+        return Task.objects.create(
+            title=title,
+            description=description,
+            created_by=created_by,
+            company_id=created_by.company_id,
+            **fields
+        )
+
+    def search(self, user, query, **params):
+        self.client.force_login(user)
+        return self.client.get("/tasks/search", {"q": query, **params})
+
+    def found(self, user, query):
+        response = self.search(user, query)
+        self.assertEqual(response.status_code, 200, response.content)
+        return [task["task_id"] for task in response.json()["tasks"]]
+
+    def test_results_are_scoped_and_title_matches_rank_first(self):
+        in_description = self.task("Update copy", "The login page wording", assigned_to=self.reportee)
+        in_title = self.task("Fix login redirect")
+        self.task("Login audit", is_deleted=True)
+        self.task("Login for the other team", created_by=self.other_manager)
+        self.task("Login at Globex", created_by=self.outsider)
+
+        response = self.search(self.manager, "LOGIN")
+        self.assertWithinQueryBudget(response)
+        self.assertEqual(
+            [task["task_id"] for task in response.json()["tasks"]],
+            [in_title.id, in_description.id]
+        )
+        self.assertEqual(self.found(self.reportee, "login"), [in_description.id])
+        self.assertEqual(self.found(self.outsider, "login redirect"), [])
+
+    def test_last_word_is_a_prefix_and_accents_are_folded(self):
+        task = self.task("Café menu reprint")
+
+        for query in ("cafe", "CAFÉ", "menu rep", "caf"):
+            with self.subTest(query=query):
+                self.assertEqual(self.found(self.manager, query), [task.id])
+
+        self.assertEqual(self.found(self.manager, "rep menu"), [])
+
+    def test_cursor_pages_through_every_match(self):
+        expected = {self.task(f"Invoice {i}").id for i in range(5)}
+
+        seen, cursor = [], None
+        with mock.patch("core.views.task.TASK_SEARCH_PAGE_SIZE", 2):
+            while True:
+                params = {"cursor": cursor} if cursor else {}
+                data = self.search(self.manager, "invoice", **params).json()
+                seen += [task["task_id"] for task in data["tasks"]]
+                cursor = data["next_cursor"]
+                if cursor is None:
+                    break
+
+            # a cursor only continues the query it was issued for
+            first = self.search(self.manager, "invoice").json()["next_cursor"]
+            response = self.search(self.manager, "invoices", cursor=first)
+
+        self.assertEqual(len(seen), 5)
+        self.assertEqual(set(seen), expected)
+        self.assertEqual(response.status_code, 400)
+
+    def test_rejects_queries_without_words(self):
+        for params in ({"q": "\"*() -"}, {}):
+            with self.subTest(params=params):
+                self.client.force_login(self.manager)
+                self.assertEqual(self.client.get("/tasks/search", params).status_code, 400)
+
+    def test_index_follows_writes_that_bypass_the_orm_save(self):
+        task = self.task("Deploy pipeline")
+        Task.objects.filter(id=task.id).update(title="Rollback pipeline")
+
+        self.assertEqual(self.found(self.manager, "deploy"), [])
+        self.assertEqual(self.found(self.manager, "rollback"), [task.id])
+
+        Task.objects.filter(id=task.id).delete()
+        self.assertEqual(self.found(self.manager, "pipeline"), [])
+        call_command("rebuild_task_search", check=True, stdout=io.StringIO())
+
+    def test_rebuild_command_repairs_the_index(self):
+        self.task("Backup database")
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "INSERT INTO core_task_fts(rowid, title, description, company_id) VALUES (999, 'ghost', '', 1)"
+            )
+
+        with self.assertRaises(CommandError):
+            call_command("rebuild_task_search", check=True, stdout=io.StringIO())
+
+        call_command("rebuild_task_search", optimize=True, stdout=io.StringIO())
+        call_command("rebuild_task_search", check=True, stdout=io.StringIO())
+
+    def test_matches_are_read_from_the_index(self):
+        qs = SQLiteFTSSearchBackend().search(
+            Task.objects.for_user(self.manager), ["login"], self.company.id
+        )
+        plan = qs[:10].explain()
+        self.assertIn("SCAN core_task_fts VIRTUAL TABLE INDEX", plan)
+        self.assertIn("SEARCH core_task USING INTEGER PRIMARY KEY", plan)
+
+    def test_fallback_backend_finds_the_same_tasks(self):
+        for title, description in (
+            ("Email digest", "weekly report"),
+            ("Report export", "email the csv"),
+            ("Billing report", ""),
+        ):
+            self.task(title, description)
+
+        qs = Task.objects.for_user(self.manager)
+        for query in ("report", "email report", "exp"):
+            with self.subTest(query=query):
+                terms = search_terms(query)
+                fts = SQLiteFTSSearchBackend().search(qs, terms, self.company.id)
+                scan = ContainsSearchBackend().search(qs, terms, self.company.id)
+                self.assertEqual(
+                    set(fts.values_list("id", flat=True)),
+                    set(scan.values_list("id", flat=True))
+                )
+
+
+class JobQueueTests(QueryBudgetTestMixin, AcmeTestCase):
+    """
+    Job endpoints answer 202 at once; the worker does the writes, retries
+    with backoff and keeps the counters in sync.
+    """
+    reportee_names = ("reportee-0", "reportee-1")
+    with_other_manager = True
+
+    def post(self, user, path, payload=None, **headers):
+        self.client.force_login(user)
+        return self.client.post(path, payload, content_type="application/json", headers=headers)
+
+    def run_jobs(self):
+        # inline: pool threads would not see the test transaction
+        return Worker(workers=0).run(once=True)
+
+    def test_bulk_assign_is_queued_then_run(self):
+        first, _ = self.reportees
+        task_ids = [
+            Task.objects.create(title=f"Task {i}", created_by=self.manager, company=self.company).id
+            for i in range(3)
+        ]
+        foreign = Task.objects.create(title="Foreign", created_by=self.other_manager, company=self.company)
+        call_command("rebuild_task_summary", stdout=io.StringIO())
+
+        response = self.post(
+            self.manager, "/jobs/tasks/assign",
+            {"task_ids": task_ids + [foreign.id], "assigned_to_id": first.id}
+        )
+        self.assertEqual(response.status_code, 202, response.content)
+        self.assertWithinQueryBudget(response)
+        data = response.json()
+        self.assertEqual(data["status"], Job.QUEUED)
+        self.assertEqual(response["Location"], data["status_url"])
+        self.assertFalse(Task.objects.filter(assigned_to=first).exists())
+
+        with mock.patch("core.jobs.TASK_BULK_MAX_SIZE", 2):
+            self.assertEqual(self.run_jobs(), 1)
+
+        response = self.client.get(f"/jobs/{data['job_id']}")
+        self.assertWithinQueryBudget(response)
+        data = response.json()
+        self.assertEqual(data["status"], Job.SUCCEEDED)
+        self.assertEqual(data["attempts"], 1)
+        self.assertEqual(data["result"], {
+            "assigned_to_id": first.id,
+            "updated": 3,
+            "skipped_task_ids": [foreign.id],
+        })
+        self.assertEqual(set(Task.objects.filter(assigned_to=first).values_list("id", flat=True)), set(task_ids))
+        self.assertEqual(drifted_task_counts(), [])
+
+        # only the user who queued a job can see it
+        self.client.force_login(self.other_manager)
+        self.assertEqual(self.client.get(f"/jobs/{data['job_id']}").status_code, 404)
+
+    def test_idempotency_key_returns_the_queued_job(self):
+        payload = {"task_ids": [1, 2], "assigned_to_id": self.reportees[0].id}
+
+        first = self.post(self.manager, "/jobs/tasks/assign", payload, idempotency_key="abc")
+        again = self.post(self.manager, "/jobs/tasks/assign", payload, idempotency_key="abc")
+        self.assertEqual((first.status_code, again.status_code), (202, 202))
+        self.assertEqual(first.json()["job_id"], again.json()["job_id"])
+
+        conflict = self.post(
+            self.manager, "/jobs/tasks/assign",
+            {**payload, "task_ids": [3]}, idempotency_key="abc"
+        )
+        self.assertEqual(conflict.status_code, 409)
+
+        # keys are per user
+        other = self.post(self.other_manager, "/jobs/tasks/assign", payload, idempotency_key="abc")
+        self.assertNotEqual(other.json()["job_id"], first.json()["job_id"])
+        self.assertEqual(Job.objects.count(), 2)
+
+    def test_failures_back_off_then_fail(self):
+        calls = []
+
+        def flaky(job):
+            calls.append(job.attempts)
+            raise RuntimeError("database is locked")
+
+        def invalid(job):
+            raise JobError("Nothing to do")
+
+        with mock.patch.dict(JOB_HANDLERS, {"test.flaky": flaky, "test.invalid": invalid}), \
+                mock.patch("core.jobs.retry_delay", return_value=60), \
+                self.assertLogs("core.jobs", "ERROR"):
+            job, _ = enqueue("test.flaky", {}, self.manager)
+            permanent, _ = enqueue("test.invalid", {}, self.manager)
+
+            self.assertEqual(self.run_jobs(), 2)
+            job.refresh_from_db()
+            self.assertEqual((job.status, job.attempts), (Job.QUEUED, 1))
+            self.assertEqual(job.error, "RuntimeError: database is locked")
+            self.assertGreater(job.run_after, timezone.now() + timedelta(seconds=50))
+
+            # not due yet
+            self.assertEqual(self.run_jobs(), 0)
+
+            while job.status == Job.QUEUED:
+                Job.objects.filter(id=job.id).update(run_after=timezone.now())
+                self.run_jobs()
+                job.refresh_from_db()
+
+        self.assertEqual(job.status, Job.FAILED)
+        self.assertEqual(calls, list(range(1, job.max_attempts + 1)))
+
+        permanent.refresh_from_db()
+        self.assertEqual((permanent.status, permanent.attempts, permanent.error), (Job.FAILED, 1, "Nothing to do"))
+
+    def test_stale_claims_are_released(self):
+        job, _ = enqueue("tasks.bulk_assign", {"task_ids": [], "assigned_to_id": None}, self.manager)
+        last, _ = enqueue("tasks.bulk_assign", {"task_ids": [], "assigned_to_id": None}, self.manager)
+        Job.objects.filter(id=last.id).update(max_attempts=1)
+
+        self.assertEqual(claim_jobs("dead-worker", 10), [job.id, last.id])
+        self.assertEqual(claim_jobs("other-worker", 10), [])
+        self.assertEqual(requeue_stale_jobs(), 0)
+
+        Job.objects.update(locked_at=timezone.now() - timedelta(days=1))
+        self.assertEqual(requeue_stale_jobs(), 2)
+
+        job.refresh_from_db()
+        last.refresh_from_db()
+        self.assertEqual((job.status, job.locked_by), (Job.QUEUED, ""))
+        self.assertEqual(last.status, Job.FAILED)
+
+        # the dead worker's late result does not overwrite the new claim
+        self.assertEqual(claim_jobs("other-worker", 10), [job.id])
+        Job.objects.filter(id=job.id, locked_by="dead-worker").update(status=Job.SUCCEEDED)
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.attempts), (Job.RUNNING, 2))
+
+    def test_offboarding_deactivates_and_moves_tasks(self):
+        leaving, successor = self.reportees
+        moved = [
+            Task.objects.create(title=f"Task {i}", created_by=self.manager, company=self.company, assigned_to=leaving)
+            for i in range(2)
+        ]
+        foreign = Task.objects.create(
+            title="Foreign", created_by=self.other_manager, company=self.company, assigned_to=leaving
+        )
+        call_command("rebuild_task_summary", stdout=io.StringIO())
+        token = issue_token(leaving)
+
+        self.assertEqual(
+            self.post(self.other_manager, f"/jobs/reportees/{leaving.id}/offboard").status_code, 404
+        )
+        self.assertEqual(
+            self.post(self.manager, f"/jobs/reportees/{leaving.id}/offboard", {"reassign_to_id": leaving.id}).status_code,
+            400
+        )
+
+        response = self.post(
+            self.manager, f"/jobs/reportees/{leaving.id}/offboard", {"reassign_to_id": successor.id}
+        )
+        self.assertEqual(response.status_code, 202, response.content)
+        self.assertWithinQueryBudget(response)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.run_jobs()
+
+        job = Job.objects.get(id=response.json()["job_id"])
+        self.assertEqual(job.status, Job.SUCCEEDED, job.error)
+        self.assertEqual(job.result["tasks_moved"], 2)
+
+        leaving.refresh_from_db()
+        self.assertFalse(leaving.is_active)
+        self.assertEqual(
+            set(Task.objects.filter(assigned_to=successor).values_list("id", flat=True)),
+            {task.id for task in moved}
+        )
+        self.assertEqual(Task.objects.get(id=foreign.id).assigned_to_id, leaving.id)
+        self.assertEqual(drifted_task_counts(), [])
+
+        self.client.logout()
+        response = self.client.get("/tasks", headers={"authorization": f"Bearer {token}"})
+        self.assertIn(response.status_code, (401, 403))
+
+    def test_offboarding_in_the_worker_ends_web_sessions(self):
+        leaving = self.reportees[0]
+        session = Client()
+        session.force_login(leaving)
+        self.assertEqual(session.get("/auth/me").status_code, 200)   # snapshot cached
+        token = issue_token(leaving)
+        self.assertEqual(
+            self.client.get("/auth/me", headers={"authorization": f"Bearer {token}"}).status_code, 200
+        )
+
+        response = self.post(self.manager, f"/jobs/reportees/{leaving.id}/offboard")
+        self.assertEqual(response.status_code, 202, response.content)
+
+        # run_jobs is its own process: only the shared caches are common
+        with (
+            mock.patch("core.authentication.caches", other_process_caches()),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            self.run_jobs()
+
+        self.assertEqual(Job.objects.get(id=response.json()["job_id"]).status, Job.SUCCEEDED)
+        self.assertEqual(session.get("/auth/me").status_code, 401)
+        self.client.logout()
+        self.assertEqual(
+            self.client.get("/auth/me", headers={"authorization": f"Bearer {token}"}).status_code, 401
+        )
+
+    def test_run_jobs_command(self):
+        enqueue("tasks.bulk_assign", {"task_ids": [], "assigned_to_id": self.reportees[0].id}, self.manager)
+
+        out = io.StringIO()
+        call_command("run_jobs", workers=0, once=True, stdout=out)
+        self.assertIn("stopped after 1 jobs", out.getvalue())
+        self.assertEqual(Job.objects.get().status, Job.SUCCEEDED)
+
+
+@override_settings(
+    REST_FRAMEWORK={**settings.REST_FRAMEWORK, "DEFAULT_THROTTLE_RATES": unthrottled_rates()}
+)
+class PasswordHashingTests(AcmeTestCase):
+    """
+    New passwords get the profile's hasher in a single INSERT; older
+    hashes are upgraded on login without ending the user's sessions.
+    """
+    reportee_names = ()
+
+    def login(self, username, password):
+        return self.client.post(
+            "/auth/login",
+            {"username": username, "password": password, "session": False},
+            content_type="application/json"
+        )
+
+    def test_users_are_created_with_one_insert(self):
+        with CaptureQueriesContext(connection) as signup:
+            response = self.client.post("/auth/signup", {
+                "username": "founder",
+                "password": "correct-horse-battery",
+                "company_name": "Initech",
+            }, content_type="application/json")
+        self.assertEqual(response.status_code, 201, response.content)
+
+        self.client.force_login(self.manager)
+        with CaptureQueriesContext(connection) as create:
+            response = self.client.post("/users/reportees", {
+                "username": "reportee",
+                "password": "correct-horse-battery",
+            }, content_type="application/json")
+        self.assertEqual(response.status_code, 201, response.content)
+
+        for queries in (signup, create):
+            user_writes = [
+                query["sql"] for query in queries.captured_queries
+                if query["sql"].startswith(("INSERT INTO \"core_user\"", "UPDATE \"core_user\""))
+            ]
+            self.assertEqual(len(user_writes), 1, user_writes)
+            self.assertTrue(user_writes[0].startswith("INSERT"))
+
+        for username in ("founder", "reportee"):
+            password = User.objects.get(username=username).password
+            self.assertEqual(identify_hasher(password).algorithm, get_hasher().algorithm)
+
+    def test_login_rehashes_older_hashes_and_keeps_tokens(self):
+        legacy = make_password("secret", hasher="pbkdf2_sha256")
+        User.objects.filter(id=self.manager.id).update(password=legacy)
+        token = issue_token(self.manager)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.login("manager", "secret")
+        self.assertEqual(response.status_code, 200, response.content)
+
+        rehashed = User.objects.get(id=self.manager.id).password
+        self.assertEqual(identify_hasher(rehashed).algorithm, get_hasher().algorithm)
+        self.assertFalse(get_hasher().must_update(rehashed))
+
+        # same password: earlier tokens stay valid
+        response = self.client.get("/auth/me", headers={"authorization": f"Bearer {token}"})
+        self.assertEqual(response.status_code, 200)
+
+        # up to date: no further writes
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.login("manager", "secret").status_code, 200)
+        self.assertFalse(any(q["sql"].startswith("UPDATE") for q in queries.captured_queries))
+        self.assertEqual(self.login("manager", "wrong").status_code, 401)
+
+    def test_hashing_beyond_the_pool_and_queue_is_turned_away(self):
+        with mock.patch("core.hashers._slots") as slots:
+            slots.acquire.return_value = False
+            response = self.login("manager", "secret")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(response["Retry-After"], "1")
+
+    def test_hashing_runs_on_the_pool(self):
+        self.assertTrue(run_bounded(lambda: threading.current_thread().name).startswith("password-hash"))
+
+
+@override_settings(
+    REST_FRAMEWORK={**settings.REST_FRAMEWORK, "DEFAULT_THROTTLE_RATES": unthrottled_rates()}
+)
+class ReporteeProvisioningTests(QueryBudgetTestMixin, AcmeTestCase):
+    """
+    Batch creation reports every row, checks usernames with one query and
+    never creates a username twice.
+    """
+    reportee_names = ("taken",)
+
+    def post(self, user, payload):
+        self.client.force_login(user)
+        return self.client.post("/users/reportees/bulk", payload, content_type="application/json")
+
+    def test_batch_reports_every_row(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post(self.manager, [
+                {"username": "ada", "password": "pw-1"},
+                {"username": "taken", "password": "pw-2"},
+                {"username": "ada", "password": "pw-3"},
+                {"username": "bob"},
+                {"username": "cy", "password": "pw-5"},
+            ])
+        self.assertEqual(response.status_code, 207, response.content)
+        self.assertWithinQueryBudget(response)
+
+        data = response.json()
+        self.assertEqual((data["created"], data["failed"]), (2, 3))
+        self.assertGreater(data["rows_per_second"], 0)
+        results = data["results"]
+        self.assertEqual([result["index"] for result in results], list(range(5)))
+        self.assertEqual(results[1]["errors"], {"username": ["Username already exists"]})
+        self.assertEqual(results[2]["errors"], {"username": ["Duplicate username in this batch"]})
+        self.assertIn("password", results[3]["errors"])
+
+        for result, password in ((results[0], "pw-1"), (results[4], "pw-5")):
+            user = User.objects.get(id=result["id"])
+            self.assertEqual(
+                (user.username, user.role, user.manager_id, user.company_id),
+                (result["username"], "REPORTEE", self.manager.id, self.company.id)
+            )
+            self.assertTrue(user.check_password(password))
+
+        username_checks = [
+            query["sql"] for query in queries.captured_queries
+            if query["sql"].startswith('SELECT "core_user"."username"')
+        ]
+        self.assertEqual(len(username_checks), 1)
+
+    def test_rejected_batches(self):
+        self.assertEqual(self.post(self.manager, []).status_code, 400)
+        self.assertEqual(self.post(self.manager, [{"username": "taken", "password": "pw"}]).status_code, 400)
+        self.assertEqual(self.post(self.reportee, [{"username": "new", "password": "pw"}]).status_code, 403)
+
+        with mock.patch("core.views.user.REPORTEE_BULK_MAX_SIZE", 1):
+            response = self.post(self.manager, [{"username": f"u{i}", "password": "pw"} for i in range(2)])
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(User.objects.filter(username__in=["new", "u0", "u1"]).exists())
+
+    def test_username_taken_after_the_check_is_reported(self):
+        def hash_and_race(passwords):
+            User.objects.create_user(username="late", password="x", role="REPORTEE", company=self.company)
+            return [f"hash-{i}" for i in range(len(passwords))]
+
+        results = provision_reportee_chunk(
+            self.manager,
+            [{"username": "early", "password": "a"}, {"username": "late", "password": "b"}],
+            start=10,
+            hash_passwords=hash_and_race
+        )
+
+        self.assertEqual(results[0]["index"], 10)
+        self.assertEqual(User.objects.get(id=results[0]["id"]).manager_id, self.manager.id)
+        self.assertEqual(results[1], {"index": 11, "errors": {"username": ["Username already exists"]}})
+
+    def test_other_integrity_errors_are_not_retried(self):
+        # e.g. the manager deleted meanwhile: no username to drop
+        with mock.patch.object(User.objects, "bulk_create", side_effect=IntegrityError("FOREIGN KEY")) as bulk_create:
+            with self.assertRaises(IntegrityError):
+                provision_reportee_chunk(
+                    self.manager,
+                    [{"username": "early", "password": "a"}],
+                    hash_passwords=lambda passwords: ["hash"] * len(passwords)
+                )
+
+        self.assertEqual(bulk_create.call_count, 1)
+
+    def test_import_command_reads_every_format(self):
+        files = {
+            "csv": "username,password\nimp-1,pw\ntaken,pw\nimp-2,\nimp-3,pw\n",
+            "json": json.dumps([{"username": "imp-1", "password": "pw"}, {"username": "taken", "password": "pw"}]),
+            "ndjson": '{"username": "imp-1", "password": "pw"}\n\n{"username": "imp-2", "password": "pw"}\n',
+        }
+        expected = {"csv": (2, 2), "json": (1, 1), "ndjson": (2, 0)}
+
+        for fmt, content in files.items():
+            with self.subTest(fmt=fmt), tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, f"team.{fmt}")
+                with open(path, "w") as f:
+                    f.write(content)
+
+                out, err = io.StringIO(), io.StringIO()
+                call_command(
+                    "import_reportees", path, manager="manager", workers=0, chunk_size=2,
+                    stdout=out, stderr=err
+                )
+
+                created, failed = expected[fmt]
+                self.assertIn(f"Created {created} reportees for manager, {failed} rows failed", out.getvalue())
+                self.assertEqual(err.getvalue().count("row "), failed)
+                if fmt == "csv":
+                    self.assertIn("row 2: ", err.getvalue())
+                    self.assertIn("row 3: ", err.getvalue())
+                User.objects.filter(username__startswith="imp-").delete()
+
+    def test_import_command_hashes_on_a_process_pool(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".csv") as f:
+            f.write("username,password\n" + "".join(f"pool-{i},pw-{i}\n" for i in range(4)))
+            f.flush()
+            call_command("import_reportees", f.name, manager="manager", workers=2, stdout=io.StringIO())
+
+        self.assertTrue(User.objects.get(username="pool-3").check_password("pw-3"))
+
+    def test_import_command_rejects_bad_input(self):
+        with self.assertRaises(CommandError):
+            call_command("import_reportees", "team.csv", manager="taken", stdout=io.StringIO())
+        with self.assertRaises(CommandError):
+            call_command("import_reportees", "team.txt", manager="manager", stdout=io.StringIO())
+
+        with tempfile.TemporaryDirectory() as directory:
+            for path in (os.path.join(directory, "missing.csv"), directory):
+                with self.subTest(path=path), self.assertRaisesMessage(CommandError, "Cannot open"):
+                    call_command("import_reportees", path, manager="manager", format="csv", stdout=io.StringIO())
+
+
+class TaskArchiveTests(QueryBudgetTestMixin, AcmeTestCase):
+    """
+    Deleted tasks are out of every default query; old finished tasks move
+    to the archive without leaving the counters, the change log or the
+    search index behind.
+    """
+
+    def task(self, title, age_days=0, **fields):
+        task = Task.objects.create(title=title, created_by=self.manager, company=self.company, **fields)
+        Task.all_objects.filter(id=task.id).update(updated_at=timezone.now() - timedelta(days=age_days))
+        return task
+
+    def archive(self, **options):
+        out = io.StringIO()
+        call_command("archive_tasks", days=30, stdout=out, **options)
+        return out.getvalue()
+
+    def test_default_manager_leaves_deleted_tasks_out(self):
+        live = self.task("Live")
+        deleted = self.task("Deleted", is_deleted=True)
+
+        self.assertEqual(list(Task.objects.values_list("id", flat=True)), [live.id])
+        self.assertEqual(self.manager.created_tasks.count(), 1)
+        self.assertEqual(Task.all_objects.count(), 2)
+
+        # saves reach deleted tasks through the base manager
+        deleted.title = "Renamed"
+        deleted.save()
+        self.assertEqual(Task.all_objects.get(id=deleted.id).title, "Renamed")
+
+    def test_archive_moves_old_finished_tasks(self):
+        old_deleted = self.task("Old deleted", age_days=40, is_deleted=True)
+        old_completed = self.task("Old completed", age_days=40, status="COMPLETED", assigned_to=self.reportee)
+        old_open = self.task("Old open", age_days=40)
+        recent = [
+            self.task("Recent deleted", age_days=5, is_deleted=True),
+            self.task("Recent completed", age_days=5, status="COMPLETED"),
+        ]
+        call_command("rebuild_task_summary", stdout=io.StringIO())
+
+        self.assertIn("2 tasks would be archived", self.archive(dry_run=True))
+        self.assertIn("1 tasks would be archived", self.archive(dry_run=True, deleted_only=True))
+        self.assertEqual(TaskArchive.objects.count(), 0)
+
+        self.assertIn("Archived 2 tasks (1 deleted, 1 completed) in 2 chunks", self.archive(chunk_size=1))
+
+        self.assertEqual(set(TaskArchive.objects.values_list("id", flat=True)), {old_deleted.id, old_completed.id})
+        self.assertEqual(
+            set(Task.all_objects.values_list("id", flat=True)),
+            {old_open.id, *(task.id for task in recent)}
+        )
+        archived = TaskArchive.objects.get(id=old_completed.id)
+        self.assertEqual(
+            (archived.title, archived.status, archived.assigned_to_id, archived.is_deleted),
+            ("Old completed", "COMPLETED", self.reportee.id, False)
+        )
+
+        # the live task left the users' views like a delete would
+        self.assertEqual(drifted_task_counts(), [])
+        self.assertEqual(
+            set(TaskChange.objects.filter(task_id=old_completed.id, kind="deleted").values_list("user_id", flat=True)),
+            {self.manager.id, self.reportee.id}
+        )
+        if connection.vendor == "sqlite":
+            call_command("rebuild_task_search", check=True, stdout=io.StringIO())
+
+        self.assertIn("Archived 0 tasks", self.archive())
+
+    def test_archive_endpoint_pages_through_visible_tasks(self):
+        mine = self.task("Mine", age_days=50, status="COMPLETED", assigned_to=self.reportee)
+        gone = self.task("Gone", age_days=40, is_deleted=True)
+        self.archive()
+
+        with mock.patch("core.views.task.TASK_LIST_PAGINATION_SIZE", 1):
+            self.client.force_login(self.manager)
+            first = self.client.get("/tasks/archive")
+            self.assertWithinQueryBudget(first)
+            second = self.client.get("/tasks/archive", {"cursor": first.json()["next_cursor"]})
+
+        self.assertEqual([task["task_id"] for task in first.json()["tasks"]], [gone.id])
+        self.assertTrue(first.json()["tasks"][0]["is_deleted"])
+        self.assertEqual([task["task_id"] for task in second.json()["tasks"]], [mine.id])
+        self.assertIsNone(second.json()["next_cursor"])
+        self.assertEqual(self.client.get("/tasks/archive", {"cursor": "nope"}).status_code, 400)
+
+        self.client.force_login(self.reportee)
+        self.assertEqual(
+            [task["task_id"] for task in self.client.get("/tasks/archive").json()["tasks"]],
+            [mine.id]
+        )
+
+    def test_archive_endpoint_takes_tokens_and_the_list_rate_limit(self):
+        bearer = {"authorization": f"Bearer {issue_token(self.manager)}"}
+        limit = int(TASK_LIST_RATE.split("/")[0])
+
+        statuses = [self.client.get("/tasks/archive", headers=bearer).status_code for _ in range(limit + 1)]
+
+        self.assertEqual(statuses, [200] * limit + [429])
@@ -1,4 +1,173 @@
-from rest_framework.throttling import UserRateThrottle, AnonRateThrottle
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+
+from django.core.cache import caches
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+from rest_framework import throttling
+from rest_framework.settings import api_settings
+
+from core.config import THROTTLE_BACKEND, THROTTLE_BACKEND_OPTIONS
+
+
+class CacheThrottleBackend:
+    """
+    Counters in a Django cache alias.
+
+    ``incr`` maps to the cache's own increment, which is atomic on Redis
+    and Memcached. The alias must be a cache every worker shares (the
+    system checks refuse locmem), or each worker gets a limit of its own.
+    """
+
+    def __init__(self, alias="default"):
+        self.alias = alias
+
+    def incr(self, key, ttl, delta=1):
+        cache = caches[self.alias]
+        cache.add(key, 0, ttl)
+        try:
+            return cache.incr(key, delta)
+        except ValueError:
+            # expired between add() and incr()
+            cache.add(key, delta, ttl)
+            return delta
+
+    def get(self, key):
+        return caches[self.alias].get(key, 0)
+
+
+class SQLiteThrottleBackend:
+    """
+    Counters in a local SQLite file, shared by every process on the host.
+
+    Each hit is a single UPSERT, so increments are atomic without any
+    read-modify-write in Python. The default backend; deployments spread
+    over several hosts need a shared cache instead.
+    """
+
+    PURGE_EVERY = 1000
+
+    def __init__(self, path):
+        self.path = str(path)
+        self.local = threading.local()
+        self.calls = 0
+
+    def connection(self):
+        conn = getattr(self.local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS throttle_counter ("
+                " key TEXT PRIMARY KEY,"
+                " count INTEGER NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+            self.local.conn = conn
+        return conn
+
+    def incr(self, key, ttl, delta=1):
+        now = time.time()
+        conn = self.connection()
+
+        self.calls += 1
+        if self.calls % self.PURGE_EVERY == 0:
+            conn.execute("DELETE FROM throttle_counter WHERE expires_at <= ?", (now,))
+
+        (count,) = conn.execute(
+            "INSERT INTO throttle_counter (key, count, expires_at)"
+            " VALUES (?, ?, ?)"
+            " ON CONFLICT (key) DO UPDATE SET"
+            "  count = CASE WHEN expires_at <= ? THEN excluded.count"
+            "          ELSE count + excluded.count END,"
+            "  expires_at = CASE WHEN expires_at <= ? THEN excluded.expires_at"
+            "               ELSE expires_at END"
+            " RETURNING count",
+            (key, delta, now + ttl, now, now),
+        ).fetchone()
+        return count
+
+    def get(self, key):
+        row = self.connection().execute(
+            "SELECT count FROM throttle_counter WHERE key = ? AND expires_at > ?",
+            (key, time.time()),
+        ).fetchone()
+        return row[0] if row else 0
+
+
+@lru_cache(maxsize=None)
+def get_throttle_backend():
+    return import_string(THROTTLE_BACKEND)(**THROTTLE_BACKEND_OPTIONS)
+
+
+class SlidingWindowRateThrottle(throttling.SimpleRateThrottle):
+    """
+    Sliding-window counter throttle.
+
+    Keeps two integers per client (this window and the previous one)
+    instead of DRF's list of timestamps, and counts with an atomic
+    increment instead of read-modify-write. The previous window is
+    weighted by how much of it still overlaps the sliding window.
+    """
+
+    def get_rate(self):
+        # read at call time so rate changes in settings take effect
+        try:
+            return api_settings.DEFAULT_THROTTLE_RATES[self.scope]
+        except KeyError:
+            raise ImproperlyConfigured(
+                f"No default throttle rate set for '{self.scope}' scope"
+            )
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        backend = get_throttle_backend()
+        now = self.timer()
+        window = int(now // self.duration)
+        elapsed = (now % self.duration) / self.duration
+
+        current_key = f"{self.key}:{window}"
+        count = backend.incr(current_key, ttl=2 * self.duration)
+        previous = backend.get(f"{self.key}:{window - 1}")
+
+        if previous * (1 - elapsed) + count <= self.num_requests:
+            return True
+
+        # rejected requests do not use up the budget
+        backend.incr(current_key, ttl=2 * self.duration, delta=-1)
+        self.count, self.previous, self.elapsed = count - 1, previous, elapsed
+        return False
+
+    def wait(self):
+        """
+        Seconds until one more request fits under the limit.
+        """
+        room = self.num_requests - 1 - self.count
+
+        # fits later in this window, once enough of the previous one fades
+        if room >= 0 and self.previous:
+            fade = 1 - room / self.previous
+            return max(0.0, fade - self.elapsed) * self.duration
+
+        # otherwise this window's count becomes the fading one
+        fade = 1 - (self.num_requests - 1) / self.count if self.count else 0
+        return (1 - self.elapsed + max(0.0, fade)) * self.duration
+
+
+class AnonRateThrottle(SlidingWindowRateThrottle, throttling.AnonRateThrottle):
+    pass
+
+
+class UserRateThrottle(SlidingWindowRateThrottle, throttling.UserRateThrottle):
+    pass
 
 
 class SignupRateThrottle(AnonRateThrottle):
@@ -13,5 +182,17 @@ class TaskCreateRateThrottle(UserRateThrottle):
     scope = "task_create"
 
 
+class TaskBulkCreateRateThrottle(UserRateThrottle):
+    scope = "task_bulk_create"
+
+
 class TaskListRateThrottle(UserRateThrottle):
     scope = "task_list"
+
+
+class TaskExportRateThrottle(UserRateThrottle):
+    scope = "task_export"
+
+
+class TaskSearchRateThrottle(UserRateThrottle):
+    scope = "task_search"
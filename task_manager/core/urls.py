@@ -1,7 +1,11 @@
 from django.urls import path
 from core.views.auth import FreeResourceAPIView, LoginAPIView, LogoutAPIView, ManagerSignupAPIView, MeAPIView
-from core.views.user import CreateReporteeAPIView
-from core.views.task import TaskAssignAPIView, TaskCreateAPIView, TaskDeleteAPIView, TaskListAPIView, TaskStatusByManagerAPIView, TaskStatusByReporteeAPIView
+from core.views.user import BulkCreateReporteeAPIView, CreateReporteeAPIView
+from core.views.metrics import RouteMetricsAPIView
+from core.views.events import TaskEventStreamView
+from core.views.job import JobStatusAPIView, ReporteeOffboardJobAPIView, TaskBulkAssignJobAPIView
+from core.views.task_async import AsyncTaskAssignAPIView, AsyncTaskCreateAPIView, AsyncTaskListAPIView, AsyncTaskStatusByManagerAPIView, AsyncTaskStatusByReporteeAPIView
+from core.views.task import TaskArchiveAPIView, TaskAssignAPIView, TaskBulkAssignAPIView, TaskBulkCreateAPIView, TaskBulkStatusByManagerAPIView, TaskChangesAPIView, TaskCreateAPIView, TaskDeleteAPIView, TaskExportAPIView, TaskListAPIView, TaskSearchAPIView, TaskStatusByManagerAPIView, TaskStatusByReporteeAPIView, TaskSummaryAPIView
 
 urlpatterns = [
     path("auth/signup", ManagerSignupAPIView.as_view()), # TO SIGN UP manager
@@ -9,13 +13,35 @@ urlpatterns = [
     path("auth/logout", LogoutAPIView.as_view()), # TO LOGOUT
     path("auth/me", MeAPIView.as_view()),    # TO GET LOGGED IN USER DETAILS
     path("users/reportees", CreateReporteeAPIView.as_view()), # TO CREATE REPORTEE by manager only
+    path("users/reportees/bulk", BulkCreateReporteeAPIView.as_view()), # TO CREATE MANY REPORTEES at once by manager only
 
     path("tasks", TaskListAPIView.as_view()), # TO LIST TASKS reportee/manager
+    path("tasks/events", TaskEventStreamView.as_view()), # TO STREAM TASK CHANGES as server-sent events reportee/manager
+    path("tasks/changes", TaskChangesAPIView.as_view()), # TO SYNC TASKS CHANGED SINCE A TOKEN reportee/manager
+    path("tasks/summary", TaskSummaryAPIView.as_view()), # TO COUNT TASKS PER STATUS for dashboards reportee/manager
+    path("tasks/search", TaskSearchAPIView.as_view()), # TO SEARCH TASK TITLES AND DESCRIPTIONS reportee/manager
+    path("tasks/export", TaskExportAPIView.as_view()), # TO STREAM ALL VISIBLE TASKS as NDJSON or CSV
+    path("tasks/archive", TaskArchiveAPIView.as_view()), # TO LIST ARCHIVED TASKS reportee/manager
     path("tasks/create", TaskCreateAPIView.as_view()), # TO CREATE TASK by manager only
+    path("tasks/bulk", TaskBulkCreateAPIView.as_view()), # TO CREATE MANY TASKS at once by manager only
+    path("tasks/bulk/assign", TaskBulkAssignAPIView.as_view()), # TO ASSIGN MANY TASKS by manager only
+    path("tasks/bulk/status", TaskBulkStatusByManagerAPIView.as_view()), # TO UPDATE STATUS OF MANY TASKS by manager only
     path("tasks/<int:task_id>/assign", TaskAssignAPIView.as_view()), # TO ASSIGN TASK by manager only to reportee created by them only
     path("tasks/<int:task_id>", TaskDeleteAPIView.as_view()), # TO DELETE TASK by manager only
     path("tasks/<int:task_id>/status", TaskStatusByManagerAPIView.as_view()), # TO UPDATE TASK STATUS by manager only
     path("tasks/<int:task_id>/self", TaskStatusByReporteeAPIView.as_view()), # TO UPDATE OWN TASK STATUS by reportee only 
 
+    path("async/tasks", AsyncTaskListAPIView.as_view()), # SAME AS tasks, ASGI-native
+    path("async/tasks/create", AsyncTaskCreateAPIView.as_view()), # SAME AS tasks/create, ASGI-native
+    path("async/tasks/<int:task_id>/assign", AsyncTaskAssignAPIView.as_view()), # SAME AS tasks/<id>/assign, ASGI-native
+    path("async/tasks/<int:task_id>/status", AsyncTaskStatusByManagerAPIView.as_view()), # SAME AS tasks/<id>/status, ASGI-native
+    path("async/tasks/<int:task_id>/self", AsyncTaskStatusByReporteeAPIView.as_view()), # SAME AS tasks/<id>/self, ASGI-native
+
+    path("jobs/tasks/assign", TaskBulkAssignJobAPIView.as_view()), # TO ASSIGN ANY NUMBER OF TASKS in the background by manager only
+    path("jobs/reportees/<int:reportee_id>/offboard", ReporteeOffboardJobAPIView.as_view()), # TO OFFBOARD A REPORTEE in the background by manager only
+    path("jobs/<int:job_id>", JobStatusAPIView.as_view()), # TO CHECK A BACKGROUND JOB queued by the user
+
+    path("metrics/routes", RouteMetricsAPIView.as_view()), # TO VIEW PER-ROUTE TIMINGS by staff only
+
     path("free-resource", FreeResourceAPIView.as_view()),  # New free resource endpoint with no authentication, ignore it
 ]
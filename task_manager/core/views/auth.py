@@ -10,13 +10,22 @@ from core.serializers.auth import ManagerSignupSerializer
 from django.utils.decorators import method_decorator
 from django.views.decorators.csrf import csrf_exempt
 
-from core.authentication import CsrfExemptSessionAuthentication
+from core.authentication import (
+    CsrfExemptSessionAuthentication,
+    SignedTokenAuthentication,
+    issue_token,
+    remember_principal,
+    revoke_token,
+)
+from core.config import AUTH_TOKEN_MAX_AGE
+from core.routers import ReplicaReadsMixin
 from core.throttles import LoginRateThrottle, SignupRateThrottle, TaskCreateRateThrottle
 
 class ManagerSignupAPIView(APIView):
     throttle_classes = [SignupRateThrottle]
     authentication_classes = []
     permission_classes = []
+    query_budget = 6
 
     def post(self, request):
         serializer = ManagerSignupSerializer(data=request.data)
@@ -27,14 +36,13 @@ class ManagerSignupAPIView(APIView):
             name=serializer.validated_data["company_name"]
         )
 
-        # Create manager
-        manager = User.objects.create(
+        # Create manager (password hashed before the INSERT)
+        manager = User.objects.create_user(
             username=serializer.validated_data["username"],
+            password=serializer.validated_data["password"],
             role="MANAGER",
             company=company
         )
-        manager.set_password(serializer.validated_data["password"])
-        manager.save()
 
         return Response(
             {
@@ -49,6 +57,7 @@ class LoginAPIView(APIView):
     throttle_classes = [LoginRateThrottle]
     authentication_classes = []
     permission_classes = []
+    query_budget = 9
 
     def post(self, request):
         username = request.data.get("username")
@@ -72,25 +81,39 @@ class LoginAPIView(APIView):
                 status=status.HTTP_401_UNAUTHORIZED
             )
 
-        #  creates session (Django handles cookie)
-        login(request, user)
+        # Token-only clients ("session": false) skip the session row write
+        if request.data.get("session", True) is not False:
+            #  creates session (Django handles cookie)
+            login(request, user)
+            remember_principal(request, user)
 
         return Response(
-            {"message": "Login successful"},
+            {
+                "message": "Login successful",
+                "token": issue_token(user),
+                "token_type": SignedTokenAuthentication.keyword,
+                "expires_in": AUTH_TOKEN_MAX_AGE,
+            },
             status=status.HTTP_200_OK
         )
 
 class LogoutAPIView(APIView):
-    authentication_classes = [CsrfExemptSessionAuthentication]
+    authentication_classes = [SignedTokenAuthentication, CsrfExemptSessionAuthentication]
     permission_classes = [IsAuthenticated]
+    query_budget = 5
 
     def post(self, request):
-        logout(request)
+        # request.auth is the token payload for bearer requests
+        if request.auth:
+            revoke_token(request.auth)
+        else:
+            logout(request)
         return Response({"message": "Logged out successfully"})
 
 
-class MeAPIView(APIView):
+class MeAPIView(ReplicaReadsMixin, APIView):
     permission_classes = [IsAuthenticated]
+    query_budget = 5
 
     def get(self, request):
         return Response({
@@ -103,6 +126,7 @@ class MeAPIView(APIView):
 class FreeResourceAPIView(APIView):
     authentication_classes = []
     permission_classes = []
+    query_budget = 0
 
     def get(self, request):
         return Response({"message": "This is a free resource accessible without authentication."})
\ No newline at end of file
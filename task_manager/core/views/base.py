@@ -0,0 +1,150 @@
+# core/views/base.py
+import io
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions
+from rest_framework.parsers import DataAndFiles
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+
+from core.authentication import CsrfExemptSessionAuthentication, SignedTokenAuthentication
+from core.rendering import json_response
+from core.routers import choose_replica, replica_alias
+
+
+class AsyncAPIView(View):
+    """
+    Minimal async counterpart of DRF's APIView.
+
+    DRF dispatches synchronously, so under ASGI every APIView runs in a
+    worker thread for its whole lifetime. Subclasses of this view define
+    ``async def`` handlers and run on the event loop; only ORM and cache
+    calls leave it. Authentication, permission, throttle and parser
+    classes, the JSON wire format and the error bodies are the same as
+    DRF's, so a client cannot tell the two apart.
+
+    Handlers get the plain HttpRequest with ``user``, ``auth`` and ``data``
+    filled in, and return ``self.render(data, status)``.
+    """
+
+    authentication_classes = [SignedTokenAuthentication, CsrfExemptSessionAuthentication]
+    permission_classes = [IsAuthenticated]
+    throttle_classes = api_settings.DEFAULT_THROTTLE_CLASSES
+    parser_classes = api_settings.DEFAULT_PARSER_CLASSES
+    content_negotiation_class = api_settings.DEFAULT_CONTENT_NEGOTIATION_CLASS
+    query_budget = None
+    read_replica = False   # route the handler's reads like ReplicaReadsMixin
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # Authentication decides about CSRF, same as DRF's APIView
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def dispatch(self, request, *args, **kwargs):
+        replica_token = None
+        try:
+            await self.initial(request)
+
+            handler = None
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), None)
+            if handler is None:
+                raise exceptions.MethodNotAllowed(request.method)
+
+            if self.read_replica:
+                replica_token = replica_alias.set(
+                    await sync_to_async(choose_replica)(request.user)
+                )
+
+            return await handler(request, *args, **kwargs)
+        except Exception as exc:
+            return self.handle_exception(request, exc)
+        finally:
+            if replica_token is not None:
+                replica_alias.reset(replica_token)
+
+    async def initial(self, request):
+        request.data = self.parse(request)
+        await self.perform_authentication(request)
+        self.check_permissions(request)
+        await sync_to_async(self.check_throttles)(request)
+
+    def parse(self, request):
+        # the parsers and negotiation of a DRF Request, so the same JSON,
+        # form and multipart bodies are accepted
+        if not request.body:
+            return {}
+
+        parsers = [parser_class() for parser_class in self.parser_classes]
+        parser = self.content_negotiation_class().select_parser(request, parsers)
+        if parser is None:
+            raise exceptions.UnsupportedMediaType(request.content_type)
+
+        parsed = parser.parse(
+            io.BytesIO(request.body),
+            request.META.get("CONTENT_TYPE", ""),
+            {"view": self, "request": request, "encoding": request.encoding or settings.DEFAULT_CHARSET}
+        )
+        return parsed.data if isinstance(parsed, DataAndFiles) else parsed
+
+    async def perform_authentication(self, request):
+        request.user, request.auth = AnonymousUser(), None
+
+        for authentication_class in self.authentication_classes:
+            result = await authentication_class().aauthenticate(request)
+            if result is not None:
+                request.user, request.auth = result
+                return
+
+    def check_permissions(self, request):
+        for permission_class in self.permission_classes:
+            permission = permission_class()
+            if permission.has_permission(request, self):
+                continue
+
+            if not request.user.is_authenticated:
+                raise exceptions.NotAuthenticated()
+
+            raise exceptions.PermissionDenied(
+                getattr(permission, "message", None),
+                getattr(permission, "code", None)
+            )
+
+    def check_throttles(self, request):
+        waits = [
+            throttle.wait()
+            for throttle in (throttle_class() for throttle_class in self.throttle_classes)
+            if not throttle.allow_request(request, self)
+        ]
+
+        if waits:
+            waits = [wait for wait in waits if wait is not None]
+            raise exceptions.Throttled(max(waits, default=None))
+
+    def handle_exception(self, request, exc):
+        if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+            exc.status_code = 401
+            www_authenticate = self.authentication_classes[0]().authenticate_header(request)
+        else:
+            www_authenticate = None
+
+        response = api_settings.EXCEPTION_HANDLER(exc, {"view": self, "request": request})
+        if response is None:
+            raise exc
+
+        rendered = self.render(response.data, response.status_code)
+        for header, value in response.items():
+            if header.lower() != "content-type":
+                rendered[header] = value
+        if www_authenticate:
+            rendered["WWW-Authenticate"] = www_authenticate
+
+        return rendered
+
+    def render(self, data, status=200):
+        return json_response(self.request, JSONRenderer().render, data, status=status)
@@ -0,0 +1,119 @@
+# core/views/events.py
+import asyncio
+import json
+
+from asgiref.sync import sync_to_async
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+from core.changes import ChangeLogExpired, changes_since, latest_change_id
+from core.config import SSE_HEARTBEAT_SECONDS, SSE_MAX_STREAM_SECONDS, SSE_RETRY_MS
+from core.events import get_event_backend
+from core.views.base import AsyncAPIView
+from core.views.task import TaskListAPIView
+
+
+def format_event(data, event=None, event_id=None):
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event is not None:
+        lines.append(f"event: {event}")
+    lines.append("data: " + json.dumps(data, cls=JSONEncoder, separators=(",", ":")))
+    return "\n".join(lines) + "\n\n"
+
+
+@sync_to_async
+def read_events(user, after):
+    """
+    SSE frames for the user's changes after ``after``, and the new position.
+    """
+    entries, live, has_more = changes_since(user, after)
+
+    frames = []
+    for change_id, task_id, kind in entries:
+        task = live.get(task_id)
+        frames.append(format_event(
+            {
+                "task_id": task_id,
+                # None: deleted or no longer visible to this user
+                "task": TaskListAPIView.serialize_task(task) if task else None,
+            },
+            event=f"task.{kind}",
+            event_id=change_id
+        ))
+
+    return frames, (entries[-1][0] if entries else after), has_more
+
+
+class TaskEventStreamView(AsyncAPIView):
+    """
+    Server-sent events for the user's tasks: ``task.created``,
+    ``task.assigned``, ``task.status`` and ``task.deleted``.
+
+    Event ids are TaskChange ids. Reconnecting with ``Last-Event-ID``
+    (EventSource does it automatically) replays everything missed; an id
+    older than the retained log gets a ``reset`` event, after which the
+    client should do a full sync. Comments are sent as heartbeats, and
+    the stream ends after SSE_MAX_STREAM_SECONDS so clients reconnect
+    (and re-authenticate) regularly.
+
+    Serve it from the ASGI app: under WSGI every open stream pins a
+    worker thread.
+    """
+    query_budget = 6
+
+    async def get(self, request):
+        user = request.user
+
+        if user.role not in ("MANAGER", "REPORTEE"):
+            return self.render({"detail": "Invalid role"}, status=403)
+
+        last_event_id = request.headers.get("Last-Event-ID") or request.GET.get("last_event_id")
+        if last_event_id is not None and not last_event_id.isdigit():
+            return self.render({"detail": "Invalid Last-Event-ID"}, status=400)
+
+        response = StreamingHttpResponse(
+            self.stream(user, None if last_event_id is None else int(last_event_id)),
+            content_type="text/event-stream"
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"   # don't let nginx buffer events
+        return response
+
+    async def stream(self, user, position):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + SSE_MAX_STREAM_SECONDS
+
+        # subscribed here rather than in get(): only a started generator
+        # runs the finally that closes it, and a client may disconnect
+        # before the first iteration
+        subscription = get_event_backend().subscribe(user.id)
+        try:
+            # subscribed before reading the start position so nothing
+            # falls between
+            if position is None:
+                position = await sync_to_async(latest_change_id)()
+
+            yield f"retry: {SSE_RETRY_MS}\n\n"
+
+            while True:
+                has_more = True
+                while has_more:
+                    try:
+                        frames, position, has_more = await read_events(user, position)
+                    except ChangeLogExpired:
+                        yield format_event({"detail": "Event log expired, do a full sync"}, event="reset")
+                        return
+
+                    for frame in frames:
+                        yield frame
+
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return
+
+                if not await subscription.wait(min(SSE_HEARTBEAT_SECONDS, remaining)):
+                    yield ": heartbeat\n\n"
+        finally:
+            subscription.close()
@@ -0,0 +1,171 @@
+# core/views/job.py
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+
+from core.models import Job, User
+from core.serializers.job import ReporteeOffboardSerializer, TaskBulkAssignJobSerializer
+from core.authentication import CsrfExemptSessionAuthentication, SignedTokenAuthentication
+from core.permissions.base import HasPermission
+from core.jobs import enqueue
+
+
+def job_status_url(request, job):
+    return request.build_absolute_uri(f"/jobs/{job.id}")
+
+
+def serialize_job(request, job):
+    return {
+        "job_id": job.id,
+        "kind": job.kind,
+        "status": job.status,
+        "attempts": job.attempts,
+        "max_attempts": job.max_attempts,
+        "result": job.result,
+        "error": job.error,
+        "created_at": job.created_at,
+        "run_after": job.run_after,
+        "finished_at": job.finished_at,
+        "status_url": job_status_url(request, job),
+    }
+
+
+def accepted(request, kind, payload):
+    """
+    Queue the job and answer 202 with where to poll for it.
+
+    With an ``Idempotency-Key`` header the user already sent, the job that
+    key queued is returned instead; reusing the key for a different
+    request is a 409.
+    """
+    key = request.headers.get("Idempotency-Key") or None
+    if key is not None and len(key) > 255:
+        return Response(
+            {"detail": "Idempotency-Key is limited to 255 characters"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    job, created = enqueue(kind, payload, request.user, idempotency_key=key)
+
+    if not created and (job.kind, job.payload) != (kind, payload):
+        return Response(
+            {"detail": "Idempotency-Key was already used for a different request"},
+            status=status.HTTP_409_CONFLICT
+        )
+
+    response = Response(serialize_job(request, job), status=status.HTTP_202_ACCEPTED)
+    response["Location"] = job_status_url(request, job)
+    return response
+
+
+class JobStatusAPIView(APIView):
+    """
+    Status of a background job, for the user who queued it.
+    """
+    authentication_classes = [SignedTokenAuthentication, CsrfExemptSessionAuthentication]
+    permission_classes = [IsAuthenticated]
+    query_budget = 6
+
+    def get(self, request, job_id):
+        user = request.user
+
+        job = Job.objects.filter(
+            id=job_id,
+            created_by_id=user.id,
+            company_id=user.company_id
+        ).first()
+
+        if not job:
+            return Response(
+                {"detail": "Job not found"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        return Response(serialize_job(request, job))
+
+
+class TaskBulkAssignJobAPIView(APIView):
+    """
+    Assign any number of tasks to a reportee in the background. Same rules
+    as PATCH tasks/bulk/assign, without its TASK_BULK_MAX_SIZE limit; the
+    request returns as soon as the job is queued.
+    """
+    authentication_classes = [SignedTokenAuthentication, CsrfExemptSessionAuthentication]
+    permission_classes = [HasPermission]
+    required_permission = "task:assign"
+    query_budget = 10
+
+    def post(self, request):
+        serializer = TaskBulkAssignJobSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        manager = request.user
+
+        #  fail fast; the job checks again when it runs
+        is_reportee = User.objects.filter(
+            id=serializer.validated_data["assigned_to_id"],
+            role="REPORTEE",
+            company_id=manager.company_id,
+            is_active=True
+        ).exists()
+
+        if not is_reportee:
+            return Response(
+                {"detail": "Invalid reportee for this company"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return accepted(request, "tasks.bulk_assign", {
+            "task_ids": list(dict.fromkeys(serializer.validated_data["task_ids"])),
+            "assigned_to_id": serializer.validated_data["assigned_to_id"],
+        })
+
+
+class ReporteeOffboardJobAPIView(APIView):
+    """
+    Offboard one of the manager's reportees in the background: deactivate
+    the account and move (``reassign_to_id``) or unassign the manager's
+    tasks assigned to them.
+    """
+    authentication_classes = [SignedTokenAuthentication, CsrfExemptSessionAuthentication]
+    permission_classes = [HasPermission]
+    required_permission = "reportee:offboard"
+    query_budget = 10
+
+    def post(self, request, reportee_id):
+        serializer = ReporteeOffboardSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        manager = request.user
+        reassign_to_id = serializer.validated_data.get("reassign_to_id")
+
+        #  both reportees with one query: id -> (manager_id, is_active)
+        reportees = {
+            user_id: (manager_id, is_active)
+            for user_id, manager_id, is_active in User.objects.filter(
+                id__in={reportee_id, reassign_to_id} - {None},
+                role="REPORTEE",
+                company_id=manager.company_id
+            ).values_list("id", "manager_id", "is_active")
+        }
+
+        if reportees.get(reportee_id, (None, False))[0] != manager.id:
+            return Response(
+                {"detail": "Reportee not found"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        if reassign_to_id is not None and (
+            reassign_to_id == reportee_id
+            or not reportees.get(reassign_to_id, (None, False))[1]
+        ):
+            return Response(
+                {"detail": "Invalid reportee to reassign the tasks to"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return accepted(request, "reportees.offboard", {
+            "reportee_id": reportee_id,
+            "reassign_to_id": reassign_to_id,
+        })
@@ -0,0 +1,16 @@
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.permissions import IsAdminUser
+
+from core.instrumentation import route_stats
+
+
+class RouteMetricsAPIView(APIView):
+    """
+        Per-route timing and query-count histograms of this process (staff only)
+    """
+    permission_classes = [IsAdminUser]
+    query_budget = 5
+
+    def get(self, request):
+        return Response(route_stats.snapshot())
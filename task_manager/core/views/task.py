@@ -1,51 +1,217 @@
+import hashlib
 from math import ceil
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
-
-from core.models import Task, User
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.db.models import Count, F, Max
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
+
+from core.models import Task, TaskArchive, TaskCounter, User
 from core.serializers.task import (
     TaskCreateSerializer,
     TaskAssignSerializer,
     TaskStatusUpdateSerializer,
+    TaskBulkAssignSerializer,
+    TaskBulkStatusUpdateSerializer,
+    TaskListQuerySerializer,
+    TaskChangesQuerySerializer,
+    TaskSearchQuerySerializer,
+)
+from core.throttles import (
+    TaskBulkCreateRateThrottle,
+    TaskCreateRateThrottle,
+    TaskExportRateThrottle,
+    TaskListRateThrottle,
+    TaskSearchRateThrottle,
 )
-from core.throttles import TaskCreateRateThrottle, TaskListRateThrottle
 from core.permissions.base import HasPermission
-from core.authentication import CsrfExemptSessionAuthentication
-from core.config import TASK_LIST_PAGINATION_SIZE
+from core.authentication import CsrfExemptSessionAuthentication, SignedTokenAuthentication
+from core.config import (
+    TASK_BULK_MAX_SIZE,
+    TASK_CHANGES_PAGE_SIZE,
+    TASK_LIST_PAGINATION_SIZE,
+    TASK_SEARCH_PAGE_SIZE,
+)
+from core.pagination import (
+    InvalidCursor,
+    decode_search_cursor,
+    encode_search_cursor,
+    paginate_by_cursor,
+)
+from core.search import search_backend_for
+from core.export import EXPORT_FORMATS, async_chunks, export_rows
+from core.routers import ReplicaReadsMixin
+from core.rendering import TASK_ROW_COLUMNS, encode_task_page, json_response, task_row_position
+from core.changes import (
+    ChangeLogExpired,
+    changes_since,
+    latest_change_id,
+    record_task_changes,
+)
+from core.summary import locked_task_state, record_task_counts, summarize, task_state
+from core.bulk_updates import bulk_update_owned_tasks
+from core.cache import (
+    get_cached_task_list,
+    get_task_list_version,
+    may_cache_task_list,
+    set_cached_task_list,
+    task_list_cache_key,
+    task_list_changed_at,
+)
+
 
-class TaskListAPIView(APIView):
+class TaskListAPIView(ReplicaReadsMixin, APIView):
+    """
+    Pages are read with values_list() and encoded by core.rendering, and
+    the encoded bytes are what gets cached: a hit is served without
+    decoding or re-rendering anything.
+    """
     throttle_classes = [TaskListRateThrottle]
     permission_classes = [IsAuthenticated]
+    query_budget = 8
 
     def get(self, request):
         user = request.user  
 
-        page = int(request.query_params.get("page", 1))
-        offset = (page - 1) * TASK_LIST_PAGINATION_SIZE
-
-        # if it is a manager, fetch tasks created by them
-        if user.role == "MANAGER":
-            qs = Task.objects.filter(
-                created_by=user,            
-                company=user.company,       
-                is_deleted=False
-            )
-        # if it is a reportee, fetch tasks assigned to them 
-        elif user.role == "REPORTEE":
-            qs = Task.objects.filter(
-                assigned_to=user,          
-                company=user.company,       
-                is_deleted=False
+        if user.role not in ("MANAGER", "REPORTEE"):
+            return Response(
+                {"detail": "Invalid role"},
+                status=403
             )
 
+        params = TaskListQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        params = params.validated_data
+
+        # managers get tasks created by them, reportees tasks assigned to them
+        qs = Task.objects.for_user(user).apply_list_filters(params)
+
+        version = get_task_list_version(user.id)
+        cache_key = task_list_cache_key(user, version, request.query_params)
+
+        # replica rows that may predate the version's write stay uncached
+        cacheable = may_cache_task_list(version)
+
+        # At most one aggregate decides whether the client's copy is fresh
+        validators = get_cached_task_list(f"{cache_key}:validators")
+        if validators is None:
+            validators = self.get_validators(
+                request,
+                qs,
+                changed_at=task_list_changed_at(version)
+            )
+            if cacheable:
+                set_cached_task_list(f"{cache_key}:validators", validators)
+
+        etag, last_modified = validators
+        not_modified = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=last_modified
+        )
+        if not_modified is not None:
+            return self.with_validators(not_modified, etag, last_modified)
+
+        cached = get_cached_task_list(cache_key)
+        if cached is not None:
+            response = HttpResponse(cached, content_type="application/json")
+        # page numbers (with totals) are opt-in, cursors are the default
+        elif "page" in params:
+            response = self.get_page(params, qs)
         else:
+            response = self.get_cursor_page(params, qs)
+
+        if response.status_code == status.HTTP_200_OK:
+            if cached is None and cacheable:
+                set_cached_task_list(cache_key, response.content)
+
+            self.with_validators(response, etag, last_modified)
+
+        return response
+
+    @staticmethod
+    def with_validators(response, etag, last_modified):
+        # a 304 repeats the validators so the client can keep revalidating
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
+
+    @staticmethod
+    def get_validators(request, qs, changed_at):
+        """
+        Weak ETag and Last-Modified for this user's listing.
+
+        Any create, status flip, (re)assignment or soft delete moves either
+        the newest updated_at or the task count, so together they change
+        whenever a page could.
+
+        A soft delete or a reassignment away can make the newest visible
+        updated_at go *down*, so Last-Modified is floored at the time of
+        the last invalidating write (``changed_at``).
+        """
+        state = qs.aggregate(**TaskListAPIView.validator_aggregates())
+        return TaskListAPIView.validators_from_state(
+            request.user,
+            request.query_params,
+            state,
+            changed_at
+        )
+
+    @staticmethod
+    def validator_aggregates():
+        return {
+            "last_updated_at": Max("updated_at"),
+            "total_tasks": Count("id"),
+        }
+
+    @staticmethod
+    def validators_from_state(user, query_params, state, changed_at):
+        last_updated_at = state["last_updated_at"]
+
+        fingerprint = "|".join([
+            str(user.id),
+            user.role,
+            str(state["total_tasks"]),
+            last_updated_at.isoformat() if last_updated_at else "",
+            query_params.urlencode(),
+        ])
+        etag = 'W/"%s"' % hashlib.md5(fingerprint.encode()).hexdigest()
+
+        if last_updated_at is None:
+            return etag, changed_at
+
+        return etag, max(int(last_updated_at.timestamp()), changed_at)
+
+    def get_cursor_page(self, params, qs):
+        try:
+            rows, next_cursor = paginate_by_cursor(
+                qs.values_list(*TASK_ROW_COLUMNS),
+                params.get("cursor"),
+                TASK_LIST_PAGINATION_SIZE,
+                params["ordering"],
+                position=task_row_position(params["ordering"])
+            )
+        except InvalidCursor:
             return Response(
-                {"detail": "Invalid role"},
-                status=403
+                {"detail": "Invalid cursor"},
+                status=status.HTTP_400_BAD_REQUEST
             )
 
+        return json_response(self.request, encode_task_page, {
+            "page_size": TASK_LIST_PAGINATION_SIZE,
+            "next_cursor": next_cursor,
+        }, rows)
+
+    def get_page(self, params, qs):
+        page = params["page"]
+        offset = (page - 1) * TASK_LIST_PAGINATION_SIZE
+
         total_tasks = qs.count()
         max_page = max(1, ceil(total_tasks / TASK_LIST_PAGINATION_SIZE))
 
@@ -58,35 +224,303 @@ class TaskListAPIView(APIView):
                 status=404
             )
 
-        tasks = (
-            qs.order_by("-created_at")
+        rows = (
+            qs.order_by(*self.ordering_with_tie_breaker(params["ordering"]))
+              .values_list(*TASK_ROW_COLUMNS)
               [offset: offset + TASK_LIST_PAGINATION_SIZE]
         )
 
-        return Response({
+        return json_response(self.request, encode_task_page, {
             "page": page,
             "page_size": TASK_LIST_PAGINATION_SIZE,
             "total_tasks": total_tasks,
             "max_page": max_page,
-            "tasks": [
-                {
-                    "task_id": task.id,
-                    "title": task.title,
-                    "status": task.status,
-                    "assigned_to_id": task.assigned_to_id,
-                    "created_at": task.created_at,
-                    "updated_at": task.updated_at,
-                }
-                for task in tasks
+        }, rows)
+
+    @staticmethod
+    def ordering_with_tie_breaker(ordering):
+        return ordering, "-id" if ordering.startswith("-") else "id"
+
+    @staticmethod
+    def serialize_task(task):
+        # list payload of a Task instance; the list itself renders rows
+        # with core.rendering, which must stay in step with this
+        return {
+            "task_id": task.id,
+            "title": task.title,
+            "status": task.status,
+            "assigned_to_id": task.assigned_to_id,
+            "created_at": task.created_at,
+            "updated_at": task.updated_at,
+        }
+
+
+class TaskChangesAPIView(APIView):
+    """
+    Delta sync: the user's tasks that changed after a sync token.
+
+    Without ``since`` only the current token is returned; take it first,
+    then do a full fetch (list or export), then poll with it. Each call
+    returns the tasks written since the token that are still visible,
+    ``deleted`` ids for tasks that were soft deleted or left the user's
+    scope (e.g. reassigned away), and the token to send next time.
+
+    Reads only the user's TaskChange rows after the token, so a poll
+    costs O(changes), not O(tasks).
+    """
+    throttle_classes = [TaskListRateThrottle]
+    authentication_classes = [SignedTokenAuthentication, CsrfExemptSessionAuthentication]
+    permission_classes = [IsAuthenticated]
+    query_budget = 8
+
+    def get(self, request):
+        user = request.user
+
+        if user.role not in ("MANAGER", "REPORTEE"):
+            return Response(
+                {"detail": "Invalid role"},
+                status=403
+            )
+
+        params = TaskChangesQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        since = params.validated_data.get("since")
+
+        if since is None:
+            return Response(self.delta([], [], latest_change_id(), has_more=False))
+
+        try:
+            entries, live, has_more = changes_since(user, since, TASK_CHANGES_PAGE_SIZE)
+        except ChangeLogExpired:
+            return Response(
+                {"detail": "Sync token expired, do a full sync"},
+                status=status.HTTP_410_GONE
+            )
+
+        task_ids = list(dict.fromkeys(task_id for _, task_id, _ in entries))
+
+        return Response(self.delta(
+            [TaskListAPIView.serialize_task(live[task_id]) for task_id in task_ids if task_id in live],
+            [task_id for task_id in task_ids if task_id not in live],
+            entries[-1][0] if entries else since,
+            has_more=has_more
+        ))
+
+    @staticmethod
+    def delta(changes, deleted, token, has_more):
+        return {
+            "changes": changes,
+            "deleted": deleted,
+            "next_token": str(token),
+            "has_more": has_more,
+        }
+
+
+class TaskSummaryAPIView(ReplicaReadsMixin, APIView):
+    """
+    Per-status task counts for dashboards, read from the TaskCounter rows
+    the write paths maintain: one or two small index lookups however many
+    tasks there are.
+
+    Counts cover the same tasks as the user's list. Managers also get one
+    entry per reportee of theirs that has counters; a reportee's counts
+    include tasks assigned by other managers of the company.
+    """
+    throttle_classes = [TaskListRateThrottle]
+    authentication_classes = [SignedTokenAuthentication, CsrfExemptSessionAuthentication]
+    permission_classes = [IsAuthenticated]
+    query_budget = 7
+
+    def get(self, request):
+        user = request.user
+
+        if user.role not in ("MANAGER", "REPORTEE"):
+            return Response(
+                {"detail": "Invalid role"},
+                status=403
+            )
+
+        counters = TaskCounter.objects.filter(company_id=user.company_id)
+
+        data = {
+            "user_id": user.id,
+            **summarize(counters.filter(user_id=user.id).values_list("status", "count")),
+        }
+
+        if user.role == "MANAGER":
+            reportees = {}
+            for reportee_id, task_status, count in (
+                counters
+                .filter(user__manager_id=user.id, user__role="REPORTEE")
+                .values_list("user_id", "status", "count")
+            ):
+                reportees.setdefault(reportee_id, []).append((task_status, count))
+
+            data["reportees"] = [
+                {"user_id": reportee_id, **summarize(rows)}
+                for reportee_id, rows in sorted(reportees.items())
             ]
+
+        return Response(data)
+
+
+class TaskExportAPIView(ReplicaReadsMixin, APIView):
+    """
+    Stream every task the user can list, as NDJSON (default) or CSV
+    (``?output=csv``), without pagination.
+
+    Rows are fetched in chunks with ``.values().iterator()`` while the
+    response is being sent, so memory stays flat however many tasks the
+    tenant has, under WSGI and ASGI alike. Scoping is the same as the
+    list endpoint.
+    """
+    throttle_classes = [TaskExportRateThrottle]
+    authentication_classes = [SignedTokenAuthentication, CsrfExemptSessionAuthentication]
+    permission_classes = [IsAuthenticated]
+    query_budget = 5  # the export query itself runs after the view returns
+
+    def get(self, request):
+        user = request.user
+
+        if user.role not in ("MANAGER", "REPORTEE"):
+            return Response(
+                {"detail": "Invalid role"},
+                status=403
+            )
+
+        output = request.query_params.get("output", "ndjson")
+        if output not in EXPORT_FORMATS:
+            return Response(
+                {"detail": f"output must be one of: {', '.join(EXPORT_FORMATS)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        encode, content_type = EXPORT_FORMATS[output]
+        qs = Task.objects.for_user(user)
+        # rows are read after the view returns, outside the replica scope
+        rows = export_rows(qs.using(qs.db))
+
+        chunks = encode(rows)
+        if isinstance(request._request, ASGIRequest):
+            chunks = async_chunks(chunks)
+
+        response = StreamingHttpResponse(chunks, content_type=content_type)
+        response["Content-Disposition"] = f'attachment; filename="tasks.{output}"'
+        patch_cache_control(response, private=True, no_store=True)
+        return response
+
+
+class TaskArchiveAPIView(ReplicaReadsMixin, APIView):
+    """
+    Tasks archive_tasks moved out of the task table that the user could
+    see, deleted ones included, most recently changed first, in cursor
+    pages.
+    """
+    throttle_classes = [TaskListRateThrottle]
+    authentication_classes = [SignedTokenAuthentication, CsrfExemptSessionAuthentication]
+    permission_classes = [IsAuthenticated]
+    query_budget = 6
+
+    def get(self, request):
+        user = request.user
+
+        if user.role not in ("MANAGER", "REPORTEE"):
+            return Response(
+                {"detail": "Invalid role"},
+                status=403
+            )
+
+        rows = TaskArchive.objects.for_user(user).values(
+            "title", "description", "status", "assigned_to_id", "is_deleted",
+            "created_at", "updated_at", "archived_at",
+            task_id=F("id")
+        )
+
+        try:
+            tasks, next_cursor = paginate_by_cursor(
+                rows,
+                request.query_params.get("cursor"),
+                TASK_LIST_PAGINATION_SIZE,
+                "-updated_at",
+                position=lambda row: (row["updated_at"], row["task_id"])
+            )
+        except InvalidCursor:
+            return Response(
+                {"detail": "Invalid cursor"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response({
+            "page_size": TASK_LIST_PAGINATION_SIZE,
+            "next_cursor": next_cursor,
+            "tasks": tasks,
         })
 
 
+class TaskSearchAPIView(ReplicaReadsMixin, APIView):
+    """
+    Full-text search over the title and description of the tasks the user
+    can list, best match first, in cursor-paginated list pages.
+
+    Matching goes through the database's search backend (core.search); on
+    SQLite that is an FTS5 index, so cost follows the matches, not the
+    table. Ranks depend on the whole index, so a write between two page
+    requests can shift results across the page boundary.
+    """
+    throttle_classes = [TaskSearchRateThrottle]
+    authentication_classes = [SignedTokenAuthentication, CsrfExemptSessionAuthentication]
+    permission_classes = [IsAuthenticated]
+    query_budget = 6
+
+    def get(self, request):
+        user = request.user
+
+        if user.role not in ("MANAGER", "REPORTEE"):
+            return Response(
+                {"detail": "Invalid role"},
+                status=403
+            )
+
+        params = TaskSearchQuerySerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        terms = params.validated_data["terms"]
+
+        after = None
+        if "cursor" in params.validated_data:
+            try:
+                after = decode_search_cursor(params.validated_data["cursor"], terms)
+            except InvalidCursor:
+                return Response(
+                    {"detail": "Invalid cursor"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+        qs = Task.objects.for_user(user)
+        results = search_backend_for(qs.db).search(qs, terms, user.company_id, after)
+
+        # one extra row tells us whether another page exists
+        rows = list(
+            results.values_list(*TASK_ROW_COLUMNS, "search_rank")[:TASK_SEARCH_PAGE_SIZE + 1]
+        )
+        next_cursor = None
+        if len(rows) > TASK_SEARCH_PAGE_SIZE:
+            rows = rows[:TASK_SEARCH_PAGE_SIZE]
+            next_cursor = encode_search_cursor(rows[-1][-1], rows[-1][0], terms)
+
+        response = json_response(request, encode_task_page, {
+            "page_size": TASK_SEARCH_PAGE_SIZE,
+            "next_cursor": next_cursor,
+        }, [row[:-1] for row in rows])
+        patch_cache_control(response, private=True, no_store=True)
+        return response
+
+
 class TaskCreateAPIView(APIView):
     throttle_classes = [TaskCreateRateThrottle]
-    authentication_classes = [CsrfExemptSessionAuthentication]
+    authentication_classes = [SignedTokenAuthentication, CsrfExemptSessionAuthentication]
     permission_classes = [HasPermission]
     required_permission = "task:create"
+    query_budget = 12
 
     def post(self, request):
         serializer = TaskCreateSerializer(data=request.data)
@@ -102,8 +536,8 @@ class TaskCreateAPIView(APIView):
             assigned_to = User.objects.filter(
                 id=assigned_to_id,
                 role="REPORTEE",
-                company=manager.company,   #  same company
-                manager=manager            #  created by THIS manager
+                company_id=manager.company_id,   #  same company
+                manager_id=manager.id            #  created by THIS manager
             ).first()
 
             if not assigned_to:
@@ -113,13 +547,16 @@ class TaskCreateAPIView(APIView):
                 )
 
         # Create task under THIS manager & company
-        task = Task.objects.create(
-            title=serializer.validated_data["title"],
-            description=serializer.validated_data.get("description"),
-            assigned_to=assigned_to,
-            created_by=manager,           #  ownership enforced
-            company=manager.company       #  tenant isolation
-        )
+        with transaction.atomic():
+            task = Task.objects.create(
+                title=serializer.validated_data["title"],
+                description=serializer.validated_data.get("description", ""),
+                assigned_to=assigned_to,
+                created_by_id=manager.id,           #  ownership enforced
+                company_id=manager.company_id       #  tenant isolation
+            )
+            record_task_changes({task.id: (manager.id, task.assigned_to_id)}, kind="created")
+            record_task_counts(after=[task_state(task)])
 
         return Response(
             {
@@ -131,10 +568,134 @@ class TaskCreateAPIView(APIView):
         )
 
 
+class TaskBulkCreateAPIView(APIView):
+    """
+    Create many tasks in one request.
+
+    Every item is validated on its own and reported back by index; valid
+    items are inserted together with a single bulk_create.
+    """
+    throttle_classes = [TaskBulkCreateRateThrottle]
+    authentication_classes = [SignedTokenAuthentication, CsrfExemptSessionAuthentication]
+    permission_classes = [HasPermission]
+    required_permission = "task:create"
+    # SQLite binds at most 999 parameters per statement, so bulk_create
+    # splits into INSERTs of 999 // columns rows. At TASK_BULK_MAX_SIZE
+    # tasks (9 columns), each logged for its creator and assignee
+    # (TaskChange, 4 columns), that is one INSERT per batch on top of the
+    # 10 queries around them
+    query_budget = (
+        10
+        + ceil(TASK_BULK_MAX_SIZE / (999 // 9))
+        + ceil(2 * TASK_BULK_MAX_SIZE / (999 // 4))
+    )
+
+    def post(self, request):
+        items = request.data
+
+        if not isinstance(items, list) or not items:
+            return Response(
+                {"detail": "Expected a non-empty list of tasks"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if len(items) > TASK_BULK_MAX_SIZE:
+            return Response(
+                {"detail": f"At most {TASK_BULK_MAX_SIZE} tasks per request"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        manager = request.user
+
+        results = [None] * len(items)
+        valid_items = []
+
+        for index, item in enumerate(items):
+            serializer = TaskCreateSerializer(data=item)
+            if serializer.is_valid():
+                valid_items.append((index, serializer.validated_data))
+            else:
+                results[index] = {"index": index, "errors": serializer.errors}
+
+        # Validate every requested reportee with a single query
+        requested_ids = {
+            data["assigned_to_id"]
+            for _, data in valid_items
+            if data.get("assigned_to_id") is not None
+        }
+        reportee_ids = set(
+            User.objects.filter(
+                id__in=requested_ids,
+                role="REPORTEE",
+                company_id=manager.company_id,   #  same company
+                manager_id=manager.id            #  created by THIS manager
+            ).values_list("id", flat=True)
+        )
+
+        to_create = []
+        for index, data in valid_items:
+            assigned_to_id = data.get("assigned_to_id")
+
+            if assigned_to_id is not None and assigned_to_id not in reportee_ids:
+                results[index] = {
+                    "index": index,
+                    "errors": {
+                        "assigned_to_id": [
+                            "Invalid reportee for this manager or company"
+                        ]
+                    },
+                }
+                continue
+
+            to_create.append((
+                index,
+                Task(
+                    title=data["title"],
+                    description=data.get("description", ""),
+                    assigned_to_id=assigned_to_id,
+                    created_by_id=manager.id,          #  ownership enforced
+                    company_id=manager.company_id      #  tenant isolation
+                )
+            ))
+
+        with transaction.atomic():
+            created = Task.objects.bulk_create([task for _, task in to_create])
+
+            record_task_changes(
+                {task.id: (manager.id, task.assigned_to_id) for task in created},
+                kind="created"
+            )
+            record_task_counts(after=[task_state(task) for task in created])
+
+        for (index, _), task in zip(to_create, created):
+            results[index] = {
+                "index": index,
+                "id": task.id,
+                "assigned_to_id": task.assigned_to_id,
+            }
+
+        if not created:
+            response_status = status.HTTP_400_BAD_REQUEST
+        elif len(created) < len(items):
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_201_CREATED
+
+        return Response(
+            {
+                "created": len(created),
+                "failed": len(items) - len(created),
+                "results": results,
+            },
+            status=response_status
+        )
+
+
 class TaskAssignAPIView(APIView):
-    authentication_classes = [CsrfExemptSessionAuthentication]
+    authentication_classes = [SignedTokenAuthentication, CsrfExemptSessionAuthentication]
     permission_classes = [HasPermission]
     required_permission = "task:assign"
+    query_budget = 14
 
     def patch(self, request, task_id):
         serializer = TaskAssignSerializer(data=request.data)
@@ -145,9 +706,8 @@ class TaskAssignAPIView(APIView):
         #  Fetch task created by THIS manager in SAME company
         task = Task.objects.filter(
             id=task_id,
-            created_by=manager,         
-            company=manager.company,    
-            is_deleted=False
+            created_by_id=manager.id,         
+            company_id=manager.company_id    
         ).first()
 
         if not task:
@@ -160,7 +720,7 @@ class TaskAssignAPIView(APIView):
         reportee = User.objects.filter(
             id=serializer.validated_data["assigned_to_id"],
             role="REPORTEE",
-            company=manager.company     
+            company_id=manager.company_id     
         ).first()
 
         if not reportee:
@@ -170,8 +730,22 @@ class TaskAssignAPIView(APIView):
             )
 
         # Assign / reassign task
-        task.assigned_to = reportee
-        task.save(update_fields=["assigned_to", "updated_at"])
+        with transaction.atomic():
+            before = locked_task_state(task)
+            if before is None:
+                return Response(
+                    {"detail": "Task not found"},
+                    status=status.HTTP_404_NOT_FOUND
+                )
+
+            previous_assignee_id = task.assigned_to_id
+            task.assigned_to = reportee
+            task.save(update_fields=["assigned_to", "updated_at"])
+            record_task_changes(
+                {task.id: (manager.id, previous_assignee_id, reportee.id)},
+                kind="assigned"
+            )
+            record_task_counts(before=[before], after=[task_state(task)])
 
         return Response(
             {
@@ -183,25 +757,78 @@ class TaskAssignAPIView(APIView):
         )
 
 
+class TaskBulkAssignAPIView(APIView):
+    authentication_classes = [SignedTokenAuthentication, CsrfExemptSessionAuthentication]
+    permission_classes = [HasPermission]
+    required_permission = "task:assign"
+    query_budget = 13
+
+    def patch(self, request):
+        serializer = TaskBulkAssignSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        manager = request.user
+
+        #  Fetch reportee from SAME company
+        reportee = User.objects.filter(
+            id=serializer.validated_data["assigned_to_id"],
+            role="REPORTEE",
+            company_id=manager.company_id
+        ).first()
+
+        if not reportee:
+            return Response(
+                {"detail": "Invalid reportee for this company"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        updated_ids, skipped_ids = bulk_update_owned_tasks(
+            manager,
+            serializer.validated_data["task_ids"],
+            assigned_to_id=reportee.id
+        )
+
+        return Response(
+            {
+                "assigned_to_id": reportee.id,
+                "updated_task_ids": updated_ids,
+                "skipped_task_ids": skipped_ids,
+                "message": "Tasks assigned successfully",
+            },
+            status=status.HTTP_200_OK
+        )
+
+
 class TaskDeleteAPIView(APIView):
-    authentication_classes = [CsrfExemptSessionAuthentication]
+    authentication_classes = [SignedTokenAuthentication, CsrfExemptSessionAuthentication]
     permission_classes = [HasPermission]
     required_permission = "task:delete"
+    query_budget = 12
 
     def delete(self, request, task_id):
-        manager = User.objects.filter(role="MANAGER").first()
+        manager = request.user
 
         task = Task.objects.filter(
             id=task_id,
-            created_by=manager,
-            is_deleted=False
+            created_by_id=manager.id,
+            company_id=manager.company_id
         ).first()
 
         if not task:
             return Response({"detail": "Task not found"}, status=404)
 
-        task.is_deleted = True
-        task.save()
+        with transaction.atomic():
+            before = locked_task_state(task)
+            if before is None:
+                return Response({"detail": "Task not found"}, status=404)
+
+            task.is_deleted = True
+            task.save(update_fields=["is_deleted", "updated_at"])
+            record_task_changes(
+                {task.id: (task.created_by_id, task.assigned_to_id)},
+                kind="deleted"
+            )
+            record_task_counts(before=[before])
 
         return Response({
             "task_id": task.id,
@@ -210,9 +837,10 @@ class TaskDeleteAPIView(APIView):
 
 
 class TaskStatusByManagerAPIView(APIView):
-    authentication_classes = [CsrfExemptSessionAuthentication]
+    authentication_classes = [SignedTokenAuthentication, CsrfExemptSessionAuthentication]
     permission_classes = [HasPermission]
     required_permission = "task:update:any"
+    query_budget = 13
 
     def patch(self, request, task_id):
         serializer = TaskStatusUpdateSerializer(data=request.data)
@@ -222,9 +850,8 @@ class TaskStatusByManagerAPIView(APIView):
 
         task = Task.objects.filter(
             id=task_id,
-            created_by=manager,           
-            company=manager.company,      
-            is_deleted=False
+            created_by_id=manager.id,           
+            company_id=manager.company_id      
         ).first()
 
         if not task:
@@ -233,8 +860,18 @@ class TaskStatusByManagerAPIView(APIView):
                 status=404
             )
 
-        task.status = serializer.validated_data["status"]
-        task.save(update_fields=["status", "updated_at"])
+        with transaction.atomic():
+            before = locked_task_state(task)
+            if before is None:
+                return Response(
+                    {"detail": "Task not found"},
+                    status=404
+                )
+
+            task.status = serializer.validated_data["status"]
+            task.save(update_fields=["status", "updated_at"])
+            record_task_changes({task.id: (manager.id, task.assigned_to_id)}, kind="status")
+            record_task_counts(before=[before], after=[task_state(task)])
 
         return Response({
             "task_id": task.id,
@@ -244,10 +881,35 @@ class TaskStatusByManagerAPIView(APIView):
 
 
 
+class TaskBulkStatusByManagerAPIView(APIView):
+    authentication_classes = [SignedTokenAuthentication, CsrfExemptSessionAuthentication]
+    permission_classes = [HasPermission]
+    required_permission = "task:update:any"
+    query_budget = 12
+
+    def patch(self, request):
+        serializer = TaskBulkStatusUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        updated_ids, skipped_ids = bulk_update_owned_tasks(
+            request.user,
+            serializer.validated_data["task_ids"],
+            status=serializer.validated_data["status"]
+        )
+
+        return Response({
+            "new_status": serializer.validated_data["status"],
+            "updated_task_ids": updated_ids,
+            "skipped_task_ids": skipped_ids,
+            "message": "Task status updated successfully"
+        })
+
+
 class TaskStatusByReporteeAPIView(APIView):
-    authentication_classes = [CsrfExemptSessionAuthentication]
+    authentication_classes = [SignedTokenAuthentication, CsrfExemptSessionAuthentication]
     permission_classes = [HasPermission]
     required_permission = "task:update:self"
+    query_budget = 13
 
     def patch(self, request, task_id):
         serializer = TaskStatusUpdateSerializer(data=request.data)
@@ -257,9 +919,8 @@ class TaskStatusByReporteeAPIView(APIView):
 
         task = Task.objects.filter(
             id=task_id,
-            assigned_to=reportee,         
-            company=reportee.company,     
-            is_deleted=False
+            assigned_to_id=reportee.id,         
+            company_id=reportee.company_id     
         ).first()
 
         if not task:
@@ -280,8 +941,18 @@ class TaskStatusByReporteeAPIView(APIView):
                 status=403
             )
 
-        task.status = "COMPLETED"
-        task.save(update_fields=["status", "updated_at"])
+        with transaction.atomic():
+            before = locked_task_state(task)
+            if before is None:
+                return Response(
+                    {"detail": "Task not found"},
+                    status=404
+                )
+
+            task.status = "COMPLETED"
+            task.save(update_fields=["status", "updated_at"])
+            record_task_changes({task.id: (reportee.id, task.created_by_id)}, kind="status")
+            record_task_counts(before=[before], after=[task_state(task)])
 
         return Response({
             "task_id": task.id,
@@ -0,0 +1,356 @@
+# core/views/task_async.py
+"""
+Async (ASGI-native) variants of the task views in core/views/task.py.
+
+Same URLs under an ``async/`` prefix, same payloads, responses, cache
+entries and query budgets; only the execution model differs.
+"""
+from math import ceil
+
+from asgiref.sync import sync_to_async
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+
+from core.models import Task, User
+from core.serializers.task import (
+    TaskCreateSerializer,
+    TaskAssignSerializer,
+    TaskStatusUpdateSerializer,
+    TaskListQuerySerializer,
+)
+from core.throttles import TaskCreateRateThrottle, TaskListRateThrottle
+from core.permissions.base import HasPermission
+from core.config import TASK_LIST_PAGINATION_SIZE
+from core.pagination import InvalidCursor, apaginate_by_cursor
+from core.rendering import TASK_ROW_COLUMNS, encode_task_page, json_response, task_row_position
+from core.cache import (
+    aget_cached_task_list,
+    aget_task_list_version,
+    aset_cached_task_list,
+    may_cache_task_list,
+    task_list_cache_key,
+    task_list_changed_at,
+)
+from core.changes import record_task_changes
+from core.summary import locked_task_state, record_task_counts, task_state
+from core.views.base import AsyncAPIView
+from core.views.task import TaskListAPIView
+
+
+@sync_to_async
+def save_task(task, update_fields, affected_user_ids, kind):
+    """
+    Save ``task`` (insert when ``update_fields`` is None), record the
+    ``kind`` change and move its counters, in one transaction. An update
+    locks the row first and moves the counters from its committed state
+    (see locked_task_state); it returns False, writing nothing, when the
+    row is gone. Transactions cannot span awaits, so the whole unit runs
+    on the request's worker thread.
+    """
+    with transaction.atomic():
+        before = []
+        if update_fields is not None:
+            state = locked_task_state(task, update_fields)
+            if state is None:
+                return False
+            before = [state]
+
+        task.save(update_fields=update_fields)
+        record_task_changes({task.id: affected_user_ids}, kind)
+        record_task_counts(before=before, after=[task_state(task)])
+
+    return True
+
+
+class AsyncTaskListAPIView(AsyncAPIView):
+    throttle_classes = [TaskListRateThrottle]
+    permission_classes = [IsAuthenticated]
+    read_replica = True
+    query_budget = 8
+
+    async def get(self, request):
+        user = request.user
+
+        if user.role not in ("MANAGER", "REPORTEE"):
+            return self.render({"detail": "Invalid role"}, status=403)
+
+        params = TaskListQuerySerializer(data=request.GET)
+        params.is_valid(raise_exception=True)
+        params = params.validated_data
+
+        qs = Task.objects.for_user(user).apply_list_filters(params)
+
+        version = await aget_task_list_version(user.id)
+        cache_key = task_list_cache_key(user, version, request.GET)
+
+        cacheable = may_cache_task_list(version)
+
+        validators = await aget_cached_task_list(f"{cache_key}:validators")
+        if validators is None:
+            state = await qs.aaggregate(**TaskListAPIView.validator_aggregates())
+            validators = TaskListAPIView.validators_from_state(
+                user,
+                request.GET,
+                state,
+                changed_at=task_list_changed_at(version)
+            )
+            if cacheable:
+                await aset_cached_task_list(f"{cache_key}:validators", validators)
+
+        etag, last_modified = validators
+        not_modified = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=last_modified
+        )
+        if not_modified is not None:
+            return TaskListAPIView.with_validators(not_modified, etag, last_modified)
+
+        cached = await aget_cached_task_list(cache_key)
+        if cached is not None:
+            response = HttpResponse(cached, content_type="application/json")
+        elif "page" in params:
+            response = await self.get_page(params, qs)
+        else:
+            response = await self.get_cursor_page(params, qs)
+
+        if response.status_code == status.HTTP_200_OK:
+            if cached is None and cacheable:
+                await aset_cached_task_list(cache_key, response.content)
+
+            TaskListAPIView.with_validators(response, etag, last_modified)
+
+        return response
+
+    async def get_cursor_page(self, params, qs):
+        try:
+            rows, next_cursor = await apaginate_by_cursor(
+                qs.values_list(*TASK_ROW_COLUMNS),
+                params.get("cursor"),
+                TASK_LIST_PAGINATION_SIZE,
+                params["ordering"],
+                position=task_row_position(params["ordering"])
+            )
+        except InvalidCursor:
+            return self.render({"detail": "Invalid cursor"}, status=status.HTTP_400_BAD_REQUEST)
+
+        return json_response(self.request, encode_task_page, {
+            "page_size": TASK_LIST_PAGINATION_SIZE,
+            "next_cursor": next_cursor,
+        }, rows)
+
+    async def get_page(self, params, qs):
+        page = params["page"]
+        offset = (page - 1) * TASK_LIST_PAGINATION_SIZE
+
+        total_tasks = await qs.acount()
+        max_page = max(1, ceil(total_tasks / TASK_LIST_PAGINATION_SIZE))
+
+        if page > max_page:
+            return self.render(
+                {
+                    "detail": f"Page {page} does not exist. "
+                              f"Max page is {max_page}."
+                },
+                status=404
+            )
+
+        rows = [
+            row async for row in
+            qs.order_by(*TaskListAPIView.ordering_with_tie_breaker(params["ordering"]))
+              .values_list(*TASK_ROW_COLUMNS)
+              [offset: offset + TASK_LIST_PAGINATION_SIZE]
+        ]
+
+        return json_response(self.request, encode_task_page, {
+            "page": page,
+            "page_size": TASK_LIST_PAGINATION_SIZE,
+            "total_tasks": total_tasks,
+            "max_page": max_page,
+        }, rows)
+
+
+class AsyncTaskCreateAPIView(AsyncAPIView):
+    throttle_classes = [TaskCreateRateThrottle]
+    permission_classes = [HasPermission]
+    required_permission = "task:create"
+    query_budget = 12
+
+    async def post(self, request):
+        serializer = TaskCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        manager = request.user
+
+        assigned_to_id = serializer.validated_data.get("assigned_to_id")
+
+        if assigned_to_id is not None:
+            is_own_reportee = await User.objects.filter(
+                id=assigned_to_id,
+                role="REPORTEE",
+                company_id=manager.company_id,   #  same company
+                manager_id=manager.id            #  created by THIS manager
+            ).aexists()
+
+            if not is_own_reportee:
+                return self.render(
+                    {"detail": "Invalid reportee for this manager or company"},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+        task = Task(
+            title=serializer.validated_data["title"],
+            description=serializer.validated_data.get("description", ""),
+            assigned_to_id=assigned_to_id,
+            created_by_id=manager.id,           #  ownership enforced
+            company_id=manager.company_id       #  tenant isolation
+        )
+        await save_task(task, None, (manager.id, task.assigned_to_id), "created")
+
+        return self.render(
+            {
+                "id": task.id,
+                "assigned_to_id": task.assigned_to_id,
+                "message": "Task created successfully",
+            },
+            status=status.HTTP_201_CREATED
+        )
+
+
+class AsyncTaskAssignAPIView(AsyncAPIView):
+    permission_classes = [HasPermission]
+    required_permission = "task:assign"
+    query_budget = 14
+
+    async def patch(self, request, task_id):
+        serializer = TaskAssignSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        manager = request.user
+
+        task = await Task.objects.filter(
+            id=task_id,
+            created_by_id=manager.id,
+            company_id=manager.company_id
+        ).afirst()
+
+        if not task:
+            return self.render(
+                {"detail": "Task not found"},
+                status=status.HTTP_404_NOT_FOUND
+            )
+
+        reportee_id = await User.objects.filter(
+            id=serializer.validated_data["assigned_to_id"],
+            role="REPORTEE",
+            company_id=manager.company_id
+        ).values_list("id", flat=True).afirst()
+
+        if reportee_id is None:
+            return self.render(
+                {"detail": "Invalid reportee for this company"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        previous_assignee_id = task.assigned_to_id
+        task.assigned_to_id = reportee_id
+        saved = await save_task(
+            task,
+            ["assigned_to", "updated_at"],
+            (manager.id, previous_assignee_id, reportee_id),
+            "assigned"
+        )
+        if not saved:
+            return self.render({"detail": "Task not found"}, status=404)
+
+        return self.render({
+            "task_id": task.id,
+            "assigned_to_id": reportee_id,
+            "message": "Task assigned successfully",
+        })
+
+
+class AsyncTaskStatusByManagerAPIView(AsyncAPIView):
+    permission_classes = [HasPermission]
+    required_permission = "task:update:any"
+    query_budget = 13
+
+    async def patch(self, request, task_id):
+        serializer = TaskStatusUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        manager = request.user
+
+        task = await Task.objects.filter(
+            id=task_id,
+            created_by_id=manager.id,
+            company_id=manager.company_id
+        ).afirst()
+
+        if not task:
+            return self.render({"detail": "Task not found"}, status=404)
+
+        task.status = serializer.validated_data["status"]
+        saved = await save_task(
+            task,
+            ["status", "updated_at"],
+            (manager.id, task.assigned_to_id),
+            "status"
+        )
+        if not saved:
+            return self.render({"detail": "Task not found"}, status=404)
+
+        return self.render({
+            "task_id": task.id,
+            "new_status": task.status,
+            "message": "Task status updated successfully"
+        })
+
+
+class AsyncTaskStatusByReporteeAPIView(AsyncAPIView):
+    permission_classes = [HasPermission]
+    required_permission = "task:update:self"
+    query_budget = 13
+
+    async def patch(self, request, task_id):
+        serializer = TaskStatusUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        reportee = request.user
+
+        task = await Task.objects.filter(
+            id=task_id,
+            assigned_to_id=reportee.id,
+            company_id=reportee.company_id
+        ).afirst()
+
+        if not task:
+            return self.render({"detail": "Task not found"}, status=404)
+
+        if task.status == "COMPLETED":
+            return self.render({"detail": "Task is already completed"}, status=409)
+
+        if serializer.validated_data["status"] != "COMPLETED":
+            return self.render(
+                {"detail": "Reportee can update task status only to COMPLETED"},
+                status=403
+            )
+
+        task.status = "COMPLETED"
+        saved = await save_task(
+            task,
+            ["status", "updated_at"],
+            (reportee.id, task.created_by_id),
+            "status"
+        )
+        if not saved:
+            return self.render({"detail": "Task not found"}, status=404)
+
+        return self.render({
+            "task_id": task.id,
+            "new_status": task.status,
+            "message": "Task status updated successfully"
+        })
@@ -1,3 +1,5 @@
+import time
+
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
@@ -5,17 +7,20 @@ from rest_framework.permissions import IsAuthenticated
 
 from core.models import User
 from core.serializers.user import ReporteeCreateSerializer
-from core.authentication import CsrfExemptSessionAuthentication
+from core.authentication import CsrfExemptSessionAuthentication, SignedTokenAuthentication
+from core.config import REPORTEE_BULK_MAX_SIZE
 from core.permissions.base import HasPermission
+from core.provisioning import provision_reportee_chunk
 
 
 class CreateReporteeAPIView(APIView):
     """
         ONLY Manager can create reportees
     """
-    authentication_classes = [CsrfExemptSessionAuthentication]
+    authentication_classes = [SignedTokenAuthentication, CsrfExemptSessionAuthentication]
     permission_classes = [HasPermission]
     required_permission = "reportee:create"
+    query_budget = 7
 
 
     def post(self, request):
@@ -24,14 +29,13 @@ class CreateReporteeAPIView(APIView):
 
         manager = request.user   
 
-        reportee = User.objects.create(
+        reportee = User.objects.create_user(
             username=serializer.validated_data["username"],
+            password=serializer.validated_data["password"],
             role="REPORTEE",
-            company=manager.company,
-            manager=manager
+            company_id=manager.company_id,
+            manager_id=manager.id
         )
-        reportee.set_password(serializer.validated_data["password"])
-        reportee.save()
 
         return Response(
             {
@@ -41,3 +45,55 @@ class CreateReporteeAPIView(APIView):
             },
             status=status.HTTP_201_CREATED
         )
+
+
+class BulkCreateReporteeAPIView(APIView):
+    """
+    Create many reportees in one request (manager only).
+
+    Usernames are checked with one query, passwords hashed in parallel on
+    the hashing pool and the valid rows inserted with one bulk_create;
+    every item is reported back by index. Bigger teams: import_reportees.
+    """
+    authentication_classes = [SignedTokenAuthentication, CsrfExemptSessionAuthentication]
+    permission_classes = [HasPermission]
+    required_permission = "reportee:create"
+    query_budget = 9
+
+    def post(self, request):
+        items = request.data
+
+        if not isinstance(items, list) or not items:
+            return Response(
+                {"detail": "Expected a non-empty list of reportees"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if len(items) > REPORTEE_BULK_MAX_SIZE:
+            return Response(
+                {"detail": f"At most {REPORTEE_BULK_MAX_SIZE} reportees per request"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        started = time.perf_counter()
+        results = provision_reportee_chunk(request.user, items)
+        elapsed = time.perf_counter() - started
+
+        created = sum("id" in result for result in results)
+
+        if not created:
+            response_status = status.HTTP_400_BAD_REQUEST
+        elif created < len(items):
+            response_status = status.HTTP_207_MULTI_STATUS
+        else:
+            response_status = status.HTTP_201_CREATED
+
+        return Response(
+            {
+                "created": created,
+                "failed": len(items) - created,
+                "rows_per_second": round(len(items) / elapsed, 1),
+                "results": results,
+            },
+            status=response_status
+        )
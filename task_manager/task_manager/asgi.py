@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "task_manager.settings")
+# no persistent database connections, see DATABASES in settings.py
+os.environ["TASK_MANAGER_ASGI"] = "1"
 
 application = get_asgi_application()
@@ -10,9 +10,11 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import os
 from pathlib import Path
 
-from core.config import LOGIN_RATE, SIGNUP_RATE, TASK_CREATE_RATE, TASK_LIST_RATE
+from core.config import PASSWORD_HASHING_PROFILE, PASSWORD_HASHING_PROFILES
+from core.config import LOGIN_RATE, SIGNUP_RATE, TASK_BULK_CREATE_RATE, TASK_CREATE_RATE, TASK_EXPORT_RATE, TASK_LIST_RATE, TASK_SEARCH_RATE
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -48,6 +50,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "core.middleware.QueryInstrumentationMiddleware",  # keep first: counts session queries too
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -80,13 +83,57 @@ WSGI_APPLICATION = "task_manager.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
 
+# Set by asgi.py before the settings are loaded
+ASGI_DEPLOYMENT = os.environ.get("TASK_MANAGER_ASGI") == "1"
+
+# SQLite tuned for concurrent requests: PRAGMAs (WAL, busy_timeout, ...)
+# from core.config.SQLITE_PRAGMAS on every connection, connections kept for
+# a minute under WSGI and health-checked before reuse, and transactions
+# that take the write lock up front (BEGIN IMMEDIATE) so they wait for it
+# instead of failing to upgrade a read lock with "database is locked".
+# Under ASGI connections are closed after each request: sync code runs on
+# a fresh thread per request there, and every thread would keep its own.
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        "CONN_MAX_AGE": 0 if ASGI_DEPLOYMENT else 60,
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": {
+            "timeout": 5,
+            "transaction_mode": "IMMEDIATE",
+        },
     }
 }
 
+# Aliases in DATABASES holding read-only copies of "default". Read-only
+# views (task list, summary, export, auth/me) read from one of them unless
+# the user wrote recently; see core/routers.py. Example replica entry:
+#   "replica": {**DATABASES["default"], "NAME": BASE_DIR / "replica.sqlite3",
+#               "TEST": {"MIRROR": "default"}},
+READ_REPLICAS = []
+
+DATABASE_ROUTERS = ["core.routers.PrimaryReplicaRouter"]
+
+
+# Cache
+# https://docs.djangoproject.com/en/6.0/topics/cache/
+# Swap the backend (e.g. Redis) to share cached task lists across workers.
+# "shared" holds what every process must agree on, such as the identity
+# versions that end sessions. The file cache is shared by the processes of
+# one host; use Redis or Memcached once workers run on several hosts.
+# core/checks.py refuses per-process backends there.
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    },
+    "shared": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": BASE_DIR / "cache",
+    },
+}
+
 
 # Password validation
 # https://docs.djangoproject.com/en/6.0/ref/settings/#auth-password-validators
@@ -107,6 +154,17 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# New passwords use the PASSWORD_HASHING_PROFILE hasher; the others verify
+# hashes made under earlier profiles until login rehashes them
+# (core/hashers.py)
+
+PASSWORD_HASHERS = list(dict.fromkeys([
+    PASSWORD_HASHING_PROFILES[PASSWORD_HASHING_PROFILE],
+    *PASSWORD_HASHING_PROFILES.values(),
+    "core.hashers.BoundedPBKDF2SHA1PasswordHasher",
+]))
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/6.0/topics/i18n/
 
@@ -125,9 +183,14 @@ USE_TZ = True
 STATIC_URL = "static/"
 
 REST_FRAMEWORK = {
+    "DEFAULT_AUTHENTICATION_CLASSES": [
+        "core.authentication.SignedTokenAuthentication",
+        "core.authentication.CachedSessionAuthentication",
+        "rest_framework.authentication.BasicAuthentication",
+    ],
     "DEFAULT_THROTTLE_CLASSES": [
-        "rest_framework.throttling.AnonRateThrottle",
-        "rest_framework.throttling.UserRateThrottle",
+        "core.throttles.AnonRateThrottle",
+        "core.throttles.UserRateThrottle",
     ],
     "DEFAULT_THROTTLE_RATES": {
         "anon": "2/min",     # unauthenticated (IP-based)
@@ -141,5 +204,8 @@ REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"].update({
     "signup": SIGNUP_RATE,
     "login": LOGIN_RATE,
     "task_create": TASK_CREATE_RATE,
+    "task_bulk_create": TASK_BULK_CREATE_RATE,
     "task_list": TASK_LIST_RATE,
+    "task_export": TASK_EXPORT_RATE,
+    "task_search": TASK_SEARCH_RATE,
 })